@@ -0,0 +1,137 @@
+"""
+Measures cold import time of every Lambda handler with `python -X importtime`.
+
+Each handler is imported in a fresh interpreter several times, the median of the
+handler's cumulative import time is compared with its budget from
+import_time_budget.json. Exits with status 1 when any handler is over budget.
+
+Usage: python buildscripts/import_time_report.py [--runs 5] [--top 5] [lambda ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+LAMBDAS_DIR = ROOT_DIR / "src" / "lambdas"
+BUDGET_FILE = Path(__file__).resolve().parent / "import_time_budget.json"
+
+# handlers read configuration at import time
+IMPORT_ENV = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "REGION": "us-east-1",
+    "TABLE_NAME": "import-time",
+    "SERVICE_NAME": "import-time",
+}
+
+
+@dataclass
+class ImportProfile:
+    total_us: int
+    packages_us: dict[str, int] = field(default_factory=dict)
+
+
+def parse_importtime(stderr: str, module: str) -> ImportProfile:
+    """
+    Parses `-X importtime` output into the handler's cumulative time and self
+    time per top level package, lines look like:
+    import time:       self [us] |  cumulative | imported package
+    """
+    total_us = 0
+    packages_us: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        name = name.strip()
+        if name == module:
+            total_us = int(cumulative_us)
+        # self times are additive, grouped by top level package
+        package = name.split(".")[0]
+        packages_us[package] = packages_us.get(package, 0) + int(self_us)
+    return ImportProfile(total_us=total_us, packages_us=packages_us)
+
+
+def profile_handler(name: str) -> ImportProfile:
+    module = f"lambdas.{name}.handler"
+    env = {
+        **os.environ,
+        **IMPORT_ENV,
+        "PYTHONPATH": str(ROOT_DIR / "src"),
+        "PYTHONDONTWRITEBYTECODE": "",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr, module)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("lambdas", nargs="*", help="Lambdas to profile, default all")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print JSON report")
+    args = parser.parse_args()
+
+    budget: dict[str, float] = json.loads(BUDGET_FILE.read_text())
+    names = args.lambdas or sorted(
+        path.parent.name for path in LAMBDAS_DIR.glob("*/handler.py")
+    )
+
+    report = {}
+    for name in names:
+        profiles = [profile_handler(name) for _ in range(args.runs)]
+        total_ms = statistics.median(p.total_us for p in profiles) / 1000
+        packages = {
+            package: statistics.median(p.packages_us.get(package, 0) for p in profiles)
+            / 1000
+            for package in profiles[0].packages_us
+        }
+        top = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        report[name] = {
+            "total_ms": round(total_ms, 1),
+            "budget_ms": budget.get(name),
+            "top_imports_ms": {k: round(v, 1) for k, v in top[: args.top]},
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, entry in report.items():
+            status = (
+                "OVER"
+                if entry["budget_ms"] and entry["total_ms"] > entry["budget_ms"]
+                else "ok"
+            )
+            print(
+                f"{name:<28} {entry['total_ms']:>8.1f} ms  "
+                f"budget {entry['budget_ms'] or '-':>6}  {status}"
+            )
+            for package, ms in entry["top_imports_ms"].items():
+                print(f"    {package:<36} {ms:>8.1f} ms")
+
+    over_budget = [
+        name
+        for name, entry in report.items()
+        if entry["budget_ms"] and entry["total_ms"] > entry["budget_ms"]
+    ]
+    if over_budget:
+        print(f"Import time over budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
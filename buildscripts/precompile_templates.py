@@ -0,0 +1,44 @@
+"""
+Compiles the reporter's Jinja2 templates into Python modules.
+
+The modules are loaded by jinja2.ModuleLoader, so the Lambda renders reports
+without parsing and compiling the templates on cold start. They are compiled
+with the reporter's own environment settings (autoescaping) and must be built
+with the jinja2 version of the Lambda layer.
+
+Usage: PYTHONPATH=src python buildscripts/precompile_templates.py [--target DIR]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from lambdas.reporter.services.template_environment import (
+    TemplateEnvironmentConstants,
+    create_environment,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--target",
+        type=Path,
+        default=TemplateEnvironmentConstants.COMPILED_TEMPLATES_DIR,
+        help="Directory the compiled modules are written to",
+    )
+    args = parser.parse_args()
+
+    environment = create_environment(
+        compiled_templates_dir=None, bytecode_cache_dir=None
+    )
+    args.target.mkdir(parents=True, exist_ok=True)
+    environment.compile_templates(str(args.target), zip=None, ignore_errors=False)
+
+    compiled = sorted(path.name for path in args.target.glob("*.py"))
+    print(f"Compiled {len(compiled)} templates to {args.target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Compares report rendering strategies of the reporter Lambda.
+
+compile_per_call reads and compiles the template for every report, cached
+renders with the shared environment, precompiled loads templates compiled at
+build time into a fresh environment (cold start).
+
+Usage: PYTHONPATH=src python buildscripts/report_render_benchmark.py [--runs 200]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import jinja2
+
+from lambdas.reporter.services.template_environment import (
+    TemplateEnvironmentConstants,
+    create_environment,
+)
+
+RECORD = {
+    "Id": "benchmark",
+    "Status": "success",
+    "WorkloadVersion": "5.0.1",
+    "DeploymentId": "deployment",
+    "DataPortalUrl": "https://data-portal.example.com",
+    "SubscriptionTestReportUrl": "https://reports.example.com/subscription",
+    "VerificationTestReportUrl": "https://reports.example.com/verification",
+    "TeardownTestReportUrl": "https://reports.example.com/teardown",
+    "FailureReason": None,
+    "failure_reason": None,
+    "CreatedAt": "2025-12-19T12:00:00+00:00",
+    "UpdatedAt": "2025-12-19T13:00:00+00:00",
+    "duration": "1Hours 0minutes",
+    "DeployedServices": {f"service-{i}": f"{i:040x}" for i in range(40)},
+}
+
+
+def measure(render: Callable[[], str], runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    template_path = (
+        TemplateEnvironmentConstants.TEMPLATES_DIR
+        / TemplateEnvironmentConstants.REPORT_TEMPLATE
+    )
+
+    def compile_per_call() -> str:
+        source = template_path.read_text(encoding="utf-8")
+        return jinja2.Template(source, autoescape=True).render(RECORD)
+
+    cached_environment = create_environment(
+        compiled_templates_dir=None, bytecode_cache_dir=None
+    )
+
+    def cached() -> str:
+        template = cached_environment.get_template(
+            TemplateEnvironmentConstants.REPORT_TEMPLATE
+        )
+        return template.render(RECORD)
+
+    with tempfile.TemporaryDirectory() as compiled_dir:
+        cached_environment.compile_templates(compiled_dir, zip=None)
+
+        def precompiled() -> str:
+            environment = create_environment(
+                compiled_templates_dir=Path(compiled_dir), bytecode_cache_dir=None
+            )
+            template = environment.get_template(
+                TemplateEnvironmentConstants.REPORT_TEMPLATE
+            )
+            return template.render(RECORD)
+
+        strategies = {
+            "compile_per_call": compile_per_call,
+            "cached": cached,
+            "precompiled_cold": precompiled,
+        }
+        # every strategy must produce the same report
+        reports = {name: render() for name, render in strategies.items()}
+        if len(set(reports.values())) != 1:
+            print("Strategies rendered different reports", file=sys.stderr)
+            return 1
+
+        for name, render in strategies.items():
+            timings = measure(render, args.runs)
+            print(
+                f"{name:<18} median {statistics.median(timings):>8.3f} ms  "
+                f"p95 {statistics.quantiles(timings, n=20)[-1]:>8.3f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
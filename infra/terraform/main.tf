@@ -63,6 +63,18 @@ module "environment_setup" {
   python_version             = local.python_version
 }
 
+module "pipeline_event_handler" {
+  source             = "./modules/pipeline_event_handler"
+  tags               = local.tags
+  resource_prefix    = local.resource_prefix
+  module_name        = "pipeline-event-handler"
+  aws_region         = var.aws_region
+  lambda_layer_arn   = module.lambda_layer.layer_version_arn
+  python_version     = local.python_version
+  lambda_memory_size = var.lambda_memory_size
+  webhook_secret     = var.pipeline_webhook_secret
+}
+
 module "test_execution_orchestrator" {
   source                       = "./modules/test_execution_orchestrator"
   tags                         = local.tags
@@ -105,8 +117,23 @@ module "test_reports" {
   lambda_timeout               = var.approval_lambda_timeout
   python_version               = local.python_version
   lambda_memory_size           = var.lambda_memory_size
-  execution_record_lambda_name = module.test_execution_db.terh_lambda_function_name
-  execution_record_lambda_arn  = module.test_execution_db.terh_lambda_function_arn
+  execution_record_table_name  = module.test_execution_db.table_name
+  execution_record_table_arn   = module.test_execution_db.table_arn
+  record_retention_days        = module.test_execution_db.record_retention_days
+}
+
+module "execution_record_archiver" {
+  source             = "./modules/execution_record_archiver"
+  tags               = local.tags
+  resource_prefix    = local.resource_prefix
+  module_name        = "execution-record-archiver"
+  aws_region         = var.aws_region
+  lambda_layer_arn   = module.lambda_layer.layer_version_arn
+  python_version     = local.python_version
+  lambda_memory_size = var.lambda_memory_size
+  table_stream_arn   = module.test_execution_db.table_stream_arn
+  bucket_name        = module.test_reports.bucket_name
+  bucket_arn         = module.test_reports.report_bucket_arn
 }
 
 module "config_composer" {
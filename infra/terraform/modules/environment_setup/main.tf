@@ -43,9 +43,10 @@ module "deployment_checker_lambda_function" {
   ]
 
   environment_variables = {
-    LOG_LEVEL       = "INFO"
-    REQUEST_TIMEOUT = "30"
-    BITBUCKET_TOKEN = var.bitbucket_token
+    LOG_LEVEL         = "INFO"
+    REQUEST_TIMEOUT   = "30"
+    MAX_POLL_DURATION = "0"
+    BITBUCKET_TOKEN   = var.bitbucket_token
   }
 
   tags        = local.merged_tags
@@ -0,0 +1,41 @@
+data "aws_iam_policy_document" "execution_record_archiver_access" {
+  statement {
+    effect = "Allow"
+    actions = [
+      "dynamodb:DescribeStream",
+      "dynamodb:GetRecords",
+      "dynamodb:GetShardIterator",
+      "dynamodb:ListStreams"
+    ]
+    resources = [
+      var.table_stream_arn
+    ]
+  }
+
+  statement {
+    effect = "Allow"
+    actions = [
+      "s3:PutObject"
+    ]
+    resources = [
+      "${var.bucket_arn}/${local.archive_prefix}/*"
+    ]
+  }
+
+  statement {
+    effect = "Allow"
+    actions = [
+      "sqs:SendMessage"
+    ]
+    resources = [
+      aws_sqs_queue.execution_record_archiver_failures.arn
+    ]
+  }
+}
+
+resource "aws_iam_policy" "execution_record_archiver_policy" {
+  name        = "${var.resource_prefix}-execution-record-archiver-policy"
+  description = "Allows execution record archiver to read the table stream, write archives to S3 and record failed batches"
+  policy      = data.aws_iam_policy_document.execution_record_archiver_access.json
+  tags        = local.merged_tags
+}
@@ -0,0 +1,5 @@
+locals {
+  execution_record_archiver_function_name = "execution-record-archiver"
+  merged_tags                             = merge(var.tags, { Module = var.module_name })
+  archive_prefix                          = "execution_records_archive"
+}
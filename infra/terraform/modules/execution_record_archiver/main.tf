@@ -0,0 +1,74 @@
+/* Execution Record Archiver Lambda */
+
+module "execution_record_archiver_lambda_function" {
+  source = "../lambda_function"
+
+  function_name     = local.execution_record_archiver_function_name
+  lambda_source_dir = "${path.module}/../../../../src/lambdas/execution_record_archiver"
+  handler           = "lambdas.execution_record_archiver.handler.lambda_handler"
+  aws_region        = var.aws_region
+  resource_prefix   = var.resource_prefix
+
+  python_version = var.python_version
+  timeout        = var.lambda_timeout
+  memory_size    = var.lambda_memory_size
+
+  lambda_layers = [
+    var.lambda_layer_arn
+  ]
+
+  extra_policy_arns = [
+    aws_iam_policy.execution_record_archiver_policy.arn
+  ]
+
+  environment_variables = {
+    LOG_LEVEL           = "INFO"
+    REGION              = var.aws_region
+    ARCHIVE_BUCKET_NAME = var.bucket_name
+    ARCHIVE_PREFIX      = local.archive_prefix
+  }
+
+  tags        = local.merged_tags
+  module_name = var.module_name
+}
+
+# Only deletions made by DynamoDB TTL are delivered, records removed
+# by users are not archived
+resource "aws_lambda_event_source_mapping" "execution_record_stream" {
+  event_source_arn                   = var.table_stream_arn
+  function_name                      = module.execution_record_archiver_lambda_function.function_arn
+  starting_position                  = "TRIM_HORIZON"
+  batch_size                         = var.batch_size
+  maximum_batching_window_in_seconds = 60
+  maximum_retry_attempts             = 10
+  bisect_batch_on_function_error     = true
+  function_response_types            = ["ReportBatchItemFailures"]
+
+  # batches failing every retry are recorded instead of silently dropped, the
+  # message holds the shard and sequence number range to replay from the
+  # stream while it retains the records (24 hours)
+  destination_config {
+    on_failure {
+      destination_arn = aws_sqs_queue.execution_record_archiver_failures.arn
+    }
+  }
+
+  filter_criteria {
+    filter {
+      pattern = jsonencode({
+        eventName = ["REMOVE"]
+        userIdentity = {
+          type        = ["Service"]
+          principalId = ["dynamodb.amazonaws.com"]
+        }
+      })
+    }
+  }
+}
+
+resource "aws_sqs_queue" "execution_record_archiver_failures" {
+  name                      = "${var.resource_prefix}-execution-record-archiver-failures"
+  message_retention_seconds = 1209600 # 14 days, the maximum
+  sqs_managed_sse_enabled   = true
+  tags                      = local.merged_tags
+}
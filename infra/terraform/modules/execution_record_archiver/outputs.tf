@@ -0,0 +1,19 @@
+output "lambda_function_name" {
+  description = "Name of the execution record archiver Lambda function."
+  value       = module.execution_record_archiver_lambda_function.function_name
+}
+
+output "lambda_function_arn" {
+  description = "ARN of the execution record archiver Lambda function."
+  value       = module.execution_record_archiver_lambda_function.function_arn
+}
+
+output "archive_prefix" {
+  description = "S3 key prefix of the execution record archives."
+  value       = local.archive_prefix
+}
+
+output "failure_queue_url" {
+  description = "URL of the SQS queue receiving stream batches that could not be archived."
+  value       = aws_sqs_queue.execution_record_archiver_failures.url
+}
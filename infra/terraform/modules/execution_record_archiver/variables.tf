@@ -0,0 +1,62 @@
+variable "tags" {
+  type        = map(string)
+  description = "Tags to apply to resources"
+}
+
+variable "resource_prefix" {
+  type        = string
+  description = "Prefix to apply to resource names"
+}
+
+variable "module_name" {
+  type        = string
+  description = "Name of the module"
+}
+
+variable "lambda_timeout" {
+  description = "Lambda function timeout in seconds"
+  default     = 60
+  type        = number
+}
+
+variable "lambda_memory_size" {
+  description = "Lambda function memory size in MB"
+  default     = 256
+  type        = number
+}
+
+variable "aws_region" {
+  type        = string
+  description = "AWS region to deploy resources in"
+}
+
+variable "lambda_layer_arn" {
+  type        = string
+  description = "ARN of the Lambda layer to use"
+}
+
+variable "python_version" {
+  type        = string
+  description = "Python version"
+}
+
+variable "table_stream_arn" {
+  type        = string
+  description = "Stream ARN of the execution records table"
+}
+
+variable "bucket_name" {
+  type        = string
+  description = "Name of the bucket archives are written to"
+}
+
+variable "bucket_arn" {
+  type        = string
+  description = "ARN of the bucket archives are written to"
+}
+
+variable "batch_size" {
+  description = "Maximum number of stream records per archive object"
+  default     = 1000
+  type        = number
+}
@@ -18,7 +18,7 @@ echo -e "${YELLOW}Building Lambda layer...${NC}"
 echo -e "${GREEN}✓ Lambda layer build completed.${NC}"
 
 # Define Lambda Functions
-LAMBDA_FUNCTIONS=(approval_handler commit_collector execution_record_handler reporter config_composer deployment_checker setup_trigger execution_params_validator dp_password_rotator deployment_data_extractor)
+LAMBDA_FUNCTIONS=(approval_handler commit_collector execution_record_handler reporter config_composer deployment_checker setup_trigger execution_params_validator dp_password_rotator deployment_data_extractor pipeline_event_handler execution_record_archiver)
 
 # Build Lambda Functions
 for fn in "${LAMBDA_FUNCTIONS[@]}"; do
@@ -54,6 +54,13 @@ fi
 # Copy the Lambda function code
 cp -r "$LAMBDA_SOURCE"/* "$BUILD_DIR/lambdas/$LAMBDA_NAME/"
 
+# Precompile Jinja2 templates, loaded instead of the template sources at runtime
+if [ -d "$LAMBDA_SOURCE/templates" ] && [ -f "$LAMBDA_SOURCE/services/template_environment.py" ]; then
+    echo -e "${YELLOW}Precompiling templates...${NC}"
+    PYTHONPATH="$PROJECT_ROOT/src" python3 "$PROJECT_ROOT/buildscripts/precompile_templates.py" \
+        --target "$BUILD_DIR/lambdas/$LAMBDA_NAME/compiled_templates"
+fi
+
 # Remove unnecessary files
 echo -e "${YELLOW}Cleaning up Lambda files...${NC}"
 find "$BUILD_DIR/lambdas" -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
@@ -0,0 +1,28 @@
+data "aws_iam_policy_document" "pipeline_event_handler_access" {
+  statement {
+    effect = "Allow"
+    actions = [
+      "dynamodb:UpdateItem",
+      "dynamodb:GetItem"
+    ]
+    resources = [
+      aws_dynamodb_table.pipeline_state.arn
+    ]
+  }
+
+  statement {
+    effect = "Allow"
+    actions = [
+      "states:SendTaskSuccess",
+      "states:SendTaskFailure"
+    ]
+    resources = ["*"]
+  }
+}
+
+resource "aws_iam_policy" "pipeline_event_handler_policy" {
+  name        = "${var.resource_prefix}-pipeline-event-handler-policy"
+  description = "Allows pipeline event handler to store pipeline states and resume waiting executions"
+  policy      = data.aws_iam_policy_document.pipeline_event_handler_access.json
+  tags        = local.merged_tags
+}
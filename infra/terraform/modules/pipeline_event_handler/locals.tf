@@ -0,0 +1,6 @@
+locals {
+  pipeline_event_handler_function_name = "pipeline-event-handler"
+  merged_tags                          = merge(var.tags, { Module = var.module_name })
+  table_name                           = "${var.resource_prefix}-pipeline-states"
+  hash_key_name                        = "PipelineUuid"
+}
@@ -0,0 +1,67 @@
+/* DynamoDB Table for terminal Bitbucket pipeline states */
+
+resource "aws_dynamodb_table" "pipeline_state" {
+  name         = local.table_name
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = local.hash_key_name
+
+  server_side_encryption {
+    enabled = true
+  }
+
+  attribute {
+    name = local.hash_key_name
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "ExpiresAt"
+    enabled        = true
+  }
+
+  deletion_protection_enabled = false
+
+  tags = local.merged_tags
+}
+
+
+/* Pipeline Event Handler Lambda */
+
+module "pipeline_event_handler_lambda_function" {
+  source = "../lambda_function"
+
+  function_name     = local.pipeline_event_handler_function_name
+  lambda_source_dir = "${path.module}/../../../../src/lambdas/pipeline_event_handler"
+  handler           = "lambdas.pipeline_event_handler.handler.lambda_handler"
+  aws_region        = var.aws_region
+  resource_prefix   = var.resource_prefix
+
+  python_version = var.python_version
+  timeout        = var.lambda_timeout
+  memory_size    = var.lambda_memory_size
+
+  lambda_layers = [
+    var.lambda_layer_arn
+  ]
+
+  extra_policy_arns = [
+    aws_iam_policy.pipeline_event_handler_policy.arn
+  ]
+
+  environment_variables = {
+    LOG_LEVEL      = "INFO"
+    REGION         = var.aws_region
+    TABLE_NAME     = local.table_name
+    WEBHOOK_SECRET = var.webhook_secret
+  }
+
+  tags        = local.merged_tags
+  module_name = var.module_name
+}
+
+# Bitbucket webhooks cannot sign AWS requests, payloads are authenticated
+# by the handler using the webhook secret
+resource "aws_lambda_function_url" "pipeline_event_handler" {
+  function_name      = module.pipeline_event_handler_lambda_function.function_name
+  authorization_type = "NONE"
+}
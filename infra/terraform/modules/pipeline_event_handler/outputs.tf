@@ -0,0 +1,24 @@
+output "table_name" {
+  description = "Name of the DynamoDB table for pipeline states."
+  value       = aws_dynamodb_table.pipeline_state.name
+}
+
+output "table_arn" {
+  description = "ARN of the DynamoDB table for pipeline states."
+  value       = aws_dynamodb_table.pipeline_state.arn
+}
+
+output "lambda_function_name" {
+  description = "Name of the pipeline event handler Lambda function."
+  value       = module.pipeline_event_handler_lambda_function.function_name
+}
+
+output "lambda_function_arn" {
+  description = "ARN of the pipeline event handler Lambda function."
+  value       = module.pipeline_event_handler_lambda_function.function_arn
+}
+
+output "webhook_url" {
+  description = "Function URL to configure as Bitbucket pipeline webhook."
+  value       = aws_lambda_function_url.pipeline_event_handler.function_url
+}
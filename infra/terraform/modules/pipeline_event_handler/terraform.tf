@@ -0,0 +1,9 @@
+terraform {
+  required_version = ">= 1.13"
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.92"
+    }
+  }
+}
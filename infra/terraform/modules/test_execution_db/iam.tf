@@ -5,7 +5,9 @@ data "aws_iam_policy_document" "e2e_dynamodb_access" {
       "dynamodb:PutItem",
       "dynamodb:UpdateItem",
       "dynamodb:GetItem",
-      "dynamodb:Query"
+      "dynamodb:Query",
+      "dynamodb:BatchWriteItem",
+      "dynamodb:BatchGetItem"
     ]
     resources = [
       aws_dynamodb_table.e2e_execution_record.arn,
@@ -24,6 +24,15 @@ resource "aws_dynamodb_table" "e2e_execution_record" {
     type = "S"
   }
 
+  # expired records are archived to S3 from the stream
+  ttl {
+    attribute_name = "ExpiresAt"
+    enabled        = true
+  }
+
+  stream_enabled   = true
+  stream_view_type = "OLD_IMAGE"
+
   global_secondary_index {
     name            = local.secondary_index_name
     hash_key        = "Status"
@@ -65,12 +74,13 @@ module "test_execution_record_handler_lambda_function" {
   ]
 
   environment_variables = {
-    LOG_LEVEL            = "INFO"
-    REQUEST_TIMEOUT      = "20.0"
-    REGION               = var.aws_region
-    TABLE_NAME           = local.table_name
-    HASH_KEY_NAME        = local.hash_key_name
-    SECONDARY_INDEX_NAME = local.secondary_index_name
+    LOG_LEVEL             = "INFO"
+    REQUEST_TIMEOUT       = "20.0"
+    REGION                = var.aws_region
+    TABLE_NAME            = local.table_name
+    HASH_KEY_NAME         = local.hash_key_name
+    SECONDARY_INDEX_NAME  = local.secondary_index_name
+    RECORD_RETENTION_DAYS = tostring(var.record_retention_days)
   }
 
   tags        = local.merged_tags
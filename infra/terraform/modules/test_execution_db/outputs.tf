@@ -37,3 +37,8 @@ output "terh_lambda_function_role_arn" {
   description = "IAM Role ARN for the test execution record handler Lambda function."
   value       = module.test_execution_record_handler_lambda_function.role_arn
 }
+
+output "record_retention_days" {
+  description = "Days after the last update an execution record expires, writers of records set the same expiry."
+  value       = var.record_retention_days
+}
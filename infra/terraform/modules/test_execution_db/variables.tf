@@ -39,3 +39,9 @@ variable "python_version" {
   type        = string
   description = "Python version"
 }
+
+variable "record_retention_days" {
+  description = "Days after the last update an execution record expires and is archived"
+  default     = 180
+  type        = number
+}
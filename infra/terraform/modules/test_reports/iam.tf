@@ -89,22 +89,22 @@ resource "aws_sns_topic_policy" "report_policy" {
   })
 }
 
-data "aws_iam_policy_document" "invoke_record_lambda" {
+data "aws_iam_policy_document" "execution_record_access" {
   statement {
     effect = "Allow"
     actions = [
-      "lambda:InvokeFunction"
+      "dynamodb:GetItem",
+      "dynamodb:UpdateItem"
     ]
     resources = [
-      var.execution_record_lambda_arn,
-      "${var.execution_record_lambda_arn}:*",
+      var.execution_record_table_arn
     ]
   }
 }
 
-resource "aws_iam_policy" "execute_record_lambda" {
-  name        = "${var.resource_prefix}-invoke_record_lambda-policy"
-  description = "Allows read/write access to the E2EExecutionRecord table"
-  policy      = data.aws_iam_policy_document.invoke_record_lambda.json
+resource "aws_iam_policy" "execution_record_access" {
+  name        = "${var.resource_prefix}-reporter-execution-record-policy"
+  description = "Allows the reporter to read execution records and set their final report status"
+  policy      = data.aws_iam_policy_document.execution_record_access.json
   tags        = local.merged_tags
 }
@@ -101,15 +101,18 @@ module "lambda_reporter" {
 
   extra_policy_arns = [
     aws_iam_policy.e2e_s3_policy.arn,
-    aws_iam_policy.execute_record_lambda.arn,
+    aws_iam_policy.execution_record_access.arn,
   ]
 
   environment_variables = {
-    LOG_LEVEL                    = "INFO"
-    REQUEST_TIMEOUT              = "140"
-    E2E_FINAL_REPORT_TOPIC_ARN   = aws_sns_topic.report_topic.arn
-    EXECUTION_RECORD_LAMBDA_NAME = var.execution_record_lambda_name
-    S3_REPORT_BUCKET             = aws_s3_bucket.e2e_reports.id
+    LOG_LEVEL                  = "INFO"
+    REQUEST_TIMEOUT            = "140"
+    E2E_FINAL_REPORT_TOPIC_ARN = aws_sns_topic.report_topic.arn
+    REGION                     = var.aws_region
+    TABLE_NAME                 = var.execution_record_table_name
+    S3_REPORT_BUCKET           = aws_s3_bucket.e2e_reports.id
+    REPORT_FORMATS             = "json,markdown,junit"
+    RECORD_RETENTION_DAYS      = tostring(var.record_retention_days)
   }
 
   tags        = local.merged_tags
@@ -38,12 +38,17 @@ variable "python_version" {
   description = "Python version"
 }
 
-variable "execution_record_lambda_name" {
+variable "execution_record_table_name" {
   type        = string
-  description = "Execution record (update dynamoDB record) lambda name"
+  description = "Name of the execution records DynamoDB table"
 }
 
-variable "execution_record_lambda_arn" {
+variable "execution_record_table_arn" {
   type        = string
-  description = "Execution record (update dynamoDB record) lambda arn"
+  description = "ARN of the execution records DynamoDB table"
+}
+
+variable "record_retention_days" {
+  type        = number
+  description = "Days after the last update an execution record expires, must match the execution records table"
 }
@@ -53,6 +53,12 @@ variable "bitbucket_token" {
   sensitive   = true
 }
 
+variable "pipeline_webhook_secret" {
+  description = "Secret configured on the Bitbucket pipeline webhook"
+  type        = string
+  sensitive   = true
+}
+
 variable "deployment_environment_code" {
   type        = string
   description = "Code representing the deployment environment"
@@ -1,4 +1,3 @@
-import asyncio
 import os
 from typing import Any
 
@@ -8,6 +7,7 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from pydantic import ValidationError
 
 from shared.bitbucket.bitbucket_client import BitbucketClient, BitbucketClientConfig
+from shared.bitbucket.client_pool import get_client_pool
 from shared.bitbucket.errors import (
     ArtifactFileError,
     InvalidResponseError,
@@ -17,12 +17,15 @@ from shared.bitbucket.errors import (
     PipelineTriggerError,
 )
 from shared.bitbucket.get_token_from_envs import get_token_from_envs
+from shared.bitbucket.poller import Deadline
+from shared.bitbucket.rate_limiter import get_request_scheduler
 from shared.domain.type import (
     OSDUVersion,
 )
+from shared.http_cache import get_http_cache
 from shared.utils import create_error_response, create_response
 
-from .models.params import RequestParams
+from .models.params import BatchRequestParams, RequestParams
 from .services.commit_collector import CommitCollector
 
 # Configuration constants
@@ -30,21 +33,99 @@ REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT", "140"))
 
 logger = Logger(service="commit_collector")
 
+client_pool = get_client_pool(timeout=REQUEST_TIMEOUT)
+request_scheduler = get_request_scheduler()
+# Optional DynamoDB table sharing cached Bitbucket responses between Lambdas
+http_cache = get_http_cache(os.environ.get("HTTP_CACHE_TABLE"))
+
 
 async def _collect_hashes(
-    token: str, bb_env_name: str, osdu: OSDUVersion
+    token: str, bb_env_name: str, osdu: OSDUVersion, deadline: Deadline
 ) -> dict[str, str]:
     """Collect commit hashes from Bitbucket pipeline"""
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        bitbucket_config = BitbucketClientConfig(token)
-        bitbucket_client = BitbucketClient(client=client, config=bitbucket_config)
-        commit_collector = CommitCollector(bitbucket_client=bitbucket_client)
-        return await commit_collector.get_commits(bb_env_name=bb_env_name, osdu=osdu)
+    bitbucket_config = BitbucketClientConfig(token)
+    bitbucket_client = BitbucketClient(
+        client=client_pool.get_client(),
+        config=bitbucket_config,
+        cache=http_cache,
+        scheduler=request_scheduler,
+    )
+    commit_collector = CommitCollector(bitbucket_client=bitbucket_client)
+    return await commit_collector.get_commits(
+        bb_env_name=bb_env_name, osdu=osdu, deadline=deadline
+    )
+
+
+async def _collect_batch_hashes(
+    token: str, params: BatchRequestParams, deadline: Deadline
+) -> tuple[dict[str, dict[str, str]], dict[str, dict[str, str]]]:
+    """Collect commit hashes for several environments concurrently"""
+    bitbucket_config = BitbucketClientConfig(token)
+    bitbucket_client = BitbucketClient(
+        client=client_pool.get_client(),
+        config=bitbucket_config,
+        cache=http_cache,
+        scheduler=request_scheduler,
+    )
+    commit_collector = CommitCollector(bitbucket_client=bitbucket_client)
+    return await commit_collector.get_commits_batch(
+        targets=params.targets,
+        max_concurrency=params.max_concurrency,
+        deadline=deadline,
+    )
+
+
+def _handle_batch(event: dict, token: str, context: LambdaContext) -> dict[str, Any]:
+    """
+    Collects commits for all targets, the response maps each
+    `<bb_env_name>/<osdu_version>` to its commits or error.
+    """
+    try:
+        data = BatchRequestParams.model_validate(event)
+    except ValidationError as e:
+        logger.error(f"Batch request validation failed: {e}")
+        error_details = "; ".join(
+            [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
+        )
+        return create_error_response(
+            400, f"Invalid request parameters: {error_details}", "ValidationError"
+        )
+
+    try:
+        logger.info(
+            f"Starting batch commit collection for {[t.target_key for t in data.targets]}"
+        )
+        deadline = Deadline.from_context(context)
+        request_scheduler.set_deadline(deadline)
+        results, errors = client_pool.run(
+            _collect_batch_hashes(token=token, params=data, deadline=deadline)
+        )
+        logger.info("Bitbucket HTTP cache stats", extra=http_cache.stats.as_dict())
+        logger.info(
+            "Bitbucket request scheduler stats", extra=request_scheduler.stats.as_dict()
+        )
+    except Exception as e:
+        logger.exception(f"Unexpected error in batch commit collection: {e}")
+        return create_error_response(
+            500, "An unexpected error occurred", "InternalError"
+        )
+
+    logger.info(
+        f"Batch commit collection finished, succeeded: {list(results)}, failed: {list(errors)}"
+    )
+    if not results:
+        return create_error_response(
+            502,
+            f"Commit collection failed for all targets: {errors}",
+            "BatchCollectionError",
+        )
+    return create_response(200, {"results": results, "errors": errors})
 
 
 def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
     """
     Lambda handler for collecting commits from Bitbucket pipeline
+    Accepts a single target or a batch of them under `targets`
     Requires BITBUCKET_TOKEN env
     """
     # Get and validate token
@@ -54,6 +135,9 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
         logger.error(f"Token validation failed: {e}")
         return create_error_response(500, str(e), "ConfigurationError")
 
+    if "targets" in event:
+        return _handle_batch(event, token, context)
+
     # Validate request parameters
     try:
         data = RequestParams.model_validate(event)
@@ -75,8 +159,19 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
         logger.info(
             f"Starting commit collection for env={bb_env_name}, osdu={osdu_version.value}"
         )
-        commits_data = asyncio.run(
-            _collect_hashes(token=token, bb_env_name=bb_env_name, osdu=osdu_version)
+        deadline = Deadline.from_context(context)
+        request_scheduler.set_deadline(deadline)
+        commits_data = client_pool.run(
+            _collect_hashes(
+                token=token,
+                bb_env_name=bb_env_name,
+                osdu=osdu_version,
+                deadline=deadline,
+            )
+        )
+        logger.info("Bitbucket HTTP cache stats", extra=http_cache.stats.as_dict())
+        logger.info(
+            "Bitbucket request scheduler stats", extra=request_scheduler.stats.as_dict()
         )
         logger.info(
             f"Successfully collected commits for env={bb_env_name}, osdu={osdu_version.value}"
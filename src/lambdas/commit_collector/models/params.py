@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from shared.domain.type import OSDUVersion
 
@@ -8,3 +8,13 @@ class RequestParams(BaseModel):
     osdu_version: OSDUVersion
     bb_env_code: str
     bb_env_name: str
+
+    @property
+    def target_key(self) -> str:
+        """Identifies target in batch results"""
+        return f"{self.bb_env_name}/{self.osdu_version.value}"
+
+
+class BatchRequestParams(BaseModel):
+    targets: list[RequestParams] = Field(min_length=1)
+    max_concurrency: int = Field(default=5, ge=1, le=10)
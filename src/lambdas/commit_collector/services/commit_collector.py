@@ -11,9 +11,12 @@ from shared.bitbucket.errors import (
     PipelineTimeoutError,
     PipelineTriggerError,
 )
+from shared.bitbucket.poller import BackoffPolicy, Deadline, PipelinePoller
 from shared.bitbucket.type import BitbucketPipelineStatus
 from shared.domain.type import OSDUVersion
 
+from ..models.params import RequestParams
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,8 +24,7 @@ class CommitCollectorConstants:
     """Configuration constants for CommitCollector"""
 
     # Timing configuration
-    POLL_WAIT_TIME = 10  # seconds between status checks
-    MAX_POLL_ATTEMPTS = 12  # maximum number of status check attempts
+    MAX_WAIT_TIME = 120  # seconds to wait when no deadline is given
 
 
 class CommitCollector:
@@ -32,13 +34,15 @@ class CommitCollector:
         self,
         bitbucket_client: BitbucketClient,
         repo_slug: str = "dataops-deployment",
-        poll_wait_time: int = CommitCollectorConstants.POLL_WAIT_TIME,
-        max_poll_attempts: int = CommitCollectorConstants.MAX_POLL_ATTEMPTS,
+        backoff: BackoffPolicy | None = None,
+        max_wait_time: float = CommitCollectorConstants.MAX_WAIT_TIME,
     ) -> None:
         self._bitbucket_client = bitbucket_client
-        self._poll_wait_time = poll_wait_time
-        self._max_poll_attempts = max_poll_attempts
+        self._max_wait_time = max_wait_time
         self._repo_slug = repo_slug
+        self._poller = PipelinePoller(
+            bitbucket_client=bitbucket_client, repo_slug=repo_slug, backoff=backoff
+        )
 
     async def trigger_commit_collection(
         self, bb_env_name: str, osdu: OSDUVersion
@@ -59,48 +63,32 @@ class CommitCollector:
             request_body=body,
         )
 
-    async def wait_for_completion(self, pipeline_uuid: str) -> None:
+    async def wait_for_completion(
+        self, pipeline_uuid: str, deadline: Deadline | None = None
+    ) -> None:
         """
-        Waits for pipeline completion by polling status at regular intervals.
+        Waits for pipeline completion by polling status with exponential backoff.
         """
-        wait_time = self._poll_wait_time
-        max_attempts = self._max_poll_attempts
-        current_attempt = 1
-        status = "INIT"
+        deadline = deadline or Deadline(self._max_wait_time)
 
         logger.info(f"Waiting for pipeline {pipeline_uuid} to complete...")
+        result = await self._poller.wait(pipeline_uuid, deadline=deadline)
 
-        while current_attempt <= max_attempts:
-            response = await self._bitbucket_client.check_pipeline_status(
-                repo_slug=self._repo_slug, execution_uuid=pipeline_uuid
-            )
-            logger.debug(
-                f"Pipeline status response (attempt {current_attempt}/{max_attempts}): {response}"
-            )
-            status = response["state"]["name"]
-            status = BitbucketPipelineStatus[status].value
-
-            if status == BitbucketPipelineStatus.COMPLETED.value:
-                logger.info(f"Pipeline {pipeline_uuid} completed successfully")
-                break
-            elif status == BitbucketPipelineStatus.FAILED.value:
-                error_msg = f"Pipeline {pipeline_uuid} failed with status: {response.get('state', {})}"
-                logger.error(error_msg)
-                raise PipelineFailedError(error_msg)
-
-            logger.info(
-                f"Pipeline {pipeline_uuid} status: {status}, waiting {wait_time}s..."
-            )
-            current_attempt += 1
-            if current_attempt <= max_attempts:
-                await asyncio.sleep(wait_time)
-
-        if status != BitbucketPipelineStatus.COMPLETED.value:
-            error_msg = f"Pipeline {pipeline_uuid} did not complete after {max_attempts * wait_time} seconds. Last status: {status}"
+        if result.status == BitbucketPipelineStatus.COMPLETED:
+            logger.info(f"Pipeline {pipeline_uuid} completed successfully")
+            return
+        if result.status == BitbucketPipelineStatus.FAILED:
+            error_msg = f"Pipeline {pipeline_uuid} failed with status: {result.response.get('state', {})}"
             logger.error(error_msg)
-            raise PipelineTimeoutError(error_msg)
+            raise PipelineFailedError(error_msg)
+
+        error_msg = f"Pipeline {pipeline_uuid} did not complete after {result.polls} polls and {result.waited:.0f} seconds. Last status: {result.status.value}"
+        logger.error(error_msg)
+        raise PipelineTimeoutError(error_msg)
 
-    async def get_commits(self, bb_env_name: str, osdu: OSDUVersion) -> dict[str, str]:
+    async def get_commits(
+        self, bb_env_name: str, osdu: OSDUVersion, deadline: Deadline | None = None
+    ) -> dict[str, str]:
         """
         Orchestrates pipeline trigger, monitoring, and artifact retrieval to get deployed commits.
         """
@@ -121,7 +109,7 @@ class CommitCollector:
             raise
 
         try:
-            await self.wait_for_completion(uuid)
+            await self.wait_for_completion(uuid, deadline=deadline)
             logger.info(f"Pipeline {uuid} completed successfully")
         except (PipelineFailedError, PipelineTimeoutError, PipelineStatusError) as e:
             logger.error(f"Pipeline {uuid} execution failed: {e}")
@@ -131,7 +119,7 @@ class CommitCollector:
             # Bitbucket returns uuid in curly braces, normalize it
             uuid_clean = uuid.replace("{", "").replace("}", "")
             filename = f"commits-{uuid_clean}.json"
-            commits_data = await self._bitbucket_client.get_file_from_artifacts(
+            commits_data = await self._bitbucket_client.stream_file_from_artifacts(
                 repo_slug=self._repo_slug, filename=filename
             )
             logger.info(
@@ -141,3 +129,42 @@ class CommitCollector:
         except (ArtifactFileError, InvalidResponseError) as e:
             logger.error(f"Failed to retrieve artifact file for pipeline {uuid}: {e}")
             raise
+
+    async def get_commits_batch(
+        self,
+        targets: list[RequestParams],
+        max_concurrency: int,
+        deadline: Deadline | None = None,
+    ) -> tuple[dict[str, dict[str, str]], dict[str, dict[str, str]]]:
+        """
+        Collects commits for several environments concurrently. Returns commits
+        and errors, both keyed by `<bb_env_name>/<osdu_version>`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _collect(target: RequestParams) -> dict[str, str]:
+            async with semaphore:
+                return await self.get_commits(
+                    bb_env_name=target.bb_env_name,
+                    osdu=target.osdu_version,
+                    deadline=deadline,
+                )
+
+        outcomes = await asyncio.gather(
+            *(_collect(target) for target in targets), return_exceptions=True
+        )
+
+        results: dict[str, dict[str, str]] = {}
+        errors: dict[str, dict[str, str]] = {}
+        for target, outcome in zip(targets, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"Commit collection for {target.target_key} failed: {outcome}"
+                )
+                errors[target.target_key] = {
+                    "errorType": type(outcome).__name__,
+                    "message": str(outcome),
+                }
+            else:
+                results[target.target_key] = outcome
+        return results, errors
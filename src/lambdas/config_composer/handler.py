@@ -1,10 +1,12 @@
 import logging
 import os
+from functools import partial
 
-import boto3
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from pydantic import ValidationError
 
+from shared.boto.clients import get_session
+from shared.boto.config_store import get_config_store
 from shared.env_validator import EnvValidator
 from shared.utils import create_error_response, create_response
 
@@ -12,8 +14,10 @@ from .const.env_variable_keys import (
     ENV_VARIABLE_KEYS,
     SERVICE_NAME_ENV_VAR,
 )
+from .models.errors import ConfigFetchError
 from .models.models import ConfigComposerResult
 from .models.params import RequestParams
+from .services.concurrent_fetch import fetch_concurrently
 from .services.secrets import fetch_required_secrets
 from .services.ssm import fetch_required_ssm_params
 
@@ -46,15 +50,28 @@ def lambda_handler(event: dict, _context: LambdaContext):
         )
     logger.info("All required environment variables present")
 
-    # Params + secrets
-    base_session = boto3.Session()
+    # Params + secrets, groups are independent and fetched in parallel
+    # default session is reused by warm invocations together with its clients
+    base_session = get_session()
     try:
-        ssm_params = fetch_required_ssm_params(base_session, SERVICE_NAME)
-        sm_secrets = fetch_required_secrets(base_session, SERVICE_NAME)
+        fetched = fetch_concurrently(
+            {
+                "ssm": partial(fetch_required_ssm_params, base_session, SERVICE_NAME),
+                "secrets": partial(fetch_required_secrets, base_session, SERVICE_NAME),
+            }
+        )
+        ssm_params = fetched["ssm"]
+        sm_secrets = fetched["secrets"]
         logger.info(f"Fetched SSM params and secrets: {ssm_params}")
+    except ConfigFetchError as e:
+        return create_error_response(
+            500, f"fetch_params_secrets_error: {e} (fetched: {e.fetched})"
+        )
     except Exception as e:
         logger.exception("Failed to fetch params/secrets")
         return create_error_response(500, f"fetch_params_secrets_error: {e}")
+    finally:
+        logger.info("Config store stats", extra=get_config_store().stats.as_dict())
 
     # Compose config
     config = ConfigComposerResult.create_instance(
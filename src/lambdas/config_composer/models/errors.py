@@ -0,0 +1,8 @@
+class ConfigFetchError(Exception):
+    """Raised when one or more config groups could not be fetched"""
+
+    def __init__(self, failures: dict[str, str], fetched: list[str]) -> None:
+        self.failures = failures
+        self.fetched = fetched
+        details = "; ".join(f"{group}: {error}" for group, error in failures.items())
+        super().__init__(details)
@@ -0,0 +1,63 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+from ..models.errors import ConfigFetchError
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrentFetchConstants:
+    """Configuration constants for concurrent config fetch"""
+
+    # Seconds a single group may take, botocore retries are included
+    TIMEOUT = 10.0
+
+    # Upper bound of groups fetched at once
+    MAX_WORKERS = 8
+
+
+# threads are kept by warm invocations, a timed out call may still occupy one
+_executor = ThreadPoolExecutor(
+    max_workers=ConcurrentFetchConstants.MAX_WORKERS,
+    thread_name_prefix="config_fetch",
+)
+
+
+def fetch_concurrently(
+    groups: dict[str, Callable[[], Any]],
+    timeout: float = ConcurrentFetchConstants.TIMEOUT,
+) -> dict[str, Any]:
+    """
+    Runs independent config fetches in parallel and returns their results by group
+    name, so that the latency is the one of the slowest group.
+
+    Every group is given `timeout` seconds from submission. Raises ConfigFetchError
+    listing each failed or timed out group once all groups have finished.
+    """
+    started = time.monotonic()
+    futures: dict[str, Future] = {
+        name: _executor.submit(fetch) for name, fetch in groups.items()
+    }
+
+    results: dict[str, Any] = {}
+    failures: dict[str, str] = {}
+    for name, future in futures.items():
+        remaining = max(0.0, started + timeout - time.monotonic())
+        try:
+            results[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            failures[name] = f"timed out after {timeout:.1f}s"
+        except Exception as e:
+            failures[name] = str(e)
+
+    logger.info(
+        f"Fetched config groups {list(results)} in {time.monotonic() - started:.3f}s"
+    )
+    if failures:
+        logger.error(f"Failed to fetch config groups: {failures}")
+        raise ConfigFetchError(failures, fetched=list(results))
+    return results
@@ -1,4 +1,4 @@
-import asyncio
+import os
 from typing import Any
 
 import httpx
@@ -7,7 +7,11 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from pydantic import ValidationError
 
 from shared.bitbucket.bitbucket_client import BitbucketClient, BitbucketClientConfig
+from shared.bitbucket.client_pool import get_client_pool
 from shared.bitbucket.get_token_from_envs import get_token_from_envs
+from shared.bitbucket.poller import Deadline
+from shared.bitbucket.rate_limiter import get_request_scheduler
+from shared.http_cache import get_http_cache
 from shared.utils import create_error_response, create_response
 
 from .models.errors import PipelineHasFailed
@@ -17,15 +21,28 @@ from .services.deployment_checker import DeploymentChecker
 logger = Logger(service="deployment-checker")
 
 REQUEST_TIMEOUT = 30.0
+# Seconds to keep polling inside one invocation, 0 means a single status check
+MAX_POLL_DURATION = float(os.environ.get("MAX_POLL_DURATION", "0"))
 
+client_pool = get_client_pool(timeout=REQUEST_TIMEOUT)
+request_scheduler = get_request_scheduler()
+# Optional DynamoDB table sharing cached Bitbucket responses between Lambdas
+http_cache = get_http_cache(os.environ.get("HTTP_CACHE_TABLE"))
 
-async def _trigger_pipeline(token: str, execution_uuid: str) -> bool:
+
+async def _trigger_pipeline(
+    token: str, execution_uuid: str, deadline: Deadline | None
+) -> bool:
     """Triggers Bitbucket Pipeline for selected environment"""
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        bitbucket_config = BitbucketClientConfig(token)
-        bitbucket_client = BitbucketClient(client=client, config=bitbucket_config)
-        deployment_checker = DeploymentChecker(bitbucket_client=bitbucket_client)
-        return await deployment_checker.check_if_finished(execution_uuid)
+    bitbucket_config = BitbucketClientConfig(token)
+    bitbucket_client = BitbucketClient(
+        client=client_pool.get_client(),
+        config=bitbucket_config,
+        cache=http_cache,
+        scheduler=request_scheduler,
+    )
+    deployment_checker = DeploymentChecker(bitbucket_client=bitbucket_client)
+    return await deployment_checker.check_if_finished(execution_uuid, deadline=deadline)
 
 
 def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
@@ -52,9 +69,22 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
         )
 
     # Check status
+    deadline = (
+        Deadline.from_context(context, max_duration=MAX_POLL_DURATION)
+        if MAX_POLL_DURATION > 0
+        else None
+    )
+    # retries never wait past the Lambda timeout, whatever the polling deadline
+    request_scheduler.set_deadline(Deadline.from_context(context))
     try:
-        is_completed = asyncio.run(
-            _trigger_pipeline(token=token, execution_uuid=execution_uuid)
+        is_completed = client_pool.run(
+            _trigger_pipeline(
+                token=token, execution_uuid=execution_uuid, deadline=deadline
+            )
+        )
+        logger.info("Bitbucket HTTP cache stats", extra=http_cache.stats.as_dict())
+        logger.info(
+            "Bitbucket request scheduler stats", extra=request_scheduler.stats.as_dict()
         )
         logger.info(f"Pipeline execution is completed: {is_completed}")
 
@@ -1,8 +1,6 @@
 from pydantic import BaseModel, Field
 
-UUID_IN_BRACES_PATTERN = (
-    r"^\{[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\}$"
-)
+from shared.bitbucket.type import UUID_IN_BRACES_PATTERN
 
 
 class RequestParams(BaseModel):
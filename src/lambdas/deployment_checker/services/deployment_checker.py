@@ -1,6 +1,7 @@
 import logging
 
 from shared.bitbucket.bitbucket_client import BitbucketClient
+from shared.bitbucket.poller import BackoffPolicy, Deadline, PipelinePoller
 from shared.bitbucket.type import BitbucketPipelineStatus
 
 from ..models.errors import PipelineHasFailed
@@ -15,26 +16,27 @@ class DeploymentChecker:
         self,
         bitbucket_client: BitbucketClient,
         repo_slug: str = "dataops-deployment",
+        backoff: BackoffPolicy | None = None,
     ) -> None:
         self._bitbucket_client = bitbucket_client
         self._repo_slug = repo_slug
-
-    async def _check_status(self, execution_uuid: str) -> str:
-        execution_data = await self._bitbucket_client.check_pipeline_status(
-            repo_slug=self._repo_slug, execution_uuid=execution_uuid
-        )
-
-        status = execution_data["state"]["name"]
-        logger.info(
-            f"Pipeline execution {execution_uuid} for {self._repo_slug} status: {status}"
+        self._poller = PipelinePoller(
+            bitbucket_client=bitbucket_client, repo_slug=repo_slug, backoff=backoff
         )
-        return BitbucketPipelineStatus[status].value
-
-    async def check_if_finished(self, execution_uuid: str) -> bool:
-        status = await self._check_status(execution_uuid)
 
-        if status == BitbucketPipelineStatus.COMPLETED.value:
+    async def check_if_finished(
+        self, execution_uuid: str, deadline: Deadline | None = None
+    ) -> bool:
+        """
+        Checks pipeline status once, or keeps polling until deadline when one is given.
+        """
+        if deadline is None:
+            result = await self._poller.check(execution_uuid)
+        else:
+            result = await self._poller.wait(execution_uuid, deadline=deadline)
+
+        if result.status == BitbucketPipelineStatus.COMPLETED:
             return True
-        if status == BitbucketPipelineStatus.FAILED.value:
+        if result.status == BitbucketPipelineStatus.FAILED:
             raise PipelineHasFailed(f"Pipeline {execution_uuid} has failed")
         return False
@@ -3,18 +3,20 @@ import json
 import logging
 import os
 import zipfile
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import boto3
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from mypy_boto3_s3 import S3Client
 from pydantic import ValidationError
 
+from shared.boto.clients import get_client
 from shared.env_validator import EnvValidator
 from shared.utils import create_error_response, create_response, to_snake_case
 
 from .models.params import RequestParams
 
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
 REPORTS_BUCKET_NAME_ENV_VAR = "REPORTS_BUCKET_NAME"
 REPORTS_FOLDER_NAME_ENV_VAR = "REPORTS_FOLDER_NAME"
 ENV_VARIABLE_KEYS = [
@@ -51,7 +53,7 @@ def lambda_handler(event: dict, _context: LambdaContext) -> dict[str, Any]:
     logger.info("All required environment variables present")
 
     # Extract deployment data from S3
-    s3: S3Client = boto3.client("s3")
+    s3: S3Client = get_client("s3")
 
     reports_bucket_name = os.environ.get(REPORTS_BUCKET_NAME_ENV_VAR, "")
     reports_folder_name = os.environ.get(REPORTS_FOLDER_NAME_ENV_VAR, "")
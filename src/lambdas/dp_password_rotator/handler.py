@@ -8,7 +8,7 @@ from shared.boto.cognito import cognito_user_exists, set_cognito_user_password
 from shared.boto.models import SecretResponse, SSMResponse
 from shared.boto.secrets import get_secret
 from shared.boto.ssm import get_ssm_param
-from shared.boto.sts import assume_role
+from shared.boto.sts import get_assumed_role_session
 from shared.env_validator import EnvValidator
 from shared.utils import create_error_response, create_response
 
@@ -48,7 +48,10 @@ def lambda_handler(event: dict, _context: LambdaContext):
     # Assume role in data portal
     try:
         role_arn = f"arn:aws:iam::{data.dp_account_id}:role/edi-e2e-tests-cognito-secrets-ssm-cross-role"
-        assumed_session = assume_role(role_arn, "E2ECognitoPasswordRotation")
+        # credentials are reused by warm invocations until close to expiry
+        assumed_session = get_assumed_role_session(
+            role_arn, "E2ECognitoPasswordRotation"
+        )
         logger.info(f"Assumed role: {role_arn}")
     except Exception as e:
         logger.error(f"Failed to assume role: {e}")
@@ -0,0 +1,6 @@
+ARCHIVE_BUCKET_NAME_ENV_VAR = "ARCHIVE_BUCKET_NAME"
+ARCHIVE_PREFIX_ENV_VAR = "ARCHIVE_PREFIX"
+
+ENV_VARIABLE_KEYS = [
+    ARCHIVE_BUCKET_NAME_ENV_VAR,
+]
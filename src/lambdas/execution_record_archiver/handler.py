@@ -0,0 +1,46 @@
+import logging
+import os
+from typing import Any
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from shared.boto.clients import get_client
+from shared.domain.execution_archive import ExecutionArchiveConstants
+from shared.env_validator import EnvValidator
+
+from .const.env_variable_keys import (
+    ARCHIVE_BUCKET_NAME_ENV_VAR,
+    ARCHIVE_PREFIX_ENV_VAR,
+    ENV_VARIABLE_KEYS,
+)
+from .services.stream_archiver import StreamArchiver
+
+logger = logging.getLogger("execution_record_archiver")
+logger.setLevel(logging.INFO)
+
+
+def lambda_handler(event: dict, _context: LambdaContext) -> dict[str, Any]:
+    """
+    Archives Execution Records expired by DynamoDB TTL, invoked by the table
+    stream with ReportBatchItemFailures enabled.
+    """
+    records = event.get("Records") or []
+    logger.info(f"Processing {len(records)} stream records")
+
+    if not EnvValidator.all_env_vars_present(ENV_VARIABLE_KEYS):
+        # failing the invocation keeps the batch in the stream for a retry
+        raise RuntimeError("env_validation: Missing environment variables")
+
+    archiver = StreamArchiver(
+        get_client("s3"),
+        os.environ[ARCHIVE_BUCKET_NAME_ENV_VAR],
+        os.environ.get(ARCHIVE_PREFIX_ENV_VAR) or ExecutionArchiveConstants.PREFIX,
+    )
+    failed = archiver.archive(records)
+
+    # the stream is retried from the lowest failed sequence number, objects
+    # are keyed by the sequence number of their first record, so the retry
+    # overwrites the object of the failed records and writes no duplicates
+    if failed:
+        return {"batchItemFailures": [{"itemIdentifier": min(failed, key=int)}]}
+    return {"batchItemFailures": []}
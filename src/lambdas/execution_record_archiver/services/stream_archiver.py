@@ -0,0 +1,87 @@
+import logging
+from typing import Any
+
+from shared.domain.execution_archive import (
+    ExecutionArchiveConstants,
+    archive_key,
+    encode_records,
+)
+from shared.domain.models.execution_record import ExecutionRecordModel
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB TTL deletions are attributed to the DynamoDB service principal
+TTL_PRINCIPAL = "dynamodb.amazonaws.com"
+
+
+def is_ttl_removal(stream_record: dict[str, Any]) -> bool:
+    identity = stream_record.get("userIdentity") or {}
+    return (
+        stream_record.get("eventName") == "REMOVE"
+        and identity.get("type") == "Service"
+        and identity.get("principalId") == TTL_PRINCIPAL
+    )
+
+
+def to_archive_record(old_image: dict[str, Any]) -> dict[str, Any]:
+    record = ExecutionRecordModel.from_raw_data(old_image)
+    expires_at = record.ExpiresAt
+    return {
+        **record.to_dict(),
+        "ExpiresAt": expires_at.isoformat() if expires_at else None,
+    }
+
+
+class StreamArchiver:
+    """
+    Writes Execution Records expired by DynamoDB TTL to S3 as gzipped JSON Lines.
+
+    Consecutive records of a batch created on the same day are written to one
+    object, keyed by the sequence number of its first record. A retried batch
+    starts from the first record not archived, so its objects start at the same
+    sequence numbers and overwrite, never duplicate, what was already written.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        prefix: str = ExecutionArchiveConstants.PREFIX,
+    ) -> None:
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._prefix = prefix
+
+    def archive(self, stream_records: list[dict[str, Any]]) -> list[str]:
+        """
+        Archives TTL removals of the batch, other events are skipped. Stops at
+        the first failed upload, returns sequence numbers of records not
+        archived.
+        """
+        runs: list[list[tuple[str, dict[str, Any]]]] = []
+        for stream_record in stream_records:
+            if not is_ttl_removal(stream_record):
+                continue
+            change = stream_record["dynamodb"]
+            record = to_archive_record(change["OldImage"])
+            if not runs or runs[-1][0][1]["CreatedAt"][:10] != record["CreatedAt"][:10]:
+                runs.append([])
+            runs[-1].append((change["SequenceNumber"], record))
+
+        for index, entries in enumerate(runs):
+            first_sequence, first_record = entries[0]
+            key = archive_key(first_record["CreatedAt"], first_sequence, self._prefix)
+            try:
+                self._s3_client.put_object(
+                    Bucket=self._bucket,
+                    Key=key,
+                    Body=encode_records(record for _, record in entries),
+                    ContentType=ExecutionArchiveConstants.CONTENT_TYPE,
+                    ContentEncoding="gzip",
+                )
+            except Exception as e:
+                logger.error(f"Failed to archive {len(entries)} records to {key}: {e}")
+                # later records are archived by the retry, starting at this run
+                return [sequence for run in runs[index:] for sequence, _ in run]
+            logger.info(f"Archived {len(entries)} records to s3://{self._bucket}/{key}")
+        return []
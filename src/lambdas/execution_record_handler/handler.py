@@ -1,13 +1,21 @@
 import logging
+import os
 from typing import Any
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from botocore.exceptions import BotoCoreError, ClientError
+from pynamodb.exceptions import PutError, PynamoDBException
 
 from shared.env_validator import EnvValidator
 from shared.utils import create_error_response, create_response
 
-from .const.env_variable_keys import ENV_VARIABLE_KEYS
+from .const.env_variable_keys import ENV_VARIABLE_KEYS, HASH_KEY_NAME_ENV_VAR
+from .models.errors import ExecutionRecordConflict
 from .models.execution_record import ExecutionRecordModel
+from .services.execution_record_batch import (
+    ExecutionRecordBatch,
+    ExecutionRecordBatchConstants,
+)
 from .services.execution_record_factory import ExecutionRecordFactory
 from .services.execution_record_validator import ExecutionRecordValidator
 
@@ -15,6 +23,52 @@ logger = logging.getLogger("execution_record_handler")
 logger.setLevel(logging.INFO)
 
 
+def _handle_batch(event: dict) -> dict[str, Any]:
+    """
+    Batch mode, `Records` are written and `Ids` are read with one result per item.
+    """
+    key = "Records" if "Records" in event else "Ids"
+    items = event[key]
+    if not isinstance(items, list) or not items:
+        return create_error_response(400, f"{key} must be a non-empty list")
+    if len(items) > ExecutionRecordBatchConstants.MAX_ITEMS:
+        return create_error_response(
+            400,
+            f"{key} must not contain more than {ExecutionRecordBatchConstants.MAX_ITEMS} items",
+        )
+
+    if key == "Ids" and not all(
+        isinstance(record_id, str) and record_id for record_id in items
+    ):
+        return create_error_response(
+            400, "Ids must contain non-empty strings only", "ValidationError"
+        )
+
+    try:
+        if key == "Ids":
+            response_body = ExecutionRecordBatch.get(items)
+            logger.info(
+                "Read %d of %d records", len(response_body["records"]), len(items)
+            )
+            return create_response(200, response_body)
+
+        results = ExecutionRecordBatch.write(items)
+    except (PynamoDBException, BotoCoreError, ClientError) as e:
+        logger.error("Batch %s failed: %s", "read" if key == "Ids" else "write", e)
+        return create_error_response(500, f"DynamoDB error: {e}", "InternalError")
+    saved = sum(1 for result in results if result["status"] == "saved")
+    logger.info("Saved %d of %d records", saved, len(results))
+    return create_response(
+        200,
+        {
+            "message": "Batch processed",
+            "saved": saved,
+            "failed": len(results) - saved,
+            "results": results,
+        },
+    )
+
+
 def lambda_handler(event: dict, _context: LambdaContext) -> dict[str, Any]:
     logger.info("Received event: %s", event)
     # validate env
@@ -22,21 +76,45 @@ def lambda_handler(event: dict, _context: LambdaContext) -> dict[str, Any]:
         logger.error("Missing environment variables: %s", ENV_VARIABLE_KEYS)
         return create_error_response(500, "Missing environment variables")
 
+    if "Records" in event or "Ids" in event:
+        return _handle_batch(event)
+
+    is_new_record = not event.get(os.environ.get(HASH_KEY_NAME_ENV_VAR))
+
     # validate payload
     try:
+        if is_new_record:
+            ExecutionRecordValidator.validate_new_record(event)
         ExecutionRecordValidator.validate(event)
     except ValueError as e:
         logger.error("Payload validation failed: %s", e)
         return create_error_response(400, str(e))
 
-    # build DB record
-    record_dict = ExecutionRecordFactory.make_test_execution_record(event)
-    logger.info("Built DB record: %s", record_dict)
+    # existing records are updated in place, one conditional write without a read
+    if not is_new_record:
+        try:
+            db_record = ExecutionRecordFactory.update_test_execution_record(event)
+        except ExecutionRecordConflict as e:
+            logger.error("Conditional update rejected: %s", e)
+            return create_error_response(409, str(e), "ConflictError")
+        logger.info("Updated DB record in DynamoDB: %s", db_record.to_dict())
+    else:
+        # build DB record
+        record_dict = ExecutionRecordFactory.make_test_execution_record(event)
+        logger.info("Built DB record: %s", record_dict)
 
-    # propagate to DB
-    db_record = ExecutionRecordModel(**record_dict)
-    db_record.save()
-    logger.info("Saved DB record to DynamoDB: %s", db_record.to_dict())
+        # propagate to DB, a generated Id never overwrites an existing record
+        db_record = ExecutionRecordModel(**record_dict)
+        try:
+            db_record.save(condition=ExecutionRecordModel.Id.does_not_exist())
+        except PutError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            logger.error("Record already exists: %s", db_record.Id)
+            return create_error_response(
+                409, f"Execution record {db_record.Id} already exists", "ConflictError"
+            )
+        logger.info("Saved DB record to DynamoDB: %s", db_record.to_dict())
 
     # generate response
     response_body = {
@@ -0,0 +1,3 @@
+from shared.domain.execution_record_repository import ExecutionRecordConflict
+
+__all__ = ["ExecutionRecordConflict"]
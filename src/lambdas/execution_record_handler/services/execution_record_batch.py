@@ -0,0 +1,160 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from pynamodb.constants import BATCH_WRITE_PAGE_LIMIT
+from pynamodb.exceptions import PutError
+
+from shared.domain.models.execution_record import record_expiry
+from shared.domain.models.status import StatusList
+from shared.domain.status_transitions import is_allowed_transition
+
+from ..const.env_variable_keys import HASH_KEY_NAME_ENV_VAR
+from ..models.execution_record import ExecutionRecordModel
+from .execution_record_validator import ExecutionRecordValidator
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionRecordBatchConstants:
+    """Configuration constants for batch payloads"""
+
+    # Upper bound of records per invocation
+    MAX_ITEMS = 500
+
+
+def _result(index: int, record_id: str | None, status: str, **extra) -> dict:
+    return {"index": index, "Id": record_id, "status": status, **extra}
+
+
+class ExecutionRecordBatch:
+    """
+    Writes and reads many Execution Records per invocation with BatchWriteItem /
+    BatchGetItem, reporting a result per item.
+
+    BatchWriteItem has no condition expressions, existing records are read in
+    one BatchGetItem pass and their transitions are checked before writing.
+    Meant for backfills and migrations, single updates should keep using the
+    conditional update path.
+    """
+
+    @staticmethod
+    def get(record_ids: list[str]) -> dict[str, Any]:
+        """
+        Returns found records in request order and the ids that do not exist.
+        Unprocessed keys are retried by PynamoDB.
+        """
+        found = {
+            record.Id: record.to_dict()
+            for record in ExecutionRecordModel.batch_get(record_ids)
+        }
+        return {
+            "records": [found[i] for i in dict.fromkeys(record_ids) if i in found],
+            "missing": [i for i in dict.fromkeys(record_ids) if i not in found],
+        }
+
+    @staticmethod
+    def write(payloads: list[dict]) -> list[dict]:
+        hash_key_name = os.environ.get(HASH_KEY_NAME_ENV_VAR)
+        results: list[dict | None] = [None] * len(payloads)
+        updated_at = datetime.now(timezone.utc)
+        now = updated_at.isoformat()
+
+        existing_ids = {
+            payload.get(hash_key_name)
+            for payload in payloads
+            if isinstance(payload, dict) and payload.get(hash_key_name)
+        }
+        existing = {
+            record.Id: record
+            for record in ExecutionRecordModel.batch_get(list(existing_ids))
+        }
+
+        attributes = ExecutionRecordModel.get_attributes()
+        pending: list[tuple[int, ExecutionRecordModel]] = []
+        seen_ids: set[str] = set()
+        for index, payload in enumerate(payloads):
+            record_id = (
+                payload.get(hash_key_name) if isinstance(payload, dict) else None
+            )
+            try:
+                if not isinstance(payload, dict):
+                    raise ValueError("Record must be an object")
+                if not record_id:
+                    ExecutionRecordValidator.validate_new_record(payload)
+                ExecutionRecordValidator.validate(payload)
+            except ValueError as e:
+                results[index] = _result(index, record_id, "invalid", error=str(e))
+                continue
+
+            # a batch write cannot put the same key twice
+            if record_id in seen_ids:
+                results[index] = _result(
+                    index, record_id, "invalid", error="Duplicate Id in batch"
+                )
+                continue
+
+            record: dict[str, Any] = {}
+            if record_id:
+                stored = existing.get(record_id)
+                if stored is None:
+                    results[index] = _result(index, record_id, "not_found")
+                    continue
+                if not is_allowed_transition(
+                    StatusList(stored.Status), StatusList(payload["Status"])
+                ):
+                    results[index] = _result(
+                        index,
+                        record_id,
+                        "invalid",
+                        error=f"Status transition not allowed: {stored.Status} -> {payload['Status']}",
+                    )
+                    continue
+                record = stored.to_dict()
+            else:
+                record_id = str(uuid4())
+
+            record.update(
+                {
+                    k: v
+                    for k, v in payload.items()
+                    if k in attributes and k != "ExpiresAt"
+                }
+            )
+            record[hash_key_name] = record_id
+            record["CreatedAt"] = record.get("CreatedAt") or now
+            record["UpdatedAt"] = now
+            record["ExpiresAt"] = record_expiry(updated_at)
+            seen_ids.add(record_id)
+            pending.append((index, ExecutionRecordModel(**record)))
+
+        for start in range(0, len(pending), BATCH_WRITE_PAGE_LIMIT):
+            chunk = pending[start : start + BATCH_WRITE_PAGE_LIMIT]
+            failed_ids: set[str] = set()
+            batch = ExecutionRecordModel.batch_write()
+            try:
+                with batch:
+                    for _, model in chunk:
+                        batch.save(model)
+            except PutError as e:
+                # unprocessed items are retried by PynamoDB before giving up
+                logger.error(f"Batch write failed: {e}")
+                failed_ids = {
+                    op["PutRequest"]["Item"][hash_key_name]["S"]
+                    for op in batch.failed_operations or []
+                    if "PutRequest" in op
+                } or {model.Id for _, model in chunk}
+
+            for index, model in chunk:
+                if model.Id in failed_ids:
+                    results[index] = _result(
+                        index, model.Id, "failed", error="Unprocessed by DynamoDB"
+                    )
+                else:
+                    results[index] = _result(
+                        index, model.Id, "saved", db_record=model.to_dict()
+                    )
+
+        return [result for result in results if result is not None]
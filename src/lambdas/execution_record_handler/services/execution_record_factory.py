@@ -2,24 +2,24 @@ import os
 from datetime import datetime, timezone
 from uuid import uuid4
 
+from shared.domain.execution_record_repository import ExecutionRecordRepository
+from shared.domain.models.execution_record import record_expiry
+
 from ..const.env_variable_keys import HASH_KEY_NAME_ENV_VAR
 from ..models.execution_record import ExecutionRecordModel
 
+# optimistic concurrency tokens, compared with the stored item but never written
+EXPECTED_STATUS_FIELD = "ExpectedStatus"
+EXPECTED_UPDATED_AT_FIELD = "ExpectedUpdatedAt"
+
 
 class ExecutionRecordFactory:
     @staticmethod
     def make_test_execution_record(payload: dict) -> dict:
         hash_record_name = os.environ.get(HASH_KEY_NAME_ENV_VAR)
 
-        # fetch existing record from DynamoDB if 'Id' exists
-        record = {}
-        record_id = payload.get(hash_record_name)
-        if record_id:
-            existing_record = ExecutionRecordModel.get(record_id)
-            record = existing_record.to_dict()
-
-        # merge updates from payload
-        record.update(payload)
+        # only new records are built here, existing ones are updated in place
+        record = dict(payload)
         if not record.get(hash_record_name):
             record[hash_record_name] = str(uuid4())
 
@@ -28,8 +28,28 @@ class ExecutionRecordFactory:
         if not record.get("CreatedAt"):
             record["CreatedAt"] = now
         record["UpdatedAt"] = now
+        # retention restarts with every update
+        record["ExpiresAt"] = record_expiry(now)
         for ts_field in ["CreatedAt", "UpdatedAt"]:
             if ts_field in record and isinstance(record[ts_field], datetime):
                 record[ts_field] = record[ts_field].isoformat()
 
         return record
+
+    @staticmethod
+    def update_test_execution_record(payload: dict) -> ExecutionRecordModel:
+        """
+        Writes only the payload fields of an existing record, see
+        ExecutionRecordRepository.update for the conditions of the write.
+        `ExpectedStatus` / `ExpectedUpdatedAt` payload fields additionally require
+        the stored values to match. Raises ExecutionRecordConflict when a condition
+        is not met.
+        """
+        hash_record_name = os.environ.get(HASH_KEY_NAME_ENV_VAR)
+        fields = {k: v for k, v in payload.items() if k != hash_record_name}
+        return ExecutionRecordRepository.update(
+            payload[hash_record_name],
+            fields,
+            expected_status=payload.get(EXPECTED_STATUS_FIELD),
+            expected_updated_at=payload.get(EXPECTED_UPDATED_AT_FIELD),
+        )
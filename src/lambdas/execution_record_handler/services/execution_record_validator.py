@@ -1,21 +1,11 @@
 from shared.domain.models.status import StatusList
+from shared.domain.status_transitions import (
+    INITIAL_STATUSES,
+    REQUIRED_FIELDS_BY_STATUS,
+    is_allowed_transition,
+)
 
-REQUIRED_FIELDS_BY_STATUS = {
-    StatusList.initialized: [],
-    StatusList.deployedServices: ["Id", "DeployedServices"],
-    StatusList.operationsPortalTestsDone: [
-        "Id",
-        "DataPortalUrl",
-        "DeploymentId",
-        "WorkloadVersion",
-        "SubscriptionTestReportUrl",
-    ],
-    StatusList.dataPortalVerificationTestsDone: ["Id", "VerificationTestReportUrl"],
-    StatusList.dataPortalTeardownTestsDone: ["Id", "TeardownTestReportUrl"],
-    StatusList.finalReport: ["Id"],
-    StatusList.failure: ["Id", "FailureReason"],
-    StatusList.success: ["Id"],
-}
+__all__ = ["REQUIRED_FIELDS_BY_STATUS", "ExecutionRecordValidator"]
 
 
 class ExecutionRecordValidator:
@@ -36,4 +26,34 @@ class ExecutionRecordValidator:
             raise ValueError(
                 f"Missing required fields for status '{status_enum.value}': {', '.join(missing)}"
             )
+
+        # the stored status is checked by the conditional write,
+        # an expected status is checked before reaching DynamoDB
+        expected_status = payload.get("ExpectedStatus")
+        if expected_status:
+            try:
+                expected_enum = StatusList(expected_status)
+            except ValueError:
+                raise ValueError(f"Invalid ExpectedStatus value: {expected_status}")
+            if not is_allowed_transition(expected_enum, status_enum):
+                raise ValueError(
+                    f"Status transition not allowed: {expected_enum.value} -> {status_enum.value}"
+                )
+        return True
+
+    @staticmethod
+    def validate_new_record(payload: dict) -> bool:
+        """
+        New records enter the status graph at one of its initial statuses,
+        missing or unknown statuses are reported by validate.
+        """
+        try:
+            status = StatusList(payload.get("Status"))
+        except ValueError:
+            return True
+        if status not in INITIAL_STATUSES:
+            allowed = ", ".join(sorted(s.value for s in INITIAL_STATUSES))
+            raise ValueError(
+                f"New records must have status {allowed}, got '{status.value}'"
+            )
         return True
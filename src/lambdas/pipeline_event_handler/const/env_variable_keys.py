@@ -0,0 +1,9 @@
+AWS_REGION_ENV_VAR = "REGION"
+TABLE_NAME_ENV_VAR = "TABLE_NAME"
+WEBHOOK_SECRET_ENV_VAR = "WEBHOOK_SECRET"
+
+ENV_VARIABLE_KEYS = [
+    AWS_REGION_ENV_VAR,
+    TABLE_NAME_ENV_VAR,
+    WEBHOOK_SECRET_ENV_VAR,
+]
@@ -0,0 +1,140 @@
+import base64
+import binascii
+import json
+import logging
+import os
+from typing import Any
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from pydantic import ValidationError
+
+from shared.boto.clients import get_client
+from shared.env_validator import EnvValidator
+from shared.utils import create_error_response, create_response
+
+from .const.env_variable_keys import ENV_VARIABLE_KEYS, WEBHOOK_SECRET_ENV_VAR
+from .models.params import PipelineEventPayload, WaiterRegistrationParams
+from .models.pipeline_state import PipelineStateModel
+from .services.execution_resumer import ExecutionResumer
+from .services.pipeline_state_store import PipelineStateStore
+from .services.signature_validator import SignatureValidator
+
+logger = logging.getLogger("pipeline_event_handler")
+logger.setLevel(logging.INFO)
+
+
+def _http_response(status_code: int, body: dict[str, Any]) -> dict[str, Any]:
+    """Function URL responses need a serialized body"""
+    response = create_response(status_code, body)
+    response["body"] = json.dumps(response["body"])
+    return response
+
+
+def _http_error_response(status_code: int, message: str, error_type: str) -> dict:
+    response = create_error_response(status_code, message, error_type)
+    response["body"] = json.dumps(response["body"])
+    return response
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return "; ".join([f"{err['loc'][0]}: {err['msg']}" for err in e.errors()])
+
+
+def _resume_if_ready(item: PipelineStateModel) -> bool:
+    """
+    Resumes waiting execution once both terminal state and task token are known.
+
+    The task is completed before the item is marked as notified: when sending
+    fails, the retried webhook or registration sends again, and a task already
+    completed by a concurrent invocation is rejected by Step Functions.
+    """
+    if not item.TaskToken or not item.is_terminal or item.Notified:
+        return False
+    resumed = ExecutionResumer(get_client("stepfunctions")).resume(item)
+    PipelineStateStore.mark_notified(item)
+    return resumed
+
+
+def _handle_webhook(event: dict) -> dict[str, Any]:
+    body = event.get("body") or ""
+    try:
+        raw_body = (
+            base64.b64decode(body, validate=True)
+            if event.get("isBase64Encoded")
+            else body.encode()
+        )
+    except binascii.Error as e:
+        logger.error(f"Webhook body decoding failed: {e}")
+        return _http_error_response(
+            400, f"Invalid webhook payload: {e}", "ValidationError"
+        )
+
+    validator = SignatureValidator(os.environ[WEBHOOK_SECRET_ENV_VAR])
+    if not validator.is_valid(event.get("headers") or {}, raw_body):
+        logger.error("Webhook signature validation failed")
+        return _http_error_response(401, "Invalid signature", "SignatureError")
+
+    try:
+        payload = PipelineEventPayload.model_validate_json(raw_body)
+    except ValidationError as e:
+        logger.error(f"Webhook payload validation failed: {e}")
+        return _http_error_response(
+            400,
+            f"Invalid webhook payload: {_format_validation_error(e)}",
+            "ValidationError",
+        )
+
+    if not payload.state.name.is_terminal:
+        logger.info(
+            f"Ignoring non terminal state {payload.state.name.value} of pipeline {payload.uuid}"
+        )
+        return _http_response(202, {"message": "Pipeline state ignored"})
+
+    item = PipelineStateStore.record_state(payload)
+    resumed = _resume_if_ready(item)
+    return _http_response(
+        200,
+        {"message": "Pipeline state recorded", "resumed": resumed, **item.to_dict()},
+    )
+
+
+def _handle_waiter_registration(event: dict) -> dict[str, Any]:
+    try:
+        params = WaiterRegistrationParams.model_validate(event)
+    except ValidationError as e:
+        logger.error(f"Waiter registration validation failed: {e}")
+        return create_error_response(
+            400,
+            f"Invalid request parameters: {_format_validation_error(e)}",
+            "ValidationError",
+        )
+
+    item = PipelineStateStore.register_waiter(params.pipeline_uuid, params.task_token)
+    # the pipeline may have finished before the execution started waiting
+    resumed = _resume_if_ready(item)
+    return create_response(
+        200, {"message": "Waiter registered", "resumed": resumed, **item.to_dict()}
+    )
+
+
+def lambda_handler(event: dict, _context: LambdaContext) -> dict[str, Any]:
+    """
+    Receives Bitbucket pipeline webhooks (Lambda function URL) and waiter
+    registrations from Step Functions tasks using waitForTaskToken.
+    """
+    logger.info(f"Processing event with keys: {list(event.keys())}")
+
+    if not EnvValidator.all_env_vars_present(ENV_VARIABLE_KEYS):
+        return create_error_response(
+            500, "env_validation: Missing environment variables"
+        )
+
+    try:
+        if "task_token" in event:
+            return _handle_waiter_registration(event)
+        return _handle_webhook(event)
+    except Exception as e:
+        logger.exception(f"Unexpected error in lambda_handler: {e}")
+        return create_error_response(
+            500, "An unexpected error occurred", "InternalError"
+        )
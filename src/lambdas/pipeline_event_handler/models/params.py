@@ -0,0 +1,45 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from shared.bitbucket.type import UUID_IN_BRACES_PATTERN, BitbucketPipelineStatus
+
+SUCCESSFUL_RESULT = "SUCCESSFUL"
+
+
+class PipelineResult(BaseModel):
+    name: str
+
+
+class PipelineState(BaseModel):
+    name: BitbucketPipelineStatus
+    result: Optional[PipelineResult] = None
+
+
+class PipelineRepository(BaseModel):
+    full_name: str
+
+
+class PipelineEventPayload(BaseModel):
+    """Bitbucket pipeline object, as returned by GET /pipelines/{uuid}"""
+
+    uuid: str = Field(pattern=UUID_IN_BRACES_PATTERN, min_length=38, max_length=38)
+    repository: PipelineRepository
+    state: PipelineState
+
+    @property
+    def repo_slug(self) -> str:
+        return self.repository.full_name.split("/")[-1]
+
+    @property
+    def result_name(self) -> Optional[str]:
+        return self.state.result.name if self.state.result else None
+
+
+class WaiterRegistrationParams(BaseModel):
+    """Sent by Step Functions task using the waitForTaskToken integration"""
+
+    pipeline_uuid: str = Field(
+        pattern=UUID_IN_BRACES_PATTERN, min_length=38, max_length=38
+    )
+    task_token: str = Field(min_length=1)
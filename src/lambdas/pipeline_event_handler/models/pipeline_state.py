@@ -0,0 +1,45 @@
+import os
+
+from pynamodb.attributes import BooleanAttribute, TTLAttribute, UnicodeAttribute
+from pynamodb.models import Model
+
+from shared.bitbucket.type import BitbucketPipelineStatus
+
+from ..const.env_variable_keys import AWS_REGION_ENV_VAR, TABLE_NAME_ENV_VAR
+from .params import SUCCESSFUL_RESULT
+
+
+class PipelineStateModel(Model):
+    class Meta:  # type: ignore
+        table_name = os.environ.get(TABLE_NAME_ENV_VAR)
+        region = os.environ.get(AWS_REGION_ENV_VAR)
+
+    PipelineUuid = UnicodeAttribute(hash_key=True)
+    RepoSlug = UnicodeAttribute(null=True)
+    State = UnicodeAttribute(null=True)
+    Result = UnicodeAttribute(null=True)
+    TaskToken = UnicodeAttribute(null=True)
+    Notified = BooleanAttribute(null=True)
+    UpdatedAt = UnicodeAttribute(null=True)
+    ExpiresAt = TTLAttribute(null=True)
+
+    @property
+    def is_terminal(self) -> bool:
+        return (
+            self.State is not None and BitbucketPipelineStatus(self.State).is_terminal
+        )
+
+    @property
+    def is_successful(self) -> bool:
+        return self.State == BitbucketPipelineStatus.COMPLETED.value and (
+            self.Result is None or self.Result == SUCCESSFUL_RESULT
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "PipelineUuid": self.PipelineUuid,
+            "RepoSlug": self.RepoSlug,
+            "State": self.State,
+            "Result": self.Result,
+            "UpdatedAt": self.UpdatedAt,
+        }
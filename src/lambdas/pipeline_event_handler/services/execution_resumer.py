@@ -0,0 +1,51 @@
+import json
+import logging
+
+from botocore.exceptions import ClientError
+
+from ..models.pipeline_state import PipelineStateModel
+
+logger = logging.getLogger(__name__)
+
+# Step Functions rejects a token whose task already completed with one of these
+COMPLETED_TASK_ERROR_CODES = ("TaskTimedOut", "TaskDoesNotExist", "InvalidToken")
+
+
+class ExecutionResumer:
+    """Resumes Step Functions execution waiting on a pipeline through its task token"""
+
+    def __init__(self, sfn_client) -> None:
+        self._client = sfn_client
+
+    def resume(self, item: PipelineStateModel) -> bool:
+        """
+        Returns False when the task was already completed, e.g. by a concurrent
+        invocation, so sending again is safe.
+        """
+        try:
+            self._send(item)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code not in COMPLETED_TASK_ERROR_CODES:
+                raise
+            logger.info(
+                f"Task of pipeline {item.PipelineUuid} already completed: {code}"
+            )
+            return False
+        return True
+
+    def _send(self, item: PipelineStateModel) -> None:
+        if item.is_successful:
+            logger.info(f"Sending task success for pipeline {item.PipelineUuid}")
+            self._client.send_task_success(
+                taskToken=item.TaskToken,
+                output=json.dumps({"is_completed": True, **item.to_dict()}),
+            )
+            return
+
+        logger.info(f"Sending task failure for pipeline {item.PipelineUuid}")
+        self._client.send_task_failure(
+            taskToken=item.TaskToken,
+            error="PipelineHasFailed",
+            cause=json.dumps(item.to_dict()),
+        )
@@ -0,0 +1,61 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from ..models.params import PipelineEventPayload
+from ..models.pipeline_state import PipelineStateModel
+
+logger = logging.getLogger(__name__)
+
+# Pipeline states are only needed while an execution waits for them
+RECORD_RETENTION = timedelta(days=7)
+
+
+class PipelineStateStore:
+    """Keeps terminal pipeline state and waiting task tokens keyed by pipeline UUID"""
+
+    @staticmethod
+    def record_state(event: PipelineEventPayload) -> PipelineStateModel:
+        """
+        Stores pipeline state, returns the item including any registered task token.
+        """
+        item = PipelineStateModel(event.uuid)
+        item.update(
+            actions=[
+                PipelineStateModel.RepoSlug.set(event.repo_slug),
+                PipelineStateModel.State.set(event.state.name.value),
+                PipelineStateModel.Result.set(event.result_name),
+                PipelineStateModel.UpdatedAt.set(_now()),
+                PipelineStateModel.ExpiresAt.set(RECORD_RETENTION),
+            ]
+        )
+        logger.info(f"Recorded pipeline state: {item.to_dict()}")
+        return item
+
+    @staticmethod
+    def register_waiter(pipeline_uuid: str, task_token: str) -> PipelineStateModel:
+        """
+        Stores task token, returns the item including any already recorded state.
+        """
+        item = PipelineStateModel(pipeline_uuid)
+        item.update(
+            actions=[
+                PipelineStateModel.TaskToken.set(task_token),
+                PipelineStateModel.UpdatedAt.set(_now()),
+                PipelineStateModel.ExpiresAt.set(RECORD_RETENTION),
+            ]
+        )
+        logger.info(f"Registered waiter for pipeline {pipeline_uuid}")
+        return item
+
+    @staticmethod
+    def mark_notified(item: PipelineStateModel) -> None:
+        """
+        Marks item as notified once its waiting execution was resumed, later
+        webhooks and registrations of the pipeline no longer resume it.
+        """
+        item.update(actions=[PipelineStateModel.Notified.set(True)])
+        logger.info(f"Pipeline {item.PipelineUuid} waiter notified")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,22 @@
+import hashlib
+import hmac
+
+SIGNATURE_HEADER = "x-hub-signature"
+SIGNATURE_PREFIX = "sha256="
+
+
+class SignatureValidator:
+    """Validates HMAC signature Bitbucket attaches to webhook requests"""
+
+    def __init__(self, secret: str) -> None:
+        self._secret = secret.encode("utf-8")
+
+    def is_valid(self, headers: dict[str, str], body: bytes) -> bool:
+        # Lambda function URLs lowercase header names, API Gateway keeps them as sent
+        normalized = {key.lower(): value for key, value in headers.items()}
+        signature = normalized.get(SIGNATURE_HEADER, "")
+        if not signature.startswith(SIGNATURE_PREFIX):
+            return False
+
+        expected = hmac.new(self._secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(signature[len(SIGNATURE_PREFIX) :], expected)
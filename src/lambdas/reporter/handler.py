@@ -2,26 +2,38 @@ import json
 import os
 from typing import Any, Dict
 
-import boto3
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.exceptions import BotoCoreError, ClientError
+from pynamodb.exceptions import PynamoDBException
 
+from shared.boto.clients import get_client
+from shared.domain.models.status import StatusList
+from shared.lazy_import import lazy_import
 from shared.utils import create_error_response, create_response
 
 from .models.const import (
     E2E_FINAL_REPORT_TOPIC_ARN,
-    EXECUTION_RECORD_LAMBDA_NAME,
+    REPORT_FORMATS,
     S3_REPORT_BUCKET,
 )
-from .models.errors import EnvironmentValidationError, ParamsValidationError
+from .models.errors import (
+    EnvironmentValidationError,
+    ParamsValidationError,
+    ReportStageError,
+)
 from .services.report_creator import ReportCreator
-from .services.report_lambda_handler import ReportLambdaHandler
+from .services.report_pipeline import ReportPipeline
 from .services.report_uploader import ReportUploader
+from .services.test_results import collect_test_results
 from .services.validator import Validator
 
 logger = Logger(service="final_reporter")
 
+# pynamodb and the botocore client stack are imported on first use, off the
+# cold start path
+execution_record_repository = lazy_import("shared.domain.execution_record_repository")
+
 
 def lambda_handler(event: dict, context: LambdaContext) -> Dict[str, Any]:
     logger.info("Starting E2E report generation", event)
@@ -42,21 +54,15 @@ def lambda_handler(event: dict, context: LambdaContext) -> Dict[str, Any]:
 
     logger.info(f"Processing execution report: {execution_id}")
 
-    # Retrieve execution record
-    lambda_client = boto3.client("lambda")
-    record_handler_lambda = os.getenv(EXECUTION_RECORD_LAMBDA_NAME)
     bucket_name = os.getenv(S3_REPORT_BUCKET)
 
+    # Read execution record directly from DynamoDB
     try:
-        logger.info(f"Invoking execution record lambda: {record_handler_lambda}")
-        report_lambda_handler = ReportLambdaHandler(
-            execution_id=execution_id,
-            function_name=record_handler_lambda,
-            lambda_client=lambda_client,
-        )
-        record = report_lambda_handler.main()
+        logger.info(f"Reading execution record: {execution_id}")
+        record = execution_record_repository.ExecutionRecordRepository.get(execution_id)
+        Validator._validate_execution_record(record)
         logger.info("Successfully retrieved execution record")
-    except (BotoCoreError, ClientError) as e:
+    except (BotoCoreError, ClientError, PynamoDBException) as e:
         logger.error(f"AWS service error retrieving execution record: {str(e)}")
         return create_error_response(
             500, f"Failed to retrieve execution record: {str(e)}"
@@ -67,9 +73,30 @@ def lambda_handler(event: dict, context: LambdaContext) -> Dict[str, Any]:
             500, f"Failed to retrieve execution record: {str(error)}"
         )
 
+    # Aggregate test results of the phases' pytest reports, the report is
+    # still generated without them
+    try:
+        test_results = collect_test_results(get_client("s3"), bucket_name, execution_id)
+        logger.info("Collected test results", extra=test_results["totals"])
+    except Exception:
+        logger.exception("Error collecting test results")
+        test_results = None
+
+    # Mark execution record as reported, the new image is used from now on
+    fields = {"TestResults": test_results} if test_results else {}
+    try:
+        record = execution_record_repository.ExecutionRecordRepository.set_status(
+            execution_id, StatusList.finalReport, **fields
+        ).to_dict()
+        logger.info("Execution record status set to finalReport")
+    except Exception as error:
+        logger.exception("Error updating execution record status")
+        return create_error_response(
+            500, f"Failed to update execution record status: {str(error)}"
+        )
+
     # Create report
     try:
-        logger.info("Creating report from execution record")
         report_creator = ReportCreator(
             {
                 **record,
@@ -77,45 +104,16 @@ def lambda_handler(event: dict, context: LambdaContext) -> Dict[str, Any]:
                 "failure_reason": error_details,
             }
         )
-        html_report = report_creator.to_html()
-        logger.info("Successfully generated HTML report")
     except Exception as error:
         logger.exception("Error generating HTML report")
         return create_error_response(500, f"Failed to generate report: {str(error)}")
 
-    # Upload report to S3
-    s3_client = boto3.client("s3")
-    report_uploader = ReportUploader(s3_client=s3_client, bucket_name=bucket_name)
-
-    try:
-        logger.info(f"Uploading report to S3 bucket: {bucket_name}")
-        file_name = f"{execution_id}-report"
-        presigned_url = report_uploader.main(
-            html_report=html_report, file_name=file_name
-        )
-        logger.info("Successfully uploaded report to S3")
-    except (BotoCoreError, ClientError) as e:
-        logger.error(f"AWS service error uploading report: {str(e)}")
-        return create_error_response(500, f"Failed to upload report: {str(e)}")
-    except Exception as error:
-        logger.exception("Unexpected error uploading report")
-        return create_error_response(500, f"Failed to upload report: {str(error)}")
-
-    # Publish report to SNS
-    try:
-        logger.info("Creating SNS message from report")
-        sns_message = report_creator.to_json(report_url=presigned_url)
-    except Exception as error:
-        logger.exception("Error creating SNS message")
-        return create_error_response(500, f"Failed to create SNS message: {str(error)}")
-
-    sns_client = boto3.client("sns")
+    sns_client = get_client("sns")
     topic_arn = os.getenv(E2E_FINAL_REPORT_TOPIC_ARN)
+    final_status = record.get("Status", "unknown")
 
-    try:
-        final_status = record.get("Status", "unknown")
+    def publish(sns_message: dict) -> None:
         logger.info(f"Publishing report to SNS with status: {final_status}")
-
         sns_client.publish(
             TopicArn=topic_arn,
             Subject=f"E2E Final Report - {final_status}",
@@ -129,22 +127,36 @@ def lambda_handler(event: dict, context: LambdaContext) -> Dict[str, Any]:
             },
         )
 
-        logger.info(
-            f"Successfully published E2E report to SNS for execution: {execution_id}"
-        )
-
-        return create_response(
-            status_code=200,
-            body={
-                "message": "Successfully published E2E final report status to SNS",
-                "execution_id": execution_id,
-                "status": final_status,
-            },
-        )
+    # Render, upload report to S3 and publish it to SNS
+    formats = [
+        name.strip()
+        for name in os.getenv(REPORT_FORMATS, "").split(",")
+        if name.strip() and name.strip() != "html"
+    ]
+    pipeline = ReportPipeline(
+        report_creator=report_creator,
+        report_uploader=ReportUploader(
+            s3_client=get_client("s3"), bucket_name=bucket_name
+        ),
+        publish=publish,
+        formats=formats,
+    )
+    try:
+        logger.info(f"Publishing report through S3 bucket: {bucket_name}")
+        pipeline.run(file_name=f"{execution_id}-report")
+    except ReportStageError as e:
+        logger.error(str(e), exc_info=e.cause)
+        return create_error_response(500, str(e))
 
-    except (BotoCoreError, ClientError) as e:
-        logger.error(f"AWS service error publishing to SNS: {str(e)}")
-        return create_error_response(500, f"Failed to publish to SNS: {str(e)}")
-    except Exception as e:
-        logger.exception("Unexpected error publishing to SNS")
-        return create_error_response(500, f"Failed to publish to SNS: {str(e)}")
+    logger.info(
+        f"Successfully published E2E report to SNS for execution: {execution_id}"
+    )
+
+    return create_response(
+        status_code=200,
+        body={
+            "message": "Successfully published E2E final report status to SNS",
+            "execution_id": execution_id,
+            "status": final_status,
+        },
+    )
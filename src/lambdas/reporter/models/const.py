@@ -1,9 +1,16 @@
+# read by shared.domain.models.execution_record, not imported from there to
+# keep pynamodb off the cold start path
+AWS_REGION_ENV_VAR = "REGION"
+TABLE_NAME_ENV_VAR = "TABLE_NAME"
 E2E_FINAL_REPORT_TOPIC_ARN = "E2E_FINAL_REPORT_TOPIC_ARN"
-EXECUTION_RECORD_LAMBDA_NAME = "EXECUTION_RECORD_LAMBDA_NAME"
 S3_REPORT_BUCKET = "S3_REPORT_BUCKET"
+# optional, comma separated formats uploaded next to the HTML report,
+# e.g. "json,markdown,junit"
+REPORT_FORMATS = "REPORT_FORMATS"
 
 ENV_VARIABLE_KEYS = [
     E2E_FINAL_REPORT_TOPIC_ARN,
-    EXECUTION_RECORD_LAMBDA_NAME,
+    AWS_REGION_ENV_VAR,
+    TABLE_NAME_ENV_VAR,
     S3_REPORT_BUCKET,
 ]
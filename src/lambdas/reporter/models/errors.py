@@ -14,3 +14,17 @@ class ParamsValidationError(Exception):
     """Raised when params variables are missing"""
 
     pass
+
+
+class ReportRenderError(Exception):
+    """Raised when the report template cannot be rendered"""
+
+    pass
+
+
+class ReportStageError(Exception):
+    """Raised when a stage of the report pipeline fails"""
+
+    def __init__(self, message: str, cause: Exception):
+        super().__init__(f"{message}: {cause}")
+        self.cause = cause
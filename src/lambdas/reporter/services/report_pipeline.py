@@ -0,0 +1,182 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from ..models.errors import ReportStageError
+from .report_creator import ReportCreator
+from .report_renderers import get_renderer
+from .report_uploader import ReportUploader
+
+logger = logging.getLogger(__name__)
+
+
+class ReportPipelineConstants:
+    """Configuration constants for the report pipeline"""
+
+    # HTML report and secondary formats are uploaded at once
+    MAX_WORKERS = 4
+
+    # Seconds an upload may take, botocore retries are included
+    UPLOAD_TIMEOUT = 60.0
+
+
+# threads are kept by warm invocations
+_executor = ThreadPoolExecutor(
+    max_workers=ReportPipelineConstants.MAX_WORKERS,
+    thread_name_prefix="report_upload",
+)
+
+
+@dataclass
+class StageTimings:
+    """Milliseconds spent per pipeline stage, concurrent stages overlap"""
+
+    stages: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage] = round((time.perf_counter() - started) * 1000, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self.stages, "total": self.total}
+
+
+@dataclass
+class ReportResult:
+    report_url: str
+    sns_message: dict[str, Any]
+    copies: dict[str, str]  # format -> S3 key of uploaded secondary formats
+    timings: StageTimings
+
+
+class ReportPipeline:
+    """
+    Renders, uploads and publishes the final report.
+
+    The presigned URL only depends on the object key, so the SNS message is
+    built while the report is uploaded, and secondary formats are rendered and
+    uploaded uncompressed in parallel with the HTML report, as sibling objects
+    of the same name. The message is published once the HTML report exists, so
+    its URL never points to a missing object, and lists the URLs of the
+    uploaded secondary formats.
+    """
+
+    def __init__(
+        self,
+        report_creator: ReportCreator,
+        report_uploader: ReportUploader,
+        publish: Callable[[dict[str, Any]], Any],
+        formats: list[str] | None = None,
+    ) -> None:
+        self._creator = report_creator
+        self._uploader = report_uploader
+        self._publish = publish
+        self._formats = []
+        for name in formats or []:
+            # secondary formats are optional, a misconfigured one is skipped
+            try:
+                self._formats.append(get_renderer(name))
+            except ValueError as e:
+                logger.warning(str(e))
+
+    def _upload(
+        self, timings: StageTimings, stage: str, render: Callable[[], str], **kwargs
+    ) -> str:
+        with timings.measure(stage):
+            return self._uploader.upload(render(), **kwargs)
+
+    def run(self, file_name: str) -> ReportResult:
+        """
+        Raises ReportStageError naming the failed stage. Failed secondary formats
+        are logged and skipped, they never fail the report.
+        """
+        timings = StageTimings()
+        started = time.perf_counter()
+
+        with timings.measure("render"):
+            try:
+                html_report = self._creator.to_html()
+            except Exception as e:
+                raise ReportStageError("Failed to generate report", e) from e
+
+        key = self._uploader.report_key(file_name, "html")
+        report_url = self._uploader.get_presigned_url(key)
+
+        upload: Future = _executor.submit(
+            self._upload, timings, "upload", lambda: html_report, file_name=file_name
+        )
+        copies: dict[str, Future] = {
+            renderer.name: _executor.submit(
+                self._upload,
+                timings,
+                f"upload_{renderer.name}",
+                lambda name=renderer.name: self._creator.render(name),
+                file_name=file_name,
+                file_type=renderer.file_type,
+                # read by SDKs and CI importers, which do not decode gzip
+                compress=False,
+            )
+            for renderer in self._formats
+        }
+
+        message_error: Exception | None = None
+        with timings.measure("sns_message"):
+            try:
+                sns_message = self._creator.to_json(report_url=report_url)
+            except Exception as e:
+                message_error = e
+
+        # an upload failure is reported first, as the upload precedes the message
+        try:
+            upload.result(timeout=ReportPipelineConstants.UPLOAD_TIMEOUT)
+        except Exception as e:
+            raise ReportStageError("Failed to upload report", e) from e
+        finally:
+            uploaded_copies = self._collect(copies)
+        if message_error is not None:
+            raise ReportStageError(
+                "Failed to create SNS message", message_error
+            ) from message_error
+        if uploaded_copies:
+            sns_message = {
+                **sns_message,
+                "report_copies": {
+                    name: self._uploader.get_presigned_url(key)
+                    for name, key in uploaded_copies.items()
+                },
+            }
+
+        with timings.measure("publish"):
+            try:
+                self._publish(sns_message)
+            except Exception as e:
+                raise ReportStageError("Failed to publish to SNS", e) from e
+
+        timings.total = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("Report pipeline timings", extra=timings.as_dict())
+        return ReportResult(
+            report_url=report_url,
+            sns_message=sns_message,
+            copies=uploaded_copies,
+            timings=timings,
+        )
+
+    @staticmethod
+    def _collect(copies: dict[str, Future]) -> dict[str, str]:
+        uploaded = {}
+        for name, future in copies.items():
+            try:
+                uploaded[name] = future.result(
+                    timeout=ReportPipelineConstants.UPLOAD_TIMEOUT
+                )
+            except Exception as e:
+                logger.warning(f"Failed to upload {name} report: {e}")
+        return uploaded
@@ -0,0 +1,275 @@
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable
+from xml.etree import ElementTree
+
+from shared.lazy_import import lazy_import
+
+from ..models.errors import ReportRenderError
+from .template_environment import TemplateEnvironmentConstants, get_template
+
+jinja2 = lazy_import("jinja2")
+
+# test phase -> record field holding the URL of its report
+PHASES = {
+    "operations_portal": ("Operations Portal Test Report", "SubscriptionTestReportUrl"),
+    "data_portal_verification": (
+        "Data Portal Test Report",
+        "VerificationTestReportUrl",
+    ),
+    "data_portal_teardown": ("Teardown Test Report", "TeardownTestReportUrl"),
+}
+
+
+@dataclass(frozen=True)
+class PhaseLink:
+    name: str
+    title: str
+    url: str | None
+
+
+@dataclass
+class ReportView:
+    """
+    Values shown by every report format, computed once per report from the
+    validated Execution Record.
+    """
+
+    id: str
+    status: str
+    failure_reason: str | None
+    workload_version: str | None
+    deployment_id: str | None
+    data_portal_url: str | None
+    started_at: str | None
+    finished_at: str | None
+    duration: str
+    duration_seconds: int | None
+    phases: list[PhaseLink]
+    deployed_services: dict[str, Any]
+    test_results: dict[str, Any]
+    # record the view was built from, variables of the HTML template
+    record: dict[str, Any] = field(repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        del data["record"]
+        return data
+
+
+def _duration_seconds(record: dict) -> int | None:
+    created_at_str = record.get("CreatedAt")
+    updated_at_str = record.get("UpdatedAt")
+    if not created_at_str or not updated_at_str:
+        return None
+    try:
+        created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+        updated_at = datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return int((updated_at - created_at).total_seconds())
+
+
+def format_duration(total_seconds: int | None) -> str:
+    if total_seconds is None:
+        return "unknown"
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    return f"{hours}Hours {minutes}minutes"
+
+
+def build_view(record: dict, test_results: dict[str, Any]) -> ReportView:
+    duration_seconds = _duration_seconds(record)
+    return ReportView(
+        id=record.get("Id", "unknown"),
+        status=record.get("Status", "unknown"),
+        failure_reason=record.get("failure_reason"),
+        workload_version=record.get("WorkloadVersion"),
+        deployment_id=record.get("DeploymentId"),
+        data_portal_url=record.get("DataPortalUrl"),
+        started_at=record.get("CreatedAt"),
+        finished_at=record.get("UpdatedAt"),
+        duration=format_duration(duration_seconds),
+        duration_seconds=duration_seconds,
+        phases=[
+            PhaseLink(name=name, title=title, url=record.get(url_field))
+            for name, (title, url_field) in PHASES.items()
+        ],
+        deployed_services=dict(record.get("DeployedServices") or {}),
+        test_results=test_results,
+        record=record,
+    )
+
+
+@dataclass(frozen=True)
+class ReportRenderer:
+    name: str
+    file_type: str  # extension of the uploaded object
+    render: Callable[[ReportView], str]
+
+
+_RENDERERS: dict[str, ReportRenderer] = {}
+
+
+def register_renderer(
+    name: str, file_type: str
+) -> Callable[[Callable[[ReportView], str]], Callable[[ReportView], str]]:
+    """Registers a report format, new formats need no change of the pipeline"""
+
+    def decorator(render: Callable[[ReportView], str]) -> Callable[[ReportView], str]:
+        _RENDERERS[name] = ReportRenderer(name=name, file_type=file_type, render=render)
+        return render
+
+    return decorator
+
+
+def get_renderer(name: str) -> ReportRenderer:
+    """Raises ValueError for unknown formats"""
+    try:
+        return _RENDERERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown report format: {name}, expected one of {sorted(_RENDERERS)}"
+        )
+
+
+def renderer_names() -> list[str]:
+    return sorted(_RENDERERS)
+
+
+@register_renderer("html", "html")
+def render_html(view: ReportView) -> str:
+    try:
+        template = get_template(TemplateEnvironmentConstants.REPORT_TEMPLATE)
+        return template.render({**view.record, "duration": view.duration})
+    except jinja2.TemplateError as e:
+        raise ReportRenderError(f"Error generating report: {e}") from e
+
+
+@register_renderer("json", "json")
+def render_json(view: ReportView) -> str:
+    return json.dumps(view.as_dict(), indent=2, default=str)
+
+
+def _markdown_cell(value: Any) -> str:
+    if value is None or value == "":
+        return "N/A"
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+@register_renderer("markdown", "md")
+def render_markdown(view: ReportView) -> str:
+    lines = [
+        f"# E2E Execution Report {view.id}",
+        "",
+        f"**Final status:** {_markdown_cell(view.status)}",
+    ]
+    if view.failure_reason:
+        lines.append(f"**Failure reason:** {_markdown_cell(view.failure_reason)}")
+    lines += [
+        "",
+        "| | |",
+        "|---|---|",
+        f"| Started | {_markdown_cell(view.started_at)} |",
+        f"| Finished | {_markdown_cell(view.finished_at)} |",
+        f"| Duration | {view.duration} |",
+        f"| Deployment ID | {_markdown_cell(view.deployment_id)} |",
+        f"| Workload version | {_markdown_cell(view.workload_version)} |",
+        f"| Data Portal URL | {_markdown_cell(view.data_portal_url)} |",
+        "",
+        "## Test reports",
+        "",
+    ]
+    for phase in view.phases:
+        link = f"[View Report]({phase.url})" if phase.url else "N/A"
+        lines.append(f"- {phase.title}: {link}")
+    suites = view.test_results.get("suites") or {}
+    if suites:
+        lines += [
+            "",
+            "## Test results",
+            "",
+            "| Suite | Passed | Failed | Skipped | Errors | Total | Duration (s) |",
+            "|---|---|---|---|---|---|---|",
+        ]
+        rows = [*suites.items(), ("total", view.test_results.get("totals") or {})]
+        lines += [
+            f"| {name} | {r.get('passed', 0)} | {r.get('failed', 0)} | "
+            f"{r.get('skipped', 0)} | {r.get('errors', 0)} | {r.get('total', 0)} | "
+            f"{r.get('duration', 0)} |"
+            for name, r in rows
+        ]
+    lines += ["", "## Deployed services", ""]
+    if view.deployed_services:
+        lines += ["| Service | Commit |", "|---|---|"]
+        lines += [
+            f"| {_markdown_cell(service)} | {_markdown_cell(commit)} |"
+            for service, commit in sorted(view.deployed_services.items())
+        ]
+    else:
+        lines.append("No services deployed")
+    return "\n".join(lines) + "\n"
+
+
+def _phase_outcome(view: ReportView, phase: PhaseLink) -> tuple[str, str | None]:
+    """(passed | failed | skipped, message) of a test phase"""
+    results = view.test_results.get("suites", {}).get(phase.name)
+    if results and results.get("failed", 0) + results.get("errors", 0):
+        return "failed", (
+            f"{results.get('failed', 0)} failed, {results.get('errors', 0)} errors "
+            f"of {results.get('total', 0)} tests"
+        )
+    if phase.url:
+        return "passed", None
+    if view.status != "success":
+        return "failed", view.failure_reason or "Phase did not run"
+    return "skipped", "No report uploaded"
+
+
+@register_renderer("junit", "xml")
+def render_junit(view: ReportView) -> str:
+    """
+    One test case per test phase: failed when its tests failed, or when it
+    uploaded no report and the execution failed; skipped when it uploaded no
+    report otherwise (e.g. the data portal phases of dry runs). Test counts of
+    the phase are attached as suite properties.
+    """
+    suites = ElementTree.Element("testsuites", name=f"e2e-{view.id}")
+    counts = {"tests": 0, "failures": 0, "skipped": 0}
+    for phase in view.phases:
+        outcome, message = _phase_outcome(view, phase)
+        results = view.test_results.get("suites", {}).get(phase.name)
+        suite = ElementTree.SubElement(
+            suites,
+            "testsuite",
+            name=phase.name,
+            tests="1",
+            failures=str(int(outcome == "failed")),
+            skipped=str(int(outcome == "skipped")),
+        )
+        if results:
+            suite.set("time", str(results.get("duration", 0)))
+            properties = ElementTree.SubElement(suite, "properties")
+            for name, value in results.items():
+                ElementTree.SubElement(
+                    properties, "property", name=name, value=str(value)
+                )
+        case = ElementTree.SubElement(
+            suite, "testcase", classname="e2e", name=phase.title
+        )
+        if phase.url:
+            ElementTree.SubElement(case, "system-out").text = phase.url
+        if outcome == "failed":
+            ElementTree.SubElement(case, "failure", message=message).text = message
+        elif outcome == "skipped":
+            ElementTree.SubElement(case, "skipped", message=message)
+        counts["tests"] += 1
+        counts["failures"] += outcome == "failed"
+        counts["skipped"] += outcome == "skipped"
+    for name, count in counts.items():
+        suites.set(name, str(count))
+    if view.duration_seconds is not None:
+        suites.set("time", str(view.duration_seconds))
+    ElementTree.indent(suites)
+    return ElementTree.tostring(suites, encoding="unicode", xml_declaration=True)
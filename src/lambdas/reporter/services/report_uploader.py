@@ -1,6 +1,5 @@
+import gzip
 import logging
-import tempfile
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -8,6 +7,18 @@ logger = logging.getLogger(__name__)
 DEFAULT_EXPIRATION = 60 * 60 * 24 * 7
 S3_REPORT_FOLDER = "final_reports"
 
+CONTENT_TYPES = {
+    "html": "text/html; charset=utf-8",
+    "json": "application/json",
+    "md": "text/markdown; charset=utf-8",
+    "xml": "application/xml",
+}
+# reports are rewritten when the reporter is retried, presigned URLs may be
+# opened again later, so caches must revalidate
+CACHE_CONTROL = "private, no-cache"
+# smaller reports do not gain from compression
+GZIP_MIN_SIZE = 1024
+
 
 class ReportUploader:
     def __init__(self, s3_client, bucket_name: str | None):
@@ -15,66 +26,74 @@ class ReportUploader:
         self.bucket_name = bucket_name
 
     @staticmethod
-    def _create_file(file_content: str, file_name: str, file_type: str) -> Path:
+    def report_key(file_name: str, file_type: str = "html") -> str:
+        return f"{S3_REPORT_FOLDER}/{file_name}.{file_type}"
+
+    @staticmethod
+    def _encode(file_content: str, compress: bool) -> tuple[bytes, str | None]:
         """
-        Create a file in a temporary directory with the given content.
-        Returns The absolute path to the created file
+        Returns body and its Content-Encoding. Compressed bodies are decoded by
+        browsers opening the presigned URL, S3 returns the stored encoding.
         """
-        temp_dir = tempfile.gettempdir()
-        file_path = Path(temp_dir) / f"{file_name}.{file_type}"
-
-        file_path.write_text(file_content, encoding="utf-8")
-        logger.info(f"Created file at {file_path}")
-
-        return file_path
-
-    def _upload_to_s3(self, path: Path) -> str:
+        body = file_content.encode("utf-8")
+        if not compress or len(body) < GZIP_MIN_SIZE:
+            return body, None
+        # fixed mtime, identical reports produce identical objects
+        return gzip.compress(body, mtime=0), "gzip"
+
+    def upload(
+        self,
+        file_content: str,
+        file_name: str,
+        file_type: str = "html",
+        compress: bool = True,
+    ) -> str:
         """
-        Upload the zip file to S3.
+        Uploads the report from memory with a single PutObject call.
+        Returns the S3 key of the report.
         """
+        s3_key = self.report_key(file_name, file_type)
+        body, content_encoding = self._encode(file_content, compress)
+
+        extra_args = {}
+        if content_encoding:
+            extra_args["ContentEncoding"] = content_encoding
+
+        logger.info(f"Uploading {len(body)} bytes to s3://{self.bucket_name}/{s3_key}")
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=body,
+            ContentType=CONTENT_TYPES.get(file_type, "application/octet-stream"),
+            CacheControl=CACHE_CONTROL,
+            **extra_args,
+        )
+        logger.info(f"Successfully uploaded to s3://{self.bucket_name}/{s3_key}")
+        return s3_key
 
-        if not path.exists():
-            raise FileNotFoundError(f"Zip file not found: {path}")
-
-        s3_key = f"{S3_REPORT_FOLDER}/{path.name}"
-
-        logger.info(f"Uploading {path} to s3://{self.bucket_name}/{s3_key}")
-
-        try:
-            self.s3_client.upload_file(str(path), self.bucket_name, s3_key)
-            logger.info(f"Successfully uploaded to s3://{self.bucket_name}/{s3_key}")
-            return s3_key
-
-        except (OSError, FileNotFoundError) as e:
-            logger.error(f"Failed to upload to S3 due to file error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Failed to upload to S3: {e}")
-            raise
-
-    def _get_presigned_url(
+    def get_presigned_url(
         self, object_name: str, expiration: int = DEFAULT_EXPIRATION
     ) -> str:
+        """Signed locally, the object does not need to exist yet"""
         return self.s3_client.generate_presigned_url(
             "get_object",
             Params={"Bucket": self.bucket_name, "Key": object_name},
             ExpiresIn=expiration,
         )
 
-    def main(self, html_report: str, file_name: str) -> str:
+    def main(self, html_report: str, file_name: str, compress: bool = True) -> str:
         """
         Main entry point.
         """
-        # Create temp file
-        file_path = self._create_file(
-            file_content=html_report, file_name=file_name, file_type="html"
+        s3_key = self.upload(
+            file_content=html_report,
+            file_name=file_name,
+            file_type="html",
+            compress=compress,
         )
 
-        # Upload to S3
-        s3_key = self._upload_to_s3(path=file_path)
-
         logger.info(
             f"Reports uploaded successfully to s3://{self.bucket_name}/{s3_key}"
         )
 
-        return self._get_presigned_url(s3_key)
+        return self.get_presigned_url(s3_key)
@@ -0,0 +1,76 @@
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from shared.lazy_import import lazy_import
+
+jinja2 = lazy_import("jinja2")
+
+
+class TemplateEnvironmentConstants:
+    """Configuration constants for report templates"""
+
+    TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+    # Python modules compiled from the templates at build time, see
+    # buildscripts/precompile_templates.py. Missing in development, templates
+    # are then compiled from TEMPLATES_DIR on first use.
+    COMPILED_TEMPLATES_DIR = (
+        Path(__file__).resolve().parent.parent / "compiled_templates"
+    )
+
+    # /tmp is the only writable path in Lambda, kept between warm invocations
+    BYTECODE_CACHE_DIR = os.path.join("/tmp", "jinja_bytecode_cache")
+
+    REPORT_TEMPLATE = "template.html"
+
+
+def create_environment(
+    templates_dir: Path = TemplateEnvironmentConstants.TEMPLATES_DIR,
+    compiled_templates_dir: Path
+    | None = TemplateEnvironmentConstants.COMPILED_TEMPLATES_DIR,
+    bytecode_cache_dir: str | None = TemplateEnvironmentConstants.BYTECODE_CACHE_DIR,
+) -> Any:
+    """
+    Environment loading precompiled templates first, falling back to the template
+    sources.
+    """
+    loaders = []
+    if compiled_templates_dir and compiled_templates_dir.is_dir():
+        loaders.append(jinja2.ModuleLoader(str(compiled_templates_dir)))
+    loaders.append(jinja2.FileSystemLoader(str(templates_dir)))
+
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+
+    return jinja2.Environment(
+        loader=jinja2.ChoiceLoader(loaders),
+        bytecode_cache=bytecode_cache,
+        autoescape=jinja2.select_autoescape(["html"]),
+        # sources are not modified in a deployed Lambda
+        auto_reload=False,
+    )
+
+
+_environment: Any = None
+_lock = threading.Lock()
+
+
+def get_template_environment() -> Any:
+    """
+    Returns template environment shared by all invocations of the execution
+    environment, created on first use so that jinja2 is not imported on cold start.
+    """
+    global _environment
+    with _lock:
+        if _environment is None:
+            _environment = create_environment()
+        return _environment
+
+
+def get_template(name: str) -> Any:
+    """Compiled template, cached by the environment after the first call"""
+    return get_template_environment().get_template(name)
@@ -0,0 +1,132 @@
+import json
+import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from shared.boto.s3_range_reader import S3RangeReader
+
+logger = logging.getLogger(__name__)
+
+# test phase -> S3 folder the e2e runs upload their zipped reports to,
+# see e2e.models.enums.FolderName
+PHASE_FOLDERS = {
+    "operations_portal": "operation_portal_subscription_test_reports",
+    "data_portal_verification": "data_portal_verification_test_reports",
+    "data_portal_teardown": "data_portal_teardown_test_reports",
+}
+
+
+class TestResultsConstants:
+    """Configuration constants for test result aggregation"""
+
+    # pytest-json-report file inside the archives (reports/report.json)
+    REPORT_FILE_NAME = "report.json"
+
+    # Reports above this uncompressed size are skipped (bytes)
+    MAX_REPORT_BYTES = 50 * 1024 * 1024
+
+
+@dataclass
+class SuiteResults:
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    total: int = 0
+    duration: float = 0.0  # seconds
+
+    def add(self, other: "SuiteResults") -> None:
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.errors += other.errors
+        self.total += other.total
+        self.duration = round(self.duration + other.duration, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def summarize_report(report: dict[str, Any]) -> SuiteResults:
+    """Counts of a pytest-json-report document"""
+    summary = report.get("summary") or {}
+    # xfailed / xpassed are expected outcomes, counted as skipped / passed
+    return SuiteResults(
+        passed=summary.get("passed", 0) + summary.get("xpassed", 0),
+        failed=summary.get("failed", 0),
+        skipped=summary.get("skipped", 0) + summary.get("xfailed", 0),
+        errors=summary.get("error", 0),
+        total=summary.get("total", 0),
+        duration=round(float(report.get("duration") or 0.0), 3),
+    )
+
+
+def read_archived_report(s3_client: Any, bucket: str, key: str) -> dict[str, Any]:
+    """
+    Reads the JSON report of a zipped reports directory. Only the central
+    directory and the report member are fetched, other files of the archive
+    (screenshots, traces) are never downloaded. Raises KeyError when the archive
+    has no report.
+    """
+    with S3RangeReader(s3_client, bucket, key) as reader:
+        with zipfile.ZipFile(reader) as archive:
+            member = next(
+                (
+                    info
+                    for info in archive.infolist()
+                    if info.filename.rsplit("/", 1)[-1]
+                    == TestResultsConstants.REPORT_FILE_NAME
+                ),
+                None,
+            )
+            if member is None:
+                raise KeyError(f"No {TestResultsConstants.REPORT_FILE_NAME} in {key}")
+            if member.file_size > TestResultsConstants.MAX_REPORT_BYTES:
+                raise ValueError(
+                    f"{member.filename} of {key} is too large: {member.file_size} bytes"
+                )
+            with archive.open(member) as report_file:
+                report = json.load(report_file)
+        logger.info(f"Read {member.filename} of {key}: {reader.stats.as_dict()}")
+    return report
+
+
+def collect_test_results(
+    s3_client: Any, bucket: str, execution_id: str
+) -> dict[str, Any]:
+    """
+    Aggregates the pytest-json-report results of every test phase of an
+    execution into per suite counts and totals. Phases without an archive (not
+    run) or with an unreadable one are left out.
+    """
+
+    def collect(phase: str) -> SuiteResults | None:
+        key = f"{PHASE_FOLDERS[phase]}/{execution_id}.zip"
+        try:
+            return summarize_report(read_archived_report(s3_client, bucket, key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                logger.info(f"No test reports of {phase}: {key}")
+                return None
+            logger.warning(f"Failed to read test reports of {phase}: {e}")
+        except (KeyError, ValueError, zipfile.BadZipFile) as e:
+            logger.warning(f"Failed to read test reports of {phase}: {e}")
+        return None
+
+    with ThreadPoolExecutor(
+        max_workers=len(PHASE_FOLDERS), thread_name_prefix="test_results"
+    ) as executor:
+        results = dict(zip(PHASE_FOLDERS, executor.map(collect, PHASE_FOLDERS)))
+
+    suites = {phase: suite for phase, suite in results.items() if suite is not None}
+    totals = SuiteResults()
+    for suite in suites.values():
+        totals.add(suite)
+    return {
+        "suites": {phase: suite.as_dict() for phase, suite in suites.items()},
+        "totals": totals.as_dict(),
+    }
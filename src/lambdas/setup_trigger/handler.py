@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any
 
 import httpx
@@ -7,11 +6,14 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from pydantic import ValidationError
 
 from shared.bitbucket.bitbucket_client import BitbucketClient, BitbucketClientConfig
+from shared.bitbucket.client_pool import get_client_pool
 from shared.bitbucket.errors import (
     InvalidResponseError,
     PipelineTriggerError,
 )
 from shared.bitbucket.get_token_from_envs import get_token_from_envs
+from shared.bitbucket.poller import Deadline
+from shared.bitbucket.rate_limiter import get_request_scheduler
 from shared.utils import create_error_response, create_response
 
 from .models.params import RequestParams
@@ -21,18 +23,24 @@ logger = Logger(service="setup-trigger")
 
 REQUEST_TIMEOUT = 30.0
 
+client_pool = get_client_pool(timeout=REQUEST_TIMEOUT)
+request_scheduler = get_request_scheduler()
+
 
 async def _trigger_pipeline(
     token: str, bb_env_code: str, target_branch_name: str
 ) -> dict[str, Any]:
     """Triggers Bitbucket Pipeline for selected environment"""
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        bitbucket_config = BitbucketClientConfig(token)
-        bitbucket_client = BitbucketClient(client=client, config=bitbucket_config)
-        deployment_setup = DeploymentSetup(bitbucket_client=bitbucket_client)
-        return await deployment_setup.trigger_deployment_from_branch(
-            bb_env_code=bb_env_code, target_branch_name=target_branch_name
-        )
+    bitbucket_config = BitbucketClientConfig(token)
+    bitbucket_client = BitbucketClient(
+        client=client_pool.get_client(),
+        config=bitbucket_config,
+        scheduler=request_scheduler,
+    )
+    deployment_setup = DeploymentSetup(bitbucket_client=bitbucket_client)
+    return await deployment_setup.trigger_deployment_from_branch(
+        bb_env_code=bb_env_code, target_branch_name=target_branch_name
+    )
 
 
 def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
@@ -65,13 +73,17 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict[str, Any]:
         logger.info(f"Starting branch deployment for bb env={bb_env_code}")
         target_branch_name = data.target_branch_name
         logger.info(f"Target branch for deployment: {target_branch_name}")
-        pipeline_data = asyncio.run(
+        request_scheduler.set_deadline(Deadline.from_context(context))
+        pipeline_data = client_pool.run(
             _trigger_pipeline(
                 token=token,
                 bb_env_code=bb_env_code,
                 target_branch_name=target_branch_name,
             )
         )
+        logger.info(
+            "Bitbucket request scheduler stats", extra=request_scheduler.stats.as_dict()
+        )
         logger.info(
             f"Successfully triggered pipeline {pipeline_data['uuid']}", pipeline_data
         )
@@ -2,6 +2,7 @@ import logging
 from typing import Any
 
 from shared.bitbucket.bitbucket_client import BitbucketClient
+from shared.bitbucket.poller import PipelinePoller
 from shared.bitbucket.type import BitbucketPipelineStatus
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,9 @@ class DeploymentSetup:
     ) -> None:
         self._bitbucket_client = bitbucket_client
         self._repo_slug = repo_slug
+        self._poller = PipelinePoller(
+            bitbucket_client=bitbucket_client, repo_slug=repo_slug
+        )
 
     async def trigger_deployment_from_branch(
         self, bb_env_code: str, target_branch_name: str
@@ -42,9 +46,6 @@ class DeploymentSetup:
         """
         Check status
         """
-        response = await self._bitbucket_client.check_pipeline_status(
-            repo_slug=self._repo_slug, execution_uuid=pipeline_uuid
-        )
-        logger.debug(f"Pipeline status response: {response}", response)
-        status = response["state"]["name"]
-        return BitbucketPipelineStatus[status]
+        result = await self._poller.check(pipeline_uuid)
+        logger.debug(f"Pipeline status response: {result.response}")
+        return result.status
@@ -0,0 +1,373 @@
+import codecs
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\n\r"
+_WHITESPACE_RUN = re.compile(r"[ \t\n\r]+")
+_INCOMPLETE = object()
+_STRING_SPECIAL = re.compile(r'["\\]')
+_CONTAINER_SPECIAL = re.compile(r'["{}\[\]]')
+_SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+_NUMBER_START = "-0123456789"
+
+
+class ArtifactStreamConstants:
+    """Configuration constants for streamed artifact downloads"""
+
+    # Size of chunks read from the download response (bytes)
+    CHUNK_SIZE = 64 * 1024
+
+    # Artifacts above this size are rejected (bytes)
+    MAX_ARTIFACT_BYTES = 10 * 1024 * 1024
+
+    # S3 multipart upload part size, 5 MiB is the S3 minimum (bytes)
+    S3_PART_SIZE = 8 * 1024 * 1024
+
+
+class _MemberScanner:
+    """
+    Finds where a JSON value starting at the beginning of the text ends, scanning
+    text fed in pieces exactly once. Tracks nesting and strings only, the value
+    is validated by the decoder once complete.
+    """
+
+    def __init__(self) -> None:
+        self.position = 0  # characters scanned
+        self.end: int | None = None  # position after the value once complete
+        self._kind = ""  # container | string | scalar
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def scan(self, text: str, start: int = 0) -> bool:
+        """
+        Scans the next piece of the value, `text[start:]`, returns True once the
+        value is complete.
+        """
+        index = start
+        if not self._kind and start < len(text):
+            index += 1
+            if text[start] in "{[":
+                self._kind, self._depth = "container", 1
+            elif text[start] == '"':
+                self._kind, self._in_string = "string", True
+            else:
+                self._kind = "scalar"
+
+        # special characters are searched with regular expressions, the text
+        # between them is skipped without a Python level loop
+        while index < len(text):
+            if self._escaped:
+                self._escaped = False
+                index += 1
+            elif self._in_string:
+                match = _STRING_SPECIAL.search(text, index)
+                if match is None:
+                    break
+                index = match.end()
+                if match.group() == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                    if self._kind == "string":
+                        return self._complete(index - start)
+            elif self._kind == "scalar":
+                # numbers and literals end at the next delimiter
+                match = _SCALAR_END.search(text, index)
+                if match is None:
+                    break
+                return self._complete(match.start() - start)
+            else:
+                match = _CONTAINER_SPECIAL.search(text, index)
+                if match is None:
+                    break
+                index = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in "{[":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return self._complete(index - start)
+        self.position += len(text) - start
+        return False
+
+    def _complete(self, offset: int) -> bool:
+        self.end = self.position + offset
+        self.position = self.end
+        return True
+
+
+class IncrementalJsonDecoder:
+    """
+    Decodes a JSON document fed in byte chunks.
+
+    The standard library has no streaming JSON parser, so members of the top level
+    object or array are decoded one by one with `json.JSONDecoder.raw_decode`. A
+    member not complete in the received text is scanned as the rest arrives and
+    decoded again only once it is complete, so each member is decoded at most
+    twice and decoding stays linear in the document size. Memory is bounded by
+    the largest top level member, which is buffered as text until it is complete.
+    Scalar documents are buffered whole.
+    """
+
+    def __init__(self) -> None:
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        # read position in the buffer, the consumed prefix is dropped once per
+        # chunk instead of copying the rest of the buffer per member
+        self._index = 0
+        # text of an incomplete member received after the buffer, joined once
+        # the member is complete instead of growing the buffer per chunk
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._scanner: _MemberScanner | None = None
+        self._container: dict[str, Any] | list[Any] | None = None
+        self._pending_key: str | None = None
+        # start | key_or_end | value_or_end | key | colon | value | separator | scalar
+        self._expect = "start"
+        self._closed = False
+
+    @property
+    def buffered(self) -> int:
+        """Number of characters waiting for the rest of their member"""
+        return len(self._buffer) - self._index + self._pending_size
+
+    def feed(self, chunk: bytes) -> None:
+        text = self._bytes_decoder.decode(chunk)
+        if self._scanner is not None and not self._scanner.scan(text):
+            self._pending.append(text)
+            self._pending_size += len(text)
+            return
+        self._join(text)
+        self._consume(final=False)
+
+    def close(self) -> Any:
+        """
+        Finishes decoding and returns the document, raises json.JSONDecodeError
+        when the document is incomplete or malformed.
+        """
+        self._join(self._bytes_decoder.decode(b"", final=True))
+        self._consume(final=True)
+
+        if self._expect == "scalar":
+            document = self._buffer[self._index :].strip()
+            value, end = self._json_decoder.raw_decode(document)
+            if end != len(document):
+                raise json.JSONDecodeError("Extra data", document, end)
+            return value
+        if not self._closed:
+            raise json.JSONDecodeError("Unexpected end of document", self._buffer, 0)
+        if self._buffer[self._index :].strip():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._index)
+        return self._container
+
+    def _join(self, text: str) -> None:
+        self._buffer = "".join([self._buffer[self._index :], *self._pending, text])
+        self._index = 0
+        self._pending.clear()
+        self._pending_size = 0
+
+    def _take(self, final: bool) -> Any:
+        """
+        Decodes one value at the read position, returns `_INCOMPLETE` when more data
+        is needed to tell where the value ends.
+        """
+        if self._scanner is None:
+            # most members arrive whole within a chunk and are decoded right away
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._index)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+            else:
+                # a number continues until a delimiter, `1.` or `2e` may still
+                # continue in the next chunk
+                if final or (
+                    end < len(self._buffer)
+                    and (
+                        self._buffer[self._index] not in _NUMBER_START
+                        or _SCALAR_END.match(self._buffer, end)
+                    )
+                ):
+                    self._index = end
+                    return value
+            # decoded again only once the scanner finds the member end
+            self._scanner = _MemberScanner()
+        scanner = self._scanner
+        if scanner.end is None and not scanner.scan(
+            self._buffer, self._index + scanner.position
+        ):
+            if not final:
+                return _INCOMPLETE
+        self._scanner = None
+        # the member is complete, malformed ones raise here
+        value, self._index = self._json_decoder.raw_decode(self._buffer, self._index)
+        return value
+
+    def _consume(self, final: bool) -> None:
+        while not self._closed:
+            if self._index == len(self._buffer):
+                return
+            char = self._buffer[self._index]
+            if char in _WHITESPACE:
+                # most generated JSON is compact, the regex runs only when needed
+                self._index = _WHITESPACE_RUN.match(self._buffer, self._index).end()
+                continue
+            if self._expect == "scalar":
+                return
+
+            if self._expect == "start":
+                if char == "{":
+                    self._container = {}
+                    self._expect = "key_or_end"
+                elif char == "[":
+                    self._container = []
+                    self._expect = "value_or_end"
+                else:
+                    self._expect = "scalar"
+                    return
+                self._index += 1
+            elif self._expect in ("key_or_end", "value_or_end") and char in "}]":
+                self._finish_container(char)
+            elif self._expect in ("key", "key_or_end"):
+                key = self._take(final)
+                if key is _INCOMPLETE:
+                    return
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError("Expecting property name", "", 0)
+                self._pending_key = key
+                self._expect = "colon"
+            elif self._expect == "colon":
+                if char != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", "", 0)
+                self._index += 1
+                self._expect = "value"
+            elif self._expect in ("value", "value_or_end"):
+                value = self._take(final)
+                if value is _INCOMPLETE:
+                    return
+                self._store(value)
+                self._expect = "separator"
+            elif self._expect == "separator":
+                if char == ",":
+                    self._index += 1
+                    self._expect = (
+                        "key" if isinstance(self._container, dict) else "value"
+                    )
+                elif char in "}]":
+                    self._finish_container(char)
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", "", 0)
+
+    def _store(self, value: Any) -> None:
+        if isinstance(self._container, dict):
+            self._container[self._pending_key] = value
+            self._pending_key = None
+        else:
+            self._container.append(value)
+
+    def _finish_container(self, char: str) -> None:
+        expected = "}" if isinstance(self._container, dict) else "]"
+        if char != expected:
+            raise json.JSONDecodeError(f"Expecting '{expected}'", "", 0)
+        self._index += 1
+        self._closed = True
+
+
+class ArtifactSink(Protocol):
+    """Destination receiving the raw artifact body while it is downloaded"""
+
+    def write(self, chunk: bytes) -> None: ...
+
+    def close(self) -> None: ...
+
+    def abort(self) -> None: ...
+
+
+class FileSink:
+    """Writes artifact body to a local file, e.g. under /tmp"""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._file = self._path.open("wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def abort(self) -> None:
+        self._file.close()
+        self._path.unlink(missing_ok=True)
+
+
+class S3MultipartSink:
+    """
+    Uploads artifact body to S3 with a multipart upload, holding at most one part
+    in memory.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        part_size: int = ArtifactStreamConstants.S3_PART_SIZE,
+        content_type: str = "application/json",
+    ) -> None:
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._parts: list[dict[str, Any]] = []
+        response = s3_client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type
+        )
+        self._upload_id = response["UploadId"]
+
+    def write(self, chunk: bytes) -> None:
+        self._buffer.extend(chunk)
+        if len(self._buffer) >= self._part_size:
+            self._upload_part()
+
+    def close(self) -> None:
+        # the last part may be smaller than the minimum part size
+        if self._buffer or not self._parts:
+            self._upload_part()
+        self._s3_client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        logger.info(
+            f"Uploaded artifact to s3://{self._bucket}/{self._key} in {len(self._parts)} parts"
+        )
+
+    def abort(self) -> None:
+        self._s3_client.abort_multipart_upload(
+            Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+        )
+
+    def _upload_part(self) -> None:
+        part_number = len(self._parts) + 1
+        response = self._s3_client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer.clear()
@@ -2,15 +2,23 @@ import json
 import logging
 from typing import Any
 
-from httpx import AsyncClient, HTTPStatusError
+from httpx import AsyncClient, HTTPStatusError, Response
 
+from ..http_cache import HttpCache
 from ..rest_client import RestClient, RestClientConfig
+from .artifact_stream import (
+    ArtifactSink,
+    ArtifactStreamConstants,
+    IncrementalJsonDecoder,
+)
 from .errors import (
     ArtifactFileError,
+    ArtifactTooLargeError,
     InvalidResponseError,
     PipelineStatusError,
     PipelineTriggerError,
 )
+from .rate_limiter import RequestScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +56,41 @@ class BitbucketClientConfig(RestClientConfig):
 class BitbucketClient(RestClient):
     """Provides shared Bitbucket API logic"""
 
-    def __init__(self, client: AsyncClient, config: BitbucketClientConfig) -> None:
-        super().__init__(client, config)
+    def __init__(
+        self,
+        client: AsyncClient,
+        config: BitbucketClientConfig,
+        cache: HttpCache | None = None,
+        scheduler: RequestScheduler | None = None,
+    ) -> None:
+        super().__init__(client, config, cache)
         self._config = config
+        self._scheduler = scheduler
+
+    async def _get(self, url: str, *args, **kwargs) -> Response:
+        if self._scheduler is None:
+            return await super()._get(url, *args, **kwargs)
+        return await self._scheduler.send(
+            lambda: super(BitbucketClient, self)._get(url, *args, **kwargs)
+        )
+
+    async def _post(self, url: str, *args, **kwargs) -> Response:
+        if self._scheduler is None:
+            return await super()._post(url, *args, **kwargs)
+        # a failed trigger may still have started the pipeline, only 429 is retried
+        return await self._scheduler.send(
+            lambda: super(BitbucketClient, self)._post(url, *args, **kwargs),
+            retry_server_errors=False,
+        )
+
+    async def _open_stream(self, url: str, **kwargs) -> Response:
+        if self._scheduler is None:
+            return await super()._open_stream(url, **kwargs)
+        # the status is known before the body is read, throttled and failed
+        # downloads are retried like any other request
+        return await self._scheduler.send(
+            lambda: super(BitbucketClient, self)._open_stream(url, **kwargs)
+        )
 
     def _get_repo_api_url(self, repo_slug: str) -> str:
         """Build the repository API URL for the given repository slug"""
@@ -166,12 +206,15 @@ class BitbucketClient(RestClient):
             )
             raise PipelineStatusError(f"Unexpected error: {e}") from e
 
+    def _get_artifact_url(self, repo_slug: str, filename: str) -> str:
+        return f"{self._get_repo_api_url(repo_slug)}{BitbucketConstants.DOWNLOADS_PATH}/{filename}"
+
     async def get_file_from_artifacts(self, repo_slug: str, filename: str) -> Any:
         """
         Retrieves file content from repository artifacts.
         """
         try:
-            downloads_path = f"{self._get_repo_api_url(repo_slug)}{BitbucketConstants.DOWNLOADS_PATH}/{filename}"
+            downloads_path = self._get_artifact_url(repo_slug, filename)
             logger.info(f"Fetching file from artifacts: {filename}")
 
             response = await self._get(downloads_path, follow_redirects=True)
@@ -204,3 +247,82 @@ class BitbucketClient(RestClient):
             raise ArtifactFileError(
                 f"Unexpected error fetching {filename} file: {e}"
             ) from e
+
+    async def stream_file_from_artifacts(
+        self,
+        repo_slug: str,
+        filename: str,
+        max_bytes: int = ArtifactStreamConstants.MAX_ARTIFACT_BYTES,
+        sink: ArtifactSink | None = None,
+        parse_json: bool = True,
+    ) -> Any:
+        """
+        Retrieves JSON file from repository artifacts in chunks, without holding
+        the whole body in memory. The raw body is optionally passed to a sink
+        (local file, S3). Returns None when parse_json is disabled.
+        """
+        decoder = IncrementalJsonDecoder() if parse_json else None
+        received = 0
+        try:
+            downloads_path = self._get_artifact_url(repo_slug, filename)
+            logger.info(f"Streaming file from artifacts: {filename}")
+
+            async with self._stream(downloads_path, follow_redirects=True) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                content_length = int(response.headers.get("content-length", 0))
+                if content_length > max_bytes:
+                    raise ArtifactTooLargeError(
+                        f"Artifact file {filename} has {content_length} bytes, limit is {max_bytes}"
+                    )
+
+                async for chunk in response.aiter_bytes(
+                    ArtifactStreamConstants.CHUNK_SIZE
+                ):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise ArtifactTooLargeError(
+                            f"Artifact file {filename} exceeds {max_bytes} bytes"
+                        )
+                    if sink:
+                        sink.write(chunk)
+                    if decoder:
+                        decoder.feed(chunk)
+
+            file_data = decoder.close() if decoder else None
+            if sink:
+                sink.close()
+            logger.info(
+                f"Successfully streamed {received} bytes of file {filename} from repo {repo_slug}"
+            )
+            return file_data
+
+        except json.JSONDecodeError as e:
+            if sink:
+                sink.abort()
+            logger.error(f"Failed to parse streamed file JSON: {e}")
+            raise InvalidResponseError(f"Invalid JSON in commits file: {e}") from e
+        except ArtifactFileError:
+            if sink:
+                sink.abort()
+            raise
+        except HTTPStatusError as e:
+            if sink:
+                sink.abort()
+            logger.error(
+                f"HTTP error streaming file: {e.response.status_code} - {e.response.text}"
+            )
+            raise ArtifactFileError(
+                f"Failed to fetch artifact file: HTTP {e.response.status_code}"
+            ) from e
+        except Exception as e:
+            if sink:
+                sink.abort()
+            logger.error(
+                f"Unexpected error streaming {filename} file for {repo_slug} repo: {e}"
+            )
+            raise ArtifactFileError(
+                f"Unexpected error fetching {filename} file: {e}"
+            ) from e
@@ -0,0 +1,124 @@
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Any, Coroutine, TypeVar
+
+from httpx import AsyncClient, Limits
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ClientPoolConstants:
+    """Configuration constants for BitbucketClientPool"""
+
+    # Connection pool limits
+    MAX_CONNECTIONS = 10
+    MAX_KEEPALIVE_CONNECTIONS = 5
+    KEEPALIVE_EXPIRY = 120.0  # seconds an idle connection is kept open
+
+    # Default timeout for API requests (seconds)
+    DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass
+class ClientPoolStats:
+    """Client reuse counters, kept for the lifetime of the execution environment"""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class BitbucketClientPool:
+    """
+    Keeps one httpx.AsyncClient and one event loop alive across warm Lambda invocations.
+
+    The client's connections belong to the loop that opened them, so every coroutine
+    using the pooled client has to be run through `run` rather than `asyncio.run`.
+    """
+
+    def __init__(
+        self,
+        timeout: float = ClientPoolConstants.DEFAULT_TIMEOUT,
+        max_connections: int = ClientPoolConstants.MAX_CONNECTIONS,
+        max_keepalive_connections: int = ClientPoolConstants.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = ClientPoolConstants.KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+    ) -> None:
+        self._timeout = timeout
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # HTTP/2 needs the optional `h2` package, fall back to HTTP/1.1 keep-alive
+        self._http2 = _h2_available() if http2 is None else http2
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: AsyncClient | None = None
+        self.stats = ClientPoolStats()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            # connections opened on a previous loop cannot be reused
+            self._client = None
+        return self._loop
+
+    def get_client(self) -> AsyncClient:
+        """
+        Returns the pooled client, creating it on first use or after it was closed.
+        """
+        self._get_loop()
+        if self._client is not None and not self._client.is_closed:
+            self.stats.hits += 1
+            return self._client
+
+        self.stats.misses += 1
+        logger.info(f"Creating pooled Bitbucket HTTP client (http2={self._http2})")
+        self._client = AsyncClient(
+            timeout=self._timeout, limits=self._limits, http2=self._http2
+        )
+        return self._client
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Runs coroutine to completion on the persistent event loop.
+        """
+        loop = self._get_loop()
+        result = loop.run_until_complete(coro)
+        logger.info(f"Bitbucket client pool stats: {self.stats}")
+        return result
+
+    def close(self) -> None:
+        """
+        Closes pooled client and event loop.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._client = None
+            return
+        if self._client is not None and not self._client.is_closed:
+            self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
+        self._client = None
+        self._loop = None
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+_pool: BitbucketClientPool | None = None
+
+
+def get_client_pool(
+    timeout: float = ClientPoolConstants.DEFAULT_TIMEOUT,
+) -> BitbucketClientPool:
+    """
+    Returns module level pool, shared by all invocations of the execution environment.
+    """
+    global _pool
+    if _pool is None:
+        _pool = BitbucketClientPool(timeout=timeout)
+    return _pool
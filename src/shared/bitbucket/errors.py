@@ -38,3 +38,9 @@ class InvalidResponseError(BitbucketError):
     """Raised when API response is invalid or malformed"""
 
     pass
+
+
+class ArtifactTooLargeError(ArtifactFileError):
+    """Raised when artifact file exceeds the allowed size"""
+
+    pass
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from .type import BitbucketPipelineStatus
+
+if TYPE_CHECKING:
+    # bitbucket_client uses BackoffPolicy through the rate limiter
+    from .bitbucket_client import BitbucketClient
+
+logger = logging.getLogger(__name__)
+
+
+class PollerConstants:
+    """Configuration constants for PipelinePoller"""
+
+    # Backoff configuration
+    INITIAL_INTERVAL = 2.0  # seconds before the second status check
+    MULTIPLIER = 2.0
+    MAX_INTERVAL = 30.0  # upper bound for a single wait
+    JITTER = 0.2  # +/- fraction of the interval
+
+    # Time kept free at the end of a Lambda invocation (seconds)
+    SAFETY_MARGIN = 10.0
+
+
+@dataclass
+class BackoffPolicy:
+    """Exponential backoff with proportional jitter"""
+
+    initial_interval: float = PollerConstants.INITIAL_INTERVAL
+    multiplier: float = PollerConstants.MULTIPLIER
+    max_interval: float = PollerConstants.MAX_INTERVAL
+    jitter: float = PollerConstants.JITTER
+
+    def interval(self, attempt: int) -> float:
+        """
+        Returns wait time before the next status check, attempt counts from 0.
+        """
+        base = min(self.initial_interval * self.multiplier**attempt, self.max_interval)
+        spread = base * self.jitter
+        return max(0.0, base + random.uniform(-spread, spread))
+
+
+class Deadline:
+    """Point in time after which polling stops"""
+
+    def __init__(
+        self, seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._clock = clock
+        self._expires_at = clock() + seconds
+
+    @classmethod
+    def from_context(
+        cls,
+        context: Any,
+        safety_margin: float = PollerConstants.SAFETY_MARGIN,
+        max_duration: float | None = None,
+    ) -> "Deadline":
+        """
+        Builds deadline from Lambda remaining time, optionally capped by max_duration.
+        """
+        seconds = context.get_remaining_time_in_millis() / 1000 - safety_margin
+        if max_duration is not None:
+            seconds = min(seconds, max_duration)
+        return cls(max(0.0, seconds))
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+
+@dataclass
+class PollResult:
+    """Outcome of polling a single pipeline"""
+
+    status: BitbucketPipelineStatus
+    response: dict[str, Any] = field(repr=False)
+    polls: int
+    waited: float  # seconds spent sleeping between polls
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status.is_terminal
+
+
+class PipelinePoller:
+    """Polls Bitbucket pipeline status with exponential backoff until a terminal state"""
+
+    def __init__(
+        self,
+        bitbucket_client: "BitbucketClient",
+        repo_slug: str,
+        backoff: BackoffPolicy | None = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self._bitbucket_client = bitbucket_client
+        self._repo_slug = repo_slug
+        self._backoff = backoff or BackoffPolicy()
+        self._sleep = sleep
+
+    async def check(self, pipeline_uuid: str) -> PollResult:
+        """
+        Checks pipeline status once.
+        """
+        response = await self._bitbucket_client.check_pipeline_status(
+            repo_slug=self._repo_slug, execution_uuid=pipeline_uuid
+        )
+        status = BitbucketPipelineStatus(response["state"]["name"])
+        logger.info(
+            f"Pipeline {pipeline_uuid} for {self._repo_slug} status: {status.value}"
+        )
+        return PollResult(status=status, response=response, polls=1, waited=0.0)
+
+    async def wait(
+        self,
+        pipeline_uuid: str,
+        deadline: Deadline | None = None,
+        max_polls: int | None = None,
+    ) -> PollResult:
+        """
+        Polls until pipeline reaches a terminal state, the deadline passes
+        or max_polls checks were made. Returns the last observed result.
+        """
+        polls = 0
+        waited = 0.0
+
+        while True:
+            result = await self.check(pipeline_uuid)
+            polls += 1
+
+            if result.is_terminal:
+                break
+            if max_polls is not None and polls >= max_polls:
+                break
+            remaining = deadline.remaining() if deadline else float("inf")
+            if remaining <= 0:
+                break
+
+            delay = min(self._backoff.interval(polls - 1), remaining)
+            logger.info(
+                f"Pipeline {pipeline_uuid} status: {result.status.value}, waiting {delay:.1f}s..."
+            )
+            await self._sleep(delay)
+            waited += delay
+
+        result.polls = polls
+        result.waited = waited
+        logger.info(
+            f"Polling of pipeline {pipeline_uuid} finished with status {result.status.value} "
+            f"after {polls} polls and {waited:.1f}s of waiting"
+        )
+        return result
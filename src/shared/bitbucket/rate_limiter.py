@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from httpx import Headers, Response
+
+from .poller import BackoffPolicy, Deadline
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiterConstants:
+    """Configuration constants for RequestScheduler"""
+
+    # Token bucket configuration
+    RATE = 1.0  # requests per second refilled
+    CAPACITY = 10  # burst size
+    NEAR_LIMIT_FACTOR = 0.25  # rate multiplier while Bitbucket reports near limit
+
+    # Retry configuration
+    MAX_RETRIES = 4
+    RETRY_INITIAL_INTERVAL = 1.0
+    RETRY_MAX_INTERVAL = 30.0
+    MAX_RETRY_AFTER = 60.0  # longest Retry-After honoured (seconds)
+
+    # Bitbucket rate limit headers
+    RETRY_AFTER_HEADER = "retry-after"
+    NEAR_LIMIT_HEADER = "x-ratelimit-nearlimit"
+
+
+@dataclass
+class SchedulerStats:
+    """Scheduler counters, kept for the lifetime of the execution environment"""
+
+    requests: int = 0
+    throttled: int = 0  # 429 responses
+    server_errors: int = 0  # 5xx responses
+    retries: int = 0
+    queued_time: float = 0.0  # seconds spent waiting for a token
+    retry_wait_time: float = 0.0  # seconds spent waiting before retries
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "queued_time": round(self.queued_time, 3),
+            "retry_wait_time": round(self.retry_wait_time, 3),
+        }
+
+
+class TokenBucket:
+    """Paces requests to `rate` per second with bursts up to `capacity`"""
+
+    def __init__(
+        self,
+        rate: float = RateLimiterConstants.RATE,
+        capacity: int = RateLimiterConstants.CAPACITY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self._base_rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    @property
+    def is_slowed(self) -> bool:
+        return self.rate != self._base_rate
+
+    def slow_down(self, factor: float) -> None:
+        self.rate = self._base_rate * factor
+
+    def restore(self) -> None:
+        self.rate = self._base_rate
+
+    def pause(self, seconds: float) -> None:
+        """Holds all requests, e.g. while Retry-After is in effect"""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    async def acquire(self) -> float:
+        """
+        Waits until a request may be sent, returns the time spent waiting.
+        """
+        waited = 0.0
+        # requests are served in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                delay = self._paused_until - self._clock()
+                if delay <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                if delay <= 0:
+                    delay = (1 - self._tokens) / self.rate
+                await self._sleep(delay)
+                waited += delay
+
+
+class RequestScheduler:
+    """
+    Sends Bitbucket API requests through a token bucket and retries throttled
+    (429) and failed (5xx) requests with backoff, honouring Retry-After.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket | None = None,
+        max_retries: int = RateLimiterConstants.MAX_RETRIES,
+        backoff: BackoffPolicy | None = None,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self._bucket = bucket or TokenBucket()
+        self._max_retries = max_retries
+        self._backoff = backoff or BackoffPolicy(
+            initial_interval=RateLimiterConstants.RETRY_INITIAL_INTERVAL,
+            max_interval=RateLimiterConstants.RETRY_MAX_INTERVAL,
+        )
+        self._sleep = sleep
+        self._deadline: Deadline | None = None
+        self.stats = SchedulerStats()
+
+    def set_deadline(self, deadline: Deadline | None) -> None:
+        """
+        Limits waits before retries to the time left in the invocation, the
+        scheduler outlives invocations so each one sets its own deadline.
+        """
+        self._deadline = deadline
+
+    async def acquire(self) -> None:
+        """Waits for a token without sending a request"""
+        self.stats.requests += 1
+        self.stats.queued_time += await self._bucket.acquire()
+
+    async def send(
+        self,
+        call: Callable[[], Awaitable[Response]],
+        retry_server_errors: bool = True,
+    ) -> Response:
+        """
+        Sends request built by `call`. Server errors are only retried when
+        `retry_server_errors` is set, non idempotent requests may have been applied.
+        Returns the last response once retries are exhausted or waiting for the
+        next attempt would exceed the deadline.
+        """
+        attempt = 0
+        while True:
+            await self.acquire()
+            response = await call()
+            self._observe(response.headers)
+
+            retry_after = None
+            if response.status_code == 429:
+                self.stats.throttled += 1
+                retry_after = self._retry_after(response.headers)
+            elif response.status_code >= 500 and retry_server_errors:
+                self.stats.server_errors += 1
+            else:
+                return response
+
+            if attempt >= self._max_retries:
+                logger.error(
+                    f"Giving up on {response.request.url} after {attempt + 1} attempts, "
+                    f"last status: {response.status_code}"
+                )
+                return response
+
+            delay = (
+                retry_after
+                if retry_after is not None
+                else self._backoff.interval(attempt)
+            )
+            if self._deadline is not None and delay > self._deadline.remaining():
+                logger.error(
+                    f"Giving up on {response.request.url}, retrying in {delay:.1f}s "
+                    f"would exceed the deadline, last status: {response.status_code}"
+                )
+                return response
+
+            await response.aclose()
+            if retry_after is not None:
+                # pausing the bucket holds concurrent requests as well,
+                # the wait is counted as queued time
+                logger.warning(f"Bitbucket throttled requests for {retry_after:.1f}s")
+                self._bucket.pause(retry_after)
+            else:
+                logger.warning(
+                    f"Request to {response.request.url} returned {response.status_code}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                await self._sleep(delay)
+                self.stats.retry_wait_time += delay
+            self.stats.retries += 1
+            attempt += 1
+
+    def _observe(self, headers: Headers) -> None:
+        if headers.get(RateLimiterConstants.NEAR_LIMIT_HEADER, "").lower() == "true":
+            if not self._bucket.is_slowed:
+                logger.warning("Bitbucket rate limit is near, slowing down requests")
+            self._bucket.slow_down(RateLimiterConstants.NEAR_LIMIT_FACTOR)
+        else:
+            self._bucket.restore()
+
+    def _retry_after(self, headers: Headers) -> float | None:
+        value = headers.get(RateLimiterConstants.RETRY_AFTER_HEADER)
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(0.0, seconds), RateLimiterConstants.MAX_RETRY_AFTER)
+
+
+_scheduler: RequestScheduler | None = None
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """
+    Returns module level scheduler, shared by all invocations of the execution
+    environment.
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = RequestScheduler()
+    return _scheduler
@@ -1,5 +1,9 @@
 from enum import Enum
 
+UUID_IN_BRACES_PATTERN = (
+    r"^\{[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\}$"
+)
+
 
 class BitbucketPipelineStatus(str, Enum):
     """Pipeline execution status constants"""
@@ -14,3 +18,10 @@ class BitbucketPipelineStatus(str, Enum):
     @classmethod
     def _missing_(cls, value):
         return cls.UNKNOWN
+
+    @property
+    def is_terminal(self) -> bool:
+        return self in (
+            BitbucketPipelineStatus.COMPLETED,
+            BitbucketPipelineStatus.FAILED,
+        )
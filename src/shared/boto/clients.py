@@ -0,0 +1,133 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ..lazy_import import lazy_import
+
+# clients are created after request validation, keep boto3 out of cold start imports
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistryConstants:
+    """Configuration constants for ClientRegistry"""
+
+    # botocore connection pool tuning
+    MAX_POOL_CONNECTIONS = 20
+    CONNECT_TIMEOUT = 5  # seconds
+    READ_TIMEOUT = 30  # seconds
+    MAX_ATTEMPTS = 5
+    RETRY_MODE = "standard"
+
+    # Upper bound of kept clients, old credentials are evicted first
+    MAX_CLIENTS = 64
+
+
+@dataclass
+class ClientRegistryStats:
+    """Client reuse counters, kept for the lifetime of the execution environment"""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class ClientRegistry:
+    """
+    Memoizes boto3 clients per (service, region, credentials), so that warm
+    invocations reuse clients together with their connection pools.
+    """
+
+    def __init__(self, max_clients: int = ClientRegistryConstants.MAX_CLIENTS) -> None:
+        self._clients: OrderedDict[tuple, Any] = OrderedDict()
+        self._max_clients = max_clients
+        self._session: Any = None
+        self._lock = threading.Lock()
+        self.stats = ClientRegistryStats()
+
+    def get_session(self) -> Any:
+        """
+        Returns default boto3 session, created once per execution environment.
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = boto3.Session()
+            return self._session
+
+    def get_client(
+        self, service_name: str, session: Any = None, region_name: str | None = None
+    ) -> Any:
+        """
+        Returns cached client of the given session, default session when not set.
+        """
+        session = session or self.get_session()
+        # the credentials object identifies the caller, sessions sharing it
+        # (one per assumed role) share clients. Reading its access key would
+        # refresh expiring credentials on this thread.
+        credentials = session.get_credentials()
+        key = (service_name, region_name or session.region_name, credentials)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.stats.hits += 1
+                return client
+
+            self.stats.misses += 1
+            logger.info(f"Creating boto3 client for {service_name}")
+            client_kwargs: dict[str, Any] = {"config": _client_config()}
+            if region_name:
+                client_kwargs["region_name"] = region_name
+            # boto3 sessions are not thread safe, clients are created under the lock
+            client = session.client(service_name, **client_kwargs)
+            self._clients[key] = client
+            while len(self._clients) > self._max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._session = None
+            self.stats = ClientRegistryStats()
+
+
+def _client_config() -> Any:
+    return botocore_config.Config(
+        max_pool_connections=ClientRegistryConstants.MAX_POOL_CONNECTIONS,
+        connect_timeout=ClientRegistryConstants.CONNECT_TIMEOUT,
+        read_timeout=ClientRegistryConstants.READ_TIMEOUT,
+        retries={
+            "max_attempts": ClientRegistryConstants.MAX_ATTEMPTS,
+            "mode": ClientRegistryConstants.RETRY_MODE,
+        },
+        tcp_keepalive=True,
+    )
+
+
+_registry = ClientRegistry()
+
+
+def get_client(
+    service_name: str, session: Any = None, region_name: str | None = None
+) -> Any:
+    """
+    Returns boto3 client shared by all invocations of the execution environment.
+    """
+    return _registry.get_client(service_name, session=session, region_name=region_name)
+
+
+def get_session() -> Any:
+    """
+    Returns default boto3 session shared by all invocations of the execution
+    environment.
+    """
+    return _registry.get_session()
+
+
+def get_registry() -> ClientRegistry:
+    return _registry
@@ -1,10 +1,12 @@
 import boto3
 
+from .clients import get_client
+
 
 def cognito_user_exists(
     session: boto3.Session, user_pool_id: str, username: str
 ) -> bool:
-    client = session.client("cognito-idp")
+    client = get_client("cognito-idp", session=session)
     try:
         client.admin_get_user(UserPoolId=user_pool_id, Username=username)
         return True
@@ -15,7 +17,7 @@ def cognito_user_exists(
 def set_cognito_user_password(
     session: boto3.Session, user_pool_id: str, username: str, new_password: str
 ) -> None:
-    client = session.client("cognito-idp")
+    client = get_client("cognito-idp", session=session)
     client.admin_set_user_password(
         UserPoolId=user_pool_id,
         Username=username,
@@ -0,0 +1,286 @@
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from .clients import get_client
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigStoreConstants:
+    """Configuration constants for ConfigStore"""
+
+    # Seconds a value is served from memory before it is fetched again
+    TTL = 300
+
+    # GetParameters accepts at most 10 names per call
+    GET_PARAMETERS_BATCH_SIZE = 10
+
+    # GetParametersByPath returns at most 10 parameters per page
+    GET_PARAMETERS_BY_PATH_PAGE_SIZE = 10
+
+
+@dataclass
+class CachedValue:
+    """Parameter or secret value together with its version"""
+
+    value: str
+    arn: str
+    version: str
+    expires_at: float  # inf for pinned versions, which never change
+
+
+@dataclass
+class ConfigStoreStats:
+    """Store counters, kept for the lifetime of the execution environment"""
+
+    hits: int = 0
+    misses: int = 0  # no entry or entry expired
+    api_calls: int = 0
+    version_changes: int = 0  # refreshed entry had a newer version
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 3)}
+
+
+def _is_pinned_parameter(name: str) -> bool:
+    """`/name:3` selects an immutable version, labels (`/name:prod`) can move"""
+    _, _, selector = name.rpartition(":")
+    return ":" in name and selector.isdigit()
+
+
+def _credentials_key(session: Any) -> Any:
+    """Credentials object of the session, reading its keys could refresh them"""
+    return session.get_credentials() if session is not None else None
+
+
+class ConfigStore:
+    """
+    Serves SSM parameters and Secrets Manager secrets from memory for a per key
+    TTL, so that warm invocations do not call the APIs again.
+
+    Missing parameters are fetched with a single GetParameters call per 10 names,
+    whole namespaces with paginated GetParametersByPath calls.
+    Explicitly versioned reads never expire, and a refreshed parameter never
+    replaces a cached one of a newer version.
+    """
+
+    def __init__(
+        self,
+        ttl: float = ConfigStoreConstants.TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: dict[tuple, CachedValue] = {}
+        # names found under a path, values are kept in `_entries`
+        self._paths: dict[tuple, tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+        self.stats = ConfigStoreStats()
+
+    def _lookup(self, key: tuple) -> CachedValue | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self.stats.hits += 1
+                return entry
+            self.stats.misses += 1
+            return None
+
+    def _store(
+        self, key: tuple, entry: CachedValue, numeric_version: bool
+    ) -> CachedValue:
+        """Caches the entry, returns the entry that is served from now on"""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.version != entry.version:
+                if numeric_version and int(entry.version) < int(cached.version):
+                    # reads are eventually consistent, keep the newer value
+                    logger.warning(
+                        f"Ignoring version {entry.version} of {key[1]}, "
+                        f"version {cached.version} is cached"
+                    )
+                    cached.expires_at = entry.expires_at
+                    return cached
+                self.stats.version_changes += 1
+                logger.info(f"{key[1]} changed to version {entry.version}")
+            self._entries[key] = entry
+            return entry
+
+    def _expires_at(self, pinned: bool, ttl: float | None) -> float:
+        if pinned:
+            return float("inf")
+        return self._clock() + (self._ttl if ttl is None else ttl)
+
+    def get_parameters(
+        self,
+        names: list[str],
+        session: Any = None,
+        with_decryption: bool = False,
+        ttl: float | None = None,
+    ) -> dict[str, CachedValue]:
+        """
+        Returns cached or fetched values by name. Names SSM does not know are left
+        out of the result, raises botocore ClientError when a call fails.
+        """
+        credentials_key = _credentials_key(session)
+        result: dict[str, CachedValue] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            key = ("ssm", name, with_decryption, credentials_key)
+            entry = self._lookup(key)
+            if entry is None:
+                missing.append(name)
+            else:
+                result[name] = entry
+
+        if not missing:
+            return result
+
+        ssm = get_client("ssm", session=session)
+        batch_size = ConfigStoreConstants.GET_PARAMETERS_BATCH_SIZE
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            self.stats.api_calls += 1
+            resp = ssm.get_parameters(Names=batch, WithDecryption=with_decryption)
+            for p in resp["Parameters"]:
+                # versioned names are returned with their selector
+                name = p["Name"] + p.get("Selector", "")
+                key = ("ssm", name, with_decryption, credentials_key)
+                result[name] = self._store(
+                    key,
+                    CachedValue(
+                        value=p["Value"],
+                        arn=p["ARN"],
+                        version=str(p.get("Version", "")),
+                        expires_at=self._expires_at(_is_pinned_parameter(name), ttl),
+                    ),
+                    numeric_version="Version" in p,
+                )
+        return result
+
+    def get_parameters_by_path(
+        self,
+        path: str,
+        session: Any = None,
+        with_decryption: bool = False,
+        ttl: float | None = None,
+    ) -> dict[str, CachedValue]:
+        """
+        Returns all parameters of the `path` subtree by name, raises botocore
+        ClientError when a call fails.
+        """
+        credentials_key = _credentials_key(session)
+        path_key = ("ssm-path", path, with_decryption, credentials_key)
+        with self._lock:
+            expires_at, names = self._paths.get(path_key, (0.0, []))
+            entries = [
+                self._entries.get(("ssm", name, with_decryption, credentials_key))
+                for name in names
+            ]
+            # a single invalidated parameter refetches the whole subtree
+            if expires_at > self._clock() and all(entries):
+                self.stats.hits += 1
+                return dict(zip(names, entries))  # type: ignore[arg-type]
+            self.stats.misses += 1
+
+        ssm = get_client("ssm", session=session)
+        paginator = ssm.get_paginator("get_parameters_by_path")
+        result: dict[str, CachedValue] = {}
+        pages = paginator.paginate(
+            Path=path,
+            Recursive=True,
+            WithDecryption=with_decryption,
+            PaginationConfig={
+                "PageSize": ConfigStoreConstants.GET_PARAMETERS_BY_PATH_PAGE_SIZE
+            },
+        )
+        for page in pages:
+            self.stats.api_calls += 1
+            for p in page["Parameters"]:
+                key = ("ssm", p["Name"], with_decryption, credentials_key)
+                result[p["Name"]] = self._store(
+                    key,
+                    CachedValue(
+                        value=p["Value"],
+                        arn=p["ARN"],
+                        version=str(p.get("Version", "")),
+                        expires_at=self._expires_at(False, ttl),
+                    ),
+                    numeric_version="Version" in p,
+                )
+
+        with self._lock:
+            self._paths[path_key] = (self._expires_at(False, ttl), list(result))
+        return result
+
+    def get_secret(
+        self,
+        secret_id: str,
+        session: Any = None,
+        version_id: str | None = None,
+        ttl: float | None = None,
+    ) -> CachedValue:
+        """
+        Returns cached or fetched secret string, raises botocore ClientError when
+        the call fails.
+        """
+        key = ("secretsmanager", secret_id, version_id, _credentials_key(session))
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        sm = get_client("secretsmanager", session=session)
+        kwargs: dict[str, Any] = {"SecretId": secret_id}
+        if version_id:
+            kwargs["VersionId"] = version_id
+        self.stats.api_calls += 1
+        resp = sm.get_secret_value(**kwargs)
+        if "SecretString" not in resp:
+            raise ValueError(f"Secret {secret_id} has no SecretString")
+
+        entry = CachedValue(
+            value=resp["SecretString"],
+            arn=resp["ARN"],
+            version=resp.get("VersionId", ""),
+            # a version id always refers to the same secret value
+            expires_at=self._expires_at(version_id is not None, ttl),
+        )
+        return self._store(key, entry, numeric_version=False)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        Drops cached entries of the given parameter or secret, all when not set,
+        e.g. after the value was rotated by the same execution environment.
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                self._paths.clear()
+                return
+            for key in [k for k in self._entries if k[1] == name]:
+                del self._entries[key]
+            for key in [k for k in self._paths if k[1] == name]:
+                del self._paths[key]
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.stats = ConfigStoreStats()
+
+
+_store = ConfigStore()
+
+
+def get_config_store() -> ConfigStore:
+    """
+    Returns parameter and secret store shared by all invocations of the execution
+    environment.
+    """
+    return _store
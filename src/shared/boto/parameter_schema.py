@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Any
+
+from .config_store import CachedValue
+
+
+@dataclass(frozen=True)
+class ParameterField:
+    """Parameter of a namespace, `key` is relative to the namespace path"""
+
+    key: str
+    required: bool = True
+    default: str | None = None
+
+
+class ParameterSchema:
+    """
+    Declarative mapping of a parameter namespace into model fields. Every field is
+    filled with the parameter value and `<field>_arn` with its ARN when
+    `with_arns` is set.
+    """
+
+    def __init__(self, fields: dict[str, ParameterField], with_arns: bool = True):
+        self.fields = fields
+        self.with_arns = with_arns
+
+    @staticmethod
+    def namespace(path: str) -> str:
+        return "/" + path.strip("/") + "/"
+
+    def missing(self, path: str, params: dict[str, CachedValue]) -> list[str]:
+        """Full names of required parameters absent from `params`"""
+        namespace = self.namespace(path)
+        return [
+            namespace + field.key
+            for field in self.fields.values()
+            if field.required and namespace + field.key not in params
+        ]
+
+    def load(self, path: str, params: dict[str, CachedValue]) -> dict[str, Any]:
+        """
+        Returns model field values, raises ValueError listing missing required
+        parameters.
+        """
+        missing = self.missing(path, params)
+        if missing:
+            raise ValueError(f"Missing SSM params: {missing}")
+
+        namespace = self.namespace(path)
+        values: dict[str, Any] = {}
+        for attr, field in self.fields.items():
+            param = params.get(namespace + field.key)
+            values[attr] = param.value if param else field.default
+            if self.with_arns:
+                values[f"{attr}_arn"] = param.arn if param else None
+        return values
@@ -0,0 +1,122 @@
+import io
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class S3RangeReaderConstants:
+    """Configuration constants for ranged S3 reads"""
+
+    # Minimum bytes fetched per GetObject call, small reads of zipfile headers
+    # are served from the same block (bytes)
+    BLOCK_SIZE = 256 * 1024
+
+
+@dataclass
+class S3RangeReaderStats:
+    requests: int = 0
+    bytes_fetched: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"requests": self.requests, "bytes_fetched": self.bytes_fetched}
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over an S3 object, reads are served with
+    ranged GetObject calls.
+
+    Lets zipfile read the central directory at the end of an archive and then
+    only the members it opens, without downloading the whole archive. The
+    object is pinned to the ETag seen when opening, a concurrent overwrite fails
+    the read instead of mixing two versions.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        block_size: int = S3RangeReaderConstants.BLOCK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._block_size = block_size
+        self._position = 0
+        # last fetched range, [start, start + len(data))
+        self._block_start = 0
+        self._block = b""
+        self.stats = S3RangeReaderStats()
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+        self._size: int = head["ContentLength"]
+        self._etag: str = head["ETag"]
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        """Bytes [start, end) of the object"""
+        response = self._s3_client.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={start}-{end - 1}",
+            IfMatch=self._etag,
+        )
+        data = response["Body"].read()
+        self.stats.requests += 1
+        self.stats.bytes_fetched += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        start = self._position
+        end = min(start + len(buffer), self._size)
+        if start >= end:
+            return 0
+
+        block_end = self._block_start + len(self._block)
+        if not (self._block_start <= start and end <= block_end):
+            fetch_end = min(max(end, start + self._block_size), self._size)
+            self._block = self._fetch(start, fetch_end)
+            self._block_start = start
+
+        offset = start - self._block_start
+        data = self._block[offset : offset + end - start]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            logger.debug(
+                f"Read s3://{self._bucket}/{self._key}: {self.stats.as_dict()}"
+            )
+        self._block = b""
+        super().close()
@@ -1,9 +1,10 @@
 import boto3
 
+from .clients import get_client
 from .models import SecretResponse
 
 
 def get_secret(session: boto3.Session, name: str) -> SecretResponse:
-    client = session.client("secretsmanager")
+    client = get_client("secretsmanager", session=session)
     resp = client.get_secret_value(SecretId=name)
     return SecretResponse(value=resp["SecretString"], arn=resp["ARN"])
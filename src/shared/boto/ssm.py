@@ -1,10 +1,11 @@
 import boto3
 
+from .clients import get_client
 from .models import SSMResponse
 
 
 def get_ssm_param(session: boto3.Session, name: str) -> SSMResponse:
-    client = session.client("ssm")
+    client = get_client("ssm", session=session)
     resp = client.get_parameter(Name=name, WithDecryption=True)
     assert "Parameter" in resp
     assert "Value" in resp["Parameter"]
@@ -1,4 +1,30 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import boto3
+import botocore.session
+from botocore.credentials import (
+    CredentialProvider,
+    CredentialResolver,
+    RefreshableCredentials,
+)
+
+from .clients import get_client
+
+logger = logging.getLogger(__name__)
+
+
+class AssumedRoleConstants:
+    """Configuration constants for AssumedRoleSessionProvider"""
+
+    DURATION_SECONDS = 3600
+
+    # Background refresh starts this long before expiry (seconds), ahead of
+    # the botocore advisory refresh window (15 minutes) in which the first
+    # caller reading the credentials calls STS on its own thread
+    REFRESH_MARGIN = 20 * 60
 
 
 def assume_role(role_arn: str, session_name: str) -> boto3.Session:
@@ -11,3 +37,136 @@ def assume_role(role_arn: str, session_name: str) -> boto3.Session:
         aws_secret_access_key=creds["SecretAccessKey"],
         aws_session_token=creds["SessionToken"],
     )
+
+
+class AssumedRoleCredentials(RefreshableCredentials):
+    """Refreshable credentials which can be renewed before botocore would"""
+
+    def refresh_early(self, refresh_in: float) -> None:
+        """
+        Renews credentials expiring within `refresh_in` seconds. Skipped when
+        another thread is already refreshing them, a failed renewal keeps the
+        current credentials, as in the botocore advisory window.
+        """
+        # botocore only exposes refreshing on read inside its own windows,
+        # the renewal reuses its lock and non-mandatory refresh
+        if not self._refresh_lock.acquire(False):
+            return
+        try:
+            if self.refresh_needed(refresh_in):
+                self._protected_refresh(is_mandatory=False)
+        finally:
+            self._refresh_lock.release()
+
+
+class _AssumedRoleCredentialProvider(CredentialProvider):
+    """Hands out the credentials of one assumed role to a botocore session"""
+
+    METHOD = "sts-assume-role"
+    CANONICAL_NAME = "custom-sts-assume-role"
+
+    def __init__(self, credentials: AssumedRoleCredentials) -> None:
+        super().__init__()
+        self._credentials = credentials
+
+    def load(self) -> AssumedRoleCredentials:
+        return self._credentials
+
+
+class AssumedRoleSessionProvider:
+    """
+    Keeps one session per (role ARN, session name) across warm invocations.
+
+    Sessions use botocore refreshable credentials, which are renewed on use once
+    they get close to expiry. When a cached session is handed out within the
+    refresh margin, before the botocore refresh windows, the renewal is started
+    in a background thread, so the STS call does not block the invocation while
+    current credentials are still valid.
+    """
+
+    def __init__(
+        self,
+        sts_client: Any = None,
+        duration_seconds: int = AssumedRoleConstants.DURATION_SECONDS,
+        refresh_margin: float = AssumedRoleConstants.REFRESH_MARGIN,
+    ) -> None:
+        self._sts_client = sts_client
+        self._duration_seconds = duration_seconds
+        self._refresh_margin = refresh_margin
+        self._sessions: dict[
+            tuple[str, str], tuple[boto3.Session, AssumedRoleCredentials]
+        ] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get_session(self, role_arn: str, session_name: str) -> boto3.Session:
+        key = (role_arn, session_name)
+        with self._lock:
+            cached = self._sessions.get(key)
+            if cached is None:
+                cached = self._create_session(role_arn, session_name)
+                self._sessions[key] = cached
+                return cached[0]
+
+        session, credentials = cached
+        if credentials.refresh_needed(self._refresh_margin):
+            self._refresh_in_background(role_arn, credentials)
+        return session
+
+    def _create_session(
+        self, role_arn: str, session_name: str
+    ) -> tuple[boto3.Session, AssumedRoleCredentials]:
+        def _fetch() -> dict[str, str]:
+            logger.info(f"Assuming role {role_arn}")
+            sts = self._sts_client or get_client("sts")
+            resp = sts.assume_role(
+                RoleArn=role_arn,
+                RoleSessionName=session_name,
+                DurationSeconds=self._duration_seconds,
+            )
+            creds = resp["Credentials"]
+            return {
+                "access_key": creds["AccessKeyId"],
+                "secret_key": creds["SecretAccessKey"],
+                "token": creds["SessionToken"],
+                "expiry_time": creds["Expiration"].isoformat(),
+            }
+
+        credentials = AssumedRoleCredentials.create_from_metadata(
+            metadata=_fetch(), refresh_using=_fetch, method="sts-assume-role"
+        )
+        botocore_session = botocore.session.Session()
+        botocore_session.register_component(
+            "credential_provider",
+            CredentialResolver([_AssumedRoleCredentialProvider(credentials)]),
+        )
+        return boto3.Session(botocore_session=botocore_session), credentials
+
+    def _refresh_in_background(
+        self, role_arn: str, credentials: AssumedRoleCredentials
+    ) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="assume-role-refresh"
+            )
+        logger.info(f"Refreshing credentials of {role_arn} in background")
+        self._executor.submit(credentials.refresh_early, self._refresh_margin)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+
+_provider = AssumedRoleSessionProvider()
+
+
+def get_assumed_role_session(role_arn: str, session_name: str) -> boto3.Session:
+    """
+    Returns cached session of the assumed role, shared by all invocations of
+    the execution environment.
+    """
+    return _provider.get_session(role_arn, session_name)
+
+
+def get_session_provider() -> AssumedRoleSessionProvider:
+    return _provider
@@ -0,0 +1,75 @@
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Iterator
+
+
+class ExecutionArchiveConstants:
+    """Configuration constants for archived Execution Records"""
+
+    PREFIX = "execution_records_archive"
+    SUFFIX = ".jsonl.gz"
+    CONTENT_TYPE = "application/x-ndjson"
+
+
+def partition_prefix(day: date, prefix: str = ExecutionArchiveConstants.PREFIX) -> str:
+    """Hive style partition of records created on `day`, e.g. for Athena"""
+    return f"{prefix}/year={day.year:04d}/month={day.month:02d}/day={day.day:02d}/"
+
+
+def archive_key(
+    created_at: str,
+    batch_id: str,
+    prefix: str = ExecutionArchiveConstants.PREFIX,
+) -> str:
+    """
+    Object key of an archive batch, records are partitioned by their CreatedAt
+    day. A `batch_id` stable across retries (e.g. the sequence number of the
+    first record) makes retried uploads overwrite the same object.
+    """
+    day = datetime.fromisoformat(created_at).date()
+    return (
+        f"{partition_prefix(day, prefix)}{batch_id}{ExecutionArchiveConstants.SUFFIX}"
+    )
+
+
+def encode_records(records: Iterable[dict[str, Any]]) -> bytes:
+    """Gzip compressed JSON Lines"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as archive:
+        for record in records:
+            archive.write(json.dumps(record, default=str).encode() + b"\n")
+    return buffer.getvalue()
+
+
+def decode_records(stream: Any) -> Iterator[dict[str, Any]]:
+    """Decodes an archive line by line from a file like object"""
+    with gzip.GzipFile(fileobj=stream, mode="rb") as archive:
+        for line in archive:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_archive(
+    s3_client: Any,
+    bucket: str,
+    created_from: date,
+    created_to: date,
+    prefix: str = ExecutionArchiveConstants.PREFIX,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields archived records created between the given days (inclusive). Only the
+    partitions of these days are listed and objects are streamed, not loaded whole.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    day = created_from
+    while day <= created_to:
+        pages = paginator.paginate(Bucket=bucket, Prefix=partition_prefix(day, prefix))
+        for page in pages:
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith(ExecutionArchiveConstants.SUFFIX):
+                    continue
+                body = s3_client.get_object(Bucket=bucket, Key=obj["Key"])["Body"]
+                yield from decode_records(body)
+        day += timedelta(days=1)
@@ -0,0 +1,213 @@
+import base64
+import heapq
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from shared.domain.models.execution_record import ExecutionRecordModel
+from shared.domain.models.status import StatusList
+
+logger = logging.getLogger(__name__)
+
+# attributes the index pagination key is built from, always read
+_KEY_ATTRIBUTES = ("Id", "Status", "CreatedAt")
+
+
+class ExecutionHistoryConstants:
+    """Configuration constants for Execution Record history queries"""
+
+    PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 500
+
+    # Statuses are queried in parallel, one index query each
+    MAX_WORKERS = len(StatusList)
+
+
+@dataclass
+class ExecutionPage:
+    """Records ordered by CreatedAt and the cursor of the next page"""
+
+    items: list[dict[str, Any]]
+    cursor: str | None  # None on the last page
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> dict[str, Any] | None:
+    """Raises ValueError when the cursor was not created by this module"""
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(position, dict):
+        raise ValueError("Invalid cursor")
+    return position
+
+
+def _start_key(item: dict[str, Any]) -> dict[str, Any]:
+    """Exclusive start key of the index, continuing after `item`"""
+    return {name: {"S": item[name]} for name in _KEY_ATTRIBUTES}
+
+
+def _project(
+    record: ExecutionRecordModel, attributes: list[str] | None
+) -> dict[str, Any]:
+    data = record.to_dict()
+    if attributes is None:
+        return data
+    return {name: data.get(name) for name in {*attributes, *_KEY_ATTRIBUTES}}
+
+
+def _range_condition(created_from: str | None, created_to: str | None) -> Any:
+    created_at = ExecutionRecordModel.CreatedAt
+    if created_from and created_to:
+        return created_at.between(created_from, created_to)
+    if created_from:
+        return created_at >= created_from
+    if created_to:
+        return created_at <= created_to
+    return None
+
+
+def _validate_limit(limit: int) -> None:
+    if not 1 <= limit <= ExecutionHistoryConstants.MAX_PAGE_SIZE:
+        raise ValueError(
+            f"limit must be between 1 and {ExecutionHistoryConstants.MAX_PAGE_SIZE}"
+        )
+
+
+def _query_items(
+    status: StatusList,
+    created_from: str | None,
+    created_to: str | None,
+    limit: int,
+    start_key: dict[str, Any] | None,
+    attributes: list[str] | None,
+    newest_first: bool,
+) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Returns at most `limit` items of a status and whether more items may follow.
+    """
+    attributes_to_get = (
+        None if attributes is None else sorted({*attributes, *_KEY_ATTRIBUTES})
+    )
+    results = ExecutionRecordModel.status_created_at_index.query(
+        status.value,
+        range_key_condition=_range_condition(created_from, created_to),
+        scan_index_forward=not newest_first,
+        limit=limit,
+        last_evaluated_key=start_key,
+        attributes_to_get=attributes_to_get,
+    )
+    items = [_project(record, attributes) for record in results]
+    return items, results.last_evaluated_key is not None
+
+
+def query_by_status(
+    status: StatusList,
+    created_from: str | None = None,
+    created_to: str | None = None,
+    limit: int = ExecutionHistoryConstants.PAGE_SIZE,
+    cursor: str | None = None,
+    attributes: list[str] | None = None,
+    newest_first: bool = True,
+) -> ExecutionPage:
+    """
+    Pages through records of a status with CreatedAt in the given (ISO 8601) range.
+    Only the key attributes and `attributes` are read when `attributes` is set.
+    """
+    _validate_limit(limit)
+    start_key = decode_cursor(cursor)
+    items, has_more = _query_items(
+        status, created_from, created_to, limit, start_key, attributes, newest_first
+    )
+    next_cursor = encode_cursor(_start_key(items[-1])) if has_more and items else None
+    return ExecutionPage(items=items, cursor=next_cursor)
+
+
+def query_by_statuses(
+    statuses: list[StatusList],
+    created_from: str | None = None,
+    created_to: str | None = None,
+    limit: int = ExecutionHistoryConstants.PAGE_SIZE,
+    cursor: str | None = None,
+    attributes: list[str] | None = None,
+    newest_first: bool = True,
+) -> ExecutionPage:
+    """
+    Queries several statuses in parallel and merges the records by CreatedAt.
+
+    The cursor keeps a position per status, so that records fetched but not
+    returned in this page are read again for the next one.
+    """
+    _validate_limit(limit)
+    positions = decode_cursor(cursor) or {s.value: None for s in statuses}
+    # statuses missing from a cursor have no records left
+    pending = [s for s in statuses if s.value in positions]
+
+    def query(status: StatusList) -> tuple[list[dict[str, Any]], bool]:
+        start_key = positions[status.value]
+        return _query_items(
+            status, created_from, created_to, limit, start_key, attributes, newest_first
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(pending), ExecutionHistoryConstants.MAX_WORKERS) or 1
+    ) as executor:
+        results = dict(zip(pending, executor.map(query, pending)))
+
+    merged = heapq.merge(
+        *(items for items, _ in results.values()),
+        key=lambda item: item["CreatedAt"],
+        reverse=newest_first,
+    )
+    page = [item for _, item in zip(range(limit), merged)]
+
+    next_positions = {}
+    for status, (items, has_more) in results.items():
+        returned = [item for item in page if item["Status"] == status.value]
+        if len(returned) < len(items):
+            # continue after the last returned record of the status
+            last = returned[-1] if returned else None
+            next_positions[status.value] = (
+                _start_key(last) if last else positions[status.value]
+            )
+        elif has_more and items:
+            next_positions[status.value] = _start_key(items[-1])
+
+    logger.info(
+        f"Queried {len(pending)} statuses, returned {len(page)} of "
+        f"{sum(len(items) for items, _ in results.values())} records"
+    )
+    return ExecutionPage(
+        items=page, cursor=encode_cursor(next_positions) if next_positions else None
+    )
+
+
+def recent_failures(limit: int = 10) -> list[dict[str, Any]]:
+    """Last `limit` failed executions, newest first"""
+    return query_by_status(StatusList.failure, limit=limit).items
+
+
+def runs_since(
+    days: int = 7,
+    limit: int = ExecutionHistoryConstants.PAGE_SIZE,
+    cursor: str | None = None,
+    attributes: list[str] | None = None,
+) -> ExecutionPage:
+    """Executions of any status created during the last `days` days, newest first"""
+    created_from = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    return query_by_statuses(
+        list(StatusList),
+        created_from=created_from,
+        limit=limit,
+        cursor=cursor,
+        attributes=attributes,
+    )
@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from pynamodb.exceptions import DoesNotExist, UpdateError
+
+from shared.domain.models.execution_record import ExecutionRecordModel, record_expiry
+from shared.domain.models.status import StatusList
+from shared.domain.status_transitions import allowed_predecessors
+
+# maintained by the repository, never taken from the caller
+_MANAGED_ATTRIBUTES = {"Id", "CreatedAt", "UpdatedAt", "ExpiresAt"}
+
+
+class ExecutionRecordNotFound(Exception):
+    """Raised when an Execution Record does not exist"""
+
+    pass
+
+
+class ExecutionRecordConflict(Exception):
+    """Raised when a conditional update of an Execution Record is rejected"""
+
+    pass
+
+
+class ExecutionRecordRepository:
+    """
+    Reads and updates Execution Records directly in DynamoDB, for Lambdas that
+    need a record without going through the execution record handler.
+    """
+
+    @staticmethod
+    def get(record_id: str) -> dict[str, Any]:
+        """
+        Strongly consistent read, reflects every write acknowledged before it.
+        Raises ExecutionRecordNotFound when the record does not exist.
+        """
+        try:
+            record = ExecutionRecordModel.get(record_id, consistent_read=True)
+        except DoesNotExist as e:
+            raise ExecutionRecordNotFound(
+                f"Execution Record {record_id} does not exist"
+            ) from e
+        return record.to_dict()
+
+    @staticmethod
+    def update(
+        record_id: str,
+        fields: dict[str, Any],
+        expected_status: str | None = None,
+        expected_updated_at: str | None = None,
+    ) -> ExecutionRecordModel:
+        """
+        Writes only the given fields of an existing record with a single
+        UpdateItem call and returns the new image, without reading the record first.
+
+        The record must exist, must not have been updated later than now and its
+        stored status must allow the transition to the new one. `expected_status` /
+        `expected_updated_at` additionally require the stored values to match.
+        None values remove the attribute. Raises ExecutionRecordConflict when a
+        condition is not met.
+        """
+        updated_at = datetime.now(timezone.utc)
+        now = updated_at.isoformat()
+
+        attributes = ExecutionRecordModel.get_attributes()
+        actions = []
+        for name, value in fields.items():
+            if name in _MANAGED_ATTRIBUTES or name not in attributes:
+                continue
+            attribute = attributes[name]
+            if value is None:
+                actions.append(attribute.remove())
+            else:
+                actions.append(attribute.set(value))
+        actions.append(ExecutionRecordModel.UpdatedAt.set(now))
+        actions.append(ExecutionRecordModel.ExpiresAt.set(record_expiry(updated_at)))
+
+        # a delayed write must not roll back a newer one
+        condition = ExecutionRecordModel.Id.exists() & (
+            ExecutionRecordModel.UpdatedAt < now
+        )
+        if fields.get("Status"):
+            condition &= ExecutionRecordModel.Status.is_in(
+                *allowed_predecessors(StatusList(fields["Status"]))
+            )
+        if expected_status:
+            condition &= ExecutionRecordModel.Status == expected_status
+        if expected_updated_at:
+            condition &= ExecutionRecordModel.UpdatedAt == expected_updated_at
+
+        record = ExecutionRecordModel(record_id)
+        try:
+            # UpdateItem returns ALL_NEW, the model is filled from the response
+            record.update(actions=actions, condition=condition)
+        except UpdateError as e:
+            if e.cause_response_code == "ConditionalCheckFailedException":
+                raise ExecutionRecordConflict(
+                    f"Execution Record {record_id} does not exist, was modified "
+                    f"concurrently or does not allow status {fields.get('Status')}"
+                ) from e
+            raise
+        return record
+
+    @staticmethod
+    def set_status(
+        record_id: str, status: StatusList, **fields: Any
+    ) -> ExecutionRecordModel:
+        """Moves the record to `status`, retried writes of the same status succeed"""
+        return ExecutionRecordRepository.update(
+            record_id, {**fields, "Status": status.value}
+        )
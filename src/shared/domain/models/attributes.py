@@ -0,0 +1,81 @@
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from pynamodb.attributes import Attribute, UnicodeAttribute
+from pynamodb.constants import MAP, NULL
+
+
+class LazyMap(Mapping[str, Any]):
+    """
+    Read-only view of a DynamoDB map, entries are decoded on first access.
+
+    Keys are kept as stored (wire names), the raw map returned by DynamoDB is
+    referenced, not copied.
+    """
+
+    __slots__ = ("_raw", "_value_attribute", "_decoded")
+
+    def __init__(self, raw: dict[str, dict[str, Any]], value_attribute: Attribute):
+        self._raw = raw
+        self._value_attribute = value_attribute
+        self._decoded: dict[str, Any] | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._decoded is not None and key in self._decoded:
+            return self._decoded[key]
+        typed_value = self._raw[key]
+        value = (
+            None
+            if NULL in typed_value
+            else self._value_attribute.deserialize(
+                typed_value[self._value_attribute.attr_type]
+            )
+        )
+        if self._decoded is None:
+            self._decoded = {}
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {key: self[key] for key in self._raw}
+
+
+class LazyMapAttribute(Attribute[Mapping[str, Any]]):
+    """
+    Map with arbitrary keys whose values share the type of `value_attribute`,
+    e.g. service name -> commit hash. Loaded values are LazyMap instances, any
+    Mapping can be assigned.
+    """
+
+    attr_type = MAP
+    map_class: type[LazyMap] = LazyMap
+
+    def __init__(self, value_attribute: Attribute | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.value_attribute = value_attribute or UnicodeAttribute()
+
+    def serialize(self, value: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+        if (
+            isinstance(value, LazyMap)
+            and value._value_attribute is self.value_attribute
+        ):
+            # unchanged map read from DynamoDB, written back as is
+            return value._raw
+        return {
+            key: {NULL: True}
+            if item is None
+            else {self.value_attribute.attr_type: self.value_attribute.serialize(item)}
+            for key, item in value.items()
+        }
+
+    def deserialize(self, value: dict[str, dict[str, Any]]) -> LazyMap:
+        return self.map_class(value, self.value_attribute)
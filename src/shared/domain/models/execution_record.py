@@ -0,0 +1,99 @@
+import os
+from datetime import datetime, timedelta
+
+from pynamodb.attributes import MapAttribute, TTLAttribute, UnicodeAttribute
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
+from pynamodb.models import Model
+
+from .attributes import LazyMap, LazyMapAttribute
+
+# shared by the Lambdas accessing the Execution Record table
+AWS_REGION_ENV_VAR = "REGION"
+TABLE_NAME_ENV_VAR = "TABLE_NAME"
+SECONDARY_INDEX_NAME_ENV_VAR = "SECONDARY_INDEX_NAME"
+RETENTION_DAYS_ENV_VAR = "RECORD_RETENTION_DAYS"
+
+
+class ExecutionRecordConstants:
+    """Configuration constants for Execution Records"""
+
+    # Days after the last update a record is expired by DynamoDB TTL
+    # and archived to S3
+    RETENTION_DAYS = 180
+
+
+def record_expiry(updated_at: datetime) -> datetime:
+    """ExpiresAt of a record last updated at `updated_at`"""
+    days = int(
+        os.environ.get(RETENTION_DAYS_ENV_VAR)
+        or ExecutionRecordConstants.RETENTION_DAYS
+    )
+    return updated_at + timedelta(days=days)
+
+
+class StatusCreatedAtIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = os.environ.get(SECONDARY_INDEX_NAME_ENV_VAR)
+        read_capacity_units = 1
+        write_capacity_units = 1
+        projection = AllProjection()
+
+    Status = UnicodeAttribute(hash_key=True)
+    CreatedAt = UnicodeAttribute(range_key=True)
+
+
+class DeployedServices(LazyMap):
+    """Deployed service name -> commit hash, keyed by service (repository) name"""
+
+    __slots__ = ()
+
+
+class DeployedServicesAttribute(LazyMapAttribute):
+    """
+    Services are stored under their repository names, new services need no
+    model change.
+    """
+
+    map_class = DeployedServices
+
+
+class ExecutionRecordModel(Model):
+    class Meta:  # type: ignore
+        table_name = os.environ.get(TABLE_NAME_ENV_VAR)
+        region = os.environ.get(AWS_REGION_ENV_VAR)
+
+    Id = UnicodeAttribute(hash_key=True)
+    Status = UnicodeAttribute()
+    WorkloadVersion = UnicodeAttribute(null=True)
+    DeployedServices = DeployedServicesAttribute(null=True)
+    DataPortalUrl = UnicodeAttribute(null=True)
+    DeploymentId = UnicodeAttribute(null=True)
+    SubscriptionTestReportUrl = UnicodeAttribute(null=True)
+    VerificationTestReportUrl = UnicodeAttribute(null=True)
+    TeardownTestReportUrl = UnicodeAttribute(null=True)
+    FailureReason = UnicodeAttribute(null=True)
+    # per suite and total test counts, written with the final report
+    TestResults = MapAttribute(null=True)
+    CreatedAt = UnicodeAttribute()
+    UpdatedAt = UnicodeAttribute()
+    ExpiresAt = TTLAttribute(null=True)
+    status_created_at_index = StatusCreatedAtIndex()
+
+    def to_dict(self) -> dict:
+        return {
+            "Id": self.Id,
+            "Status": self.Status,
+            "WorkloadVersion": self.WorkloadVersion,
+            "DeployedServices": dict(self.DeployedServices)
+            if self.DeployedServices
+            else None,
+            "DataPortalUrl": self.DataPortalUrl,
+            "DeploymentId": self.DeploymentId,
+            "SubscriptionTestReportUrl": self.SubscriptionTestReportUrl,
+            "VerificationTestReportUrl": self.VerificationTestReportUrl,
+            "TeardownTestReportUrl": self.TeardownTestReportUrl,
+            "FailureReason": self.FailureReason,
+            "TestResults": self.TestResults.as_dict() if self.TestResults else None,
+            "CreatedAt": self.CreatedAt,
+            "UpdatedAt": self.UpdatedAt,
+        }
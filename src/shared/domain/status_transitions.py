@@ -0,0 +1,73 @@
+from shared.domain.models.status import StatusList
+
+# Statuses a new Execution Record may be created with
+INITIAL_STATUSES = frozenset({StatusList.initialized})
+
+# Statuses after which nothing but a retried write of the same status follows
+TERMINAL_STATUSES = frozenset({StatusList.success, StatusList.failure})
+
+REQUIRED_FIELDS_BY_STATUS = {
+    StatusList.initialized: [],
+    StatusList.deployedServices: ["Id", "DeployedServices"],
+    StatusList.operationsPortalTestsDone: [
+        "Id",
+        "DataPortalUrl",
+        "DeploymentId",
+        "WorkloadVersion",
+        "SubscriptionTestReportUrl",
+    ],
+    StatusList.dataPortalVerificationTestsDone: ["Id", "VerificationTestReportUrl"],
+    StatusList.dataPortalTeardownTestsDone: ["Id", "TeardownTestReportUrl"],
+    StatusList.finalReport: ["Id"],
+    StatusList.failure: ["Id", "FailureReason"],
+    StatusList.success: ["Id"],
+}
+
+# Test phases run in order, the final report may be generated after any of them
+# (dry runs stop after the operations portal tests, failures stop anywhere).
+# Failure is written after the failure report, or directly when reporting fails.
+_NEXT_STATUSES = {
+    StatusList.initialized: {StatusList.deployedServices},
+    StatusList.deployedServices: {StatusList.operationsPortalTestsDone},
+    StatusList.operationsPortalTestsDone: {StatusList.dataPortalVerificationTestsDone},
+    StatusList.dataPortalVerificationTestsDone: {
+        StatusList.dataPortalTeardownTestsDone
+    },
+    StatusList.dataPortalTeardownTestsDone: set(),
+    StatusList.finalReport: {StatusList.success},
+    StatusList.success: set(),
+    StatusList.failure: set(),
+}
+
+
+def _build_transitions() -> dict[StatusList, frozenset[StatusList]]:
+    transitions = {}
+    for status, next_statuses in _NEXT_STATUSES.items():
+        allowed = {status, *next_statuses}  # Step Functions retries repeat writes
+        if status not in TERMINAL_STATUSES:
+            allowed |= {StatusList.finalReport, StatusList.failure}
+        transitions[status] = frozenset(allowed)
+    return transitions
+
+
+# status -> statuses that may follow it
+ALLOWED_TRANSITIONS = _build_transitions()
+
+# status -> statuses it may follow, used as DynamoDB condition on the stored status
+ALLOWED_PREDECESSORS: dict[StatusList, frozenset[StatusList]] = {
+    status: frozenset(
+        previous
+        for previous, allowed in ALLOWED_TRANSITIONS.items()
+        if status in allowed
+    )
+    for status in StatusList
+}
+
+
+def is_allowed_transition(previous: StatusList, status: StatusList) -> bool:
+    return status in ALLOWED_TRANSITIONS[previous]
+
+
+def allowed_predecessors(status: StatusList) -> list[str]:
+    """Stored status values the given status may be written over"""
+    return sorted(previous.value for previous in ALLOWED_PREDECESSORS[status])
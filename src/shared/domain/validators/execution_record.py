@@ -16,6 +16,7 @@ class ExecutionRecord(BaseModel):
     VerificationTestReportUrl: Optional[str] = None
     TeardownTestReportUrl: Optional[str] = None
     FailureReason: Optional[str] = None
+    TestResults: Optional[dict[str, Any]] = None
     CreatedAt: str
     UpdatedAt: str
 
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Protocol
+
+from httpx import AsyncClient, Response
+
+from .lazy_import import lazy_import
+
+# only needed when responses are shared through DynamoDB
+boto3 = lazy_import("boto3")
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCacheConstants:
+    """Configuration constants for HttpCache"""
+
+    # In-process LRU configuration
+    MAX_ENTRIES = 256
+    TTL = 900  # seconds an entry is kept for revalidation
+
+    # DynamoDB items are limited to 400 KB, larger bodies are kept in-process only
+    MAX_SHARED_ENTRY_BYTES = 350 * 1024
+
+    # Response headers kept with a cached body
+    STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body together with its validators"""
+
+    status_code: int
+    content: bytes = field(repr=False)
+    headers: dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class HttpCacheStats:
+    """Cache counters, kept for the lifetime of the execution environment"""
+
+    hits: int = 0  # revalidated with 304, body served from cache
+    misses: int = 0  # no entry, full body fetched
+    stale: int = 0  # entry present, but the resource changed
+    stores: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.stale
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 3)}
+
+
+class CacheBackend(Protocol):
+    """Storage of cache entries"""
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """LRU with TTL kept in the Lambda execution environment"""
+
+    def __init__(
+        self,
+        max_entries: int = HttpCacheConstants.MAX_ENTRIES,
+        ttl: float = HttpCacheConstants.TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._clock() - entry.stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class DynamoDBCacheBackend:
+    """
+    Shares entries between Lambdas through a DynamoDB table with `CacheKey`
+    hash key and `ExpiresAt` TTL attribute.
+    """
+
+    def __init__(
+        self,
+        table: Any,
+        ttl: float = HttpCacheConstants.TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._table = table
+        self._ttl = ttl
+        self._clock = clock
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            item = self._table.get_item(Key={"CacheKey": key}).get("Item")
+        except Exception as e:
+            logger.warning(f"Failed to read HTTP cache entry: {e}")
+            return None
+        # DynamoDB TTL deletion is delayed, expiry is checked on read as well
+        if item is None or int(item["ExpiresAt"]) < self._clock():
+            return None
+        return CacheEntry(
+            status_code=int(item["StatusCode"]),
+            content=bytes(item["Content"]),
+            headers=json.loads(item["Headers"]),
+            stored_at=float(item["StoredAt"]),
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if len(entry.content) > HttpCacheConstants.MAX_SHARED_ENTRY_BYTES:
+            return
+        try:
+            self._table.put_item(
+                Item={
+                    "CacheKey": key,
+                    "StatusCode": entry.status_code,
+                    "Content": entry.content,
+                    "Headers": json.dumps(entry.headers),
+                    "StoredAt": str(entry.stored_at),
+                    "ExpiresAt": int(entry.stored_at + self._ttl),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store HTTP cache entry: {e}")
+
+
+class TieredCacheBackend:
+    """In-process entries backed by a shared backend"""
+
+    def __init__(self, local: CacheBackend, shared: CacheBackend) -> None:
+        self._local = local
+        self._shared = shared
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._local.get(key)
+        if entry is None:
+            entry = self._shared.get(key)
+            if entry is not None:
+                self._local.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._local.set(key, entry)
+        self._shared.set(key, entry)
+
+
+class HttpCache:
+    """
+    Conditional GET cache honouring ETag and Last-Modified validators.
+
+    Every request is revalidated, a 304 answer is turned into a response carrying
+    the cached body, so callers see the same response as for a full fetch.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._backend = backend or InMemoryCacheBackend()
+        self._clock = clock
+        self.stats = HttpCacheStats()
+
+    def _cache_key(self, client: AsyncClient, url: str, params: Any) -> str:
+        request = client.build_request("GET", url, params=params)
+        # responses depend on the caller's permissions
+        authorization = request.headers.get("authorization", "")
+        raw_key = f"{request.url}|{authorization}"
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    async def get(self, client: AsyncClient, url: str, **kwargs) -> Response:
+        key = self._cache_key(client, url, kwargs.get("params"))
+        entry = self._backend.get(key)
+
+        if entry is not None:
+            kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+        response = await client.get(url, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            self.stats.hits += 1
+            return Response(
+                status_code=entry.status_code,
+                headers=entry.headers,
+                content=entry.content,
+                request=response.request,
+            )
+
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.stale += 1
+
+        if response.status_code == 200 and (
+            "etag" in response.headers or "last-modified" in response.headers
+        ):
+            await response.aread()
+            self._backend.set(
+                key,
+                CacheEntry(
+                    status_code=response.status_code,
+                    content=response.content,
+                    headers={
+                        name: response.headers[name]
+                        for name in HttpCacheConstants.STORED_HEADERS
+                        if name in response.headers
+                    },
+                    stored_at=self._clock(),
+                ),
+            )
+            self.stats.stores += 1
+        return response
+
+
+_cache: HttpCache | None = None
+
+
+def get_http_cache(shared_table_name: str | None = None) -> HttpCache:
+    """
+    Returns module level cache, shared by all invocations of the execution
+    environment. Entries are also shared between Lambdas when a table is given.
+    """
+    global _cache
+    if _cache is None:
+        backend: CacheBackend = InMemoryCacheBackend()
+        if shared_table_name:
+            table = boto3.resource("dynamodb").Table(shared_table_name)
+            backend = TieredCacheBackend(backend, DynamoDBCacheBackend(table))
+        _cache = HttpCache(backend=backend)
+    return _cache
@@ -0,0 +1,26 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns module which is executed on first attribute access.
+
+    Used for heavy dependencies (boto3, jinja2) needed only after request
+    validation, so that invocations failing early and cold starts skip their
+    import time. `from module import name` forces the import, access the
+    attributes through the returned module instead.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -1,4 +1,9 @@
-from httpx import AsyncClient, Response
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from httpx import USE_CLIENT_DEFAULT, AsyncClient, Response
+
+from .http_cache import HttpCache
 
 
 class RestClientConfig:
@@ -10,16 +15,40 @@ class RestClientConfig:
 
 class RestClient:
     def __init__(
-        self, client: AsyncClient, config: RestClientConfig | None = None
+        self,
+        client: AsyncClient,
+        config: RestClientConfig | None = None,
+        cache: HttpCache | None = None,
     ) -> None:
         if config:
             config.apply(client)
         self._client = client
+        self._cache = cache
 
     async def _get(self, url: str, *args, **kwargs) -> "Response":
+        if self._cache and not args:
+            return await self._cache.get(self._client, url, **kwargs)
         response = await self._client.get(url, *args, **kwargs)
         return response
 
     async def _post(self, url: str, *args, **kwargs) -> "Response":
         response = await self._client.post(url, *args, **kwargs)
         return response
+
+    async def _open_stream(
+        self, url: str, follow_redirects=USE_CLIENT_DEFAULT, **kwargs
+    ) -> "Response":
+        """Sends GET request without reading the body, the caller closes the response"""
+        request = self._client.build_request("GET", url, **kwargs)
+        return await self._client.send(
+            request, stream=True, follow_redirects=follow_redirects
+        )
+
+    @asynccontextmanager
+    async def _stream(self, url: str, **kwargs) -> AsyncIterator[Response]:
+        """Streams GET response, body has to be read inside the context"""
+        response = await self._open_stream(url, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
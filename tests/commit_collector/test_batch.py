@@ -0,0 +1,115 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.lambdas.commit_collector import handler
+from src.lambdas.commit_collector.models.params import RequestParams
+from src.lambdas.commit_collector.services.commit_collector import CommitCollector
+from src.shared.bitbucket.errors import PipelineFailedError
+
+
+def _target(bb_env_name: str, osdu_version: str) -> dict:
+    return {
+        "environment": bb_env_name,
+        "osdu_version": osdu_version,
+        "bb_env_code": bb_env_name,
+        "bb_env_name": bb_env_name,
+    }
+
+
+def _collector(delays: dict[str, float], failing: set[str]) -> CommitCollector:
+    collector = CommitCollector(bitbucket_client=MagicMock())
+    running = {"now": 0, "peak": 0}
+
+    async def _get_commits(bb_env_name, osdu, deadline=None):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(delays[bb_env_name])
+        running["now"] -= 1
+        if bb_env_name in failing:
+            raise PipelineFailedError(f"Pipeline for {bb_env_name} failed")
+        return {"service": f"{bb_env_name}-{osdu.value}"}
+
+    collector.get_commits = _get_commits
+    collector.running = running
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_targets_concurrently():
+    collector = _collector({"dev": 0.2, "qa": 0.2, "preprod": 0.2}, failing=set())
+    targets = [
+        RequestParams.model_validate(_target(env, "r3m25"))
+        for env in ("dev", "qa", "preprod")
+    ]
+
+    started = time.monotonic()
+    results, errors = await collector.get_commits_batch(targets, max_concurrency=5)
+
+    assert time.monotonic() - started < 0.5
+    assert errors == {}
+    assert results["qa/r3m25"] == {"service": "qa-r3m25"}
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_concurrency_limit_and_reports_errors():
+    collector = _collector({"dev": 0.01, "qa": 0.01, "preprod": 0.01}, {"qa"})
+    targets = [
+        RequestParams.model_validate(_target(env, "r3m24"))
+        for env in ("dev", "qa", "preprod")
+    ]
+
+    results, errors = await collector.get_commits_batch(targets, max_concurrency=2)
+
+    assert collector.running["peak"] == 2
+    assert set(results) == {"dev/r3m24", "preprod/r3m24"}
+    assert errors == {
+        "qa/r3m24": {
+            "errorType": "PipelineFailedError",
+            "message": "Pipeline for qa failed",
+        }
+    }
+
+
+@patch.object(handler, "get_token_from_envs", return_value="token")
+def test_handler_batch_validation_error(_token):
+    response = handler.lambda_handler({"targets": []}, MagicMock())
+
+    assert response["statusCode"] == 400
+    assert "targets" in response["body"]["message"]
+
+
+@patch.object(handler, "get_token_from_envs", return_value="token")
+@patch.object(handler, "_collect_batch_hashes")
+def test_handler_batch_returns_results_and_errors(mock_collect, _token):
+    mock_collect.return_value = (
+        {"dev/r3m25": {"a": "1"}},
+        {"qa/r3m25": {"errorType": "E"}},
+    )
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 60_000
+
+    response = handler.lambda_handler(
+        {"targets": [_target("dev", "r3m25"), _target("qa", "r3m25")]}, context
+    )
+
+    assert response["statusCode"] == 200
+    assert response["body"] == {
+        "results": {"dev/r3m25": {"a": "1"}},
+        "errors": {"qa/r3m25": {"errorType": "E"}},
+    }
+
+
+@patch.object(handler, "get_token_from_envs", return_value="token")
+@patch.object(handler, "_collect_batch_hashes")
+def test_handler_batch_all_failed(mock_collect, _token):
+    mock_collect.return_value = ({}, {"dev/r3m25": {}})
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 60_000
+
+    response = handler.lambda_handler({"targets": [_target("dev", "r3m25")]}, context)
+
+    assert response["statusCode"] == 502
+    assert response["body"]["error"] == "BatchCollectionError"
@@ -0,0 +1,49 @@
+import threading
+import time
+
+import pytest
+
+from src.lambdas.config_composer.models.errors import ConfigFetchError
+from src.lambdas.config_composer.services.concurrent_fetch import fetch_concurrently
+
+
+def test_groups_run_concurrently():
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fetch(value):
+        # both groups must be running at the same time to pass the barrier
+        barrier.wait()
+        return value
+
+    results = fetch_concurrently({"ssm": lambda: fetch(1), "secrets": lambda: fetch(2)})
+
+    assert results == {"ssm": 1, "secrets": 2}
+
+
+def test_partial_failure_is_reported():
+    def failing():
+        raise RuntimeError("access denied")
+
+    with pytest.raises(ConfigFetchError) as exc_info:
+        fetch_concurrently({"ssm": failing, "secrets": lambda: "secret"})
+
+    assert exc_info.value.failures == {"ssm": "access denied"}
+    assert exc_info.value.fetched == ["secrets"]
+    assert str(exc_info.value) == "ssm: access denied"
+
+
+def test_slow_group_times_out():
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return "late"
+
+    started = time.monotonic()
+    with pytest.raises(ConfigFetchError) as exc_info:
+        fetch_concurrently({"ssm": slow, "secrets": lambda: "secret"}, timeout=0.1)
+    release.set()
+
+    assert time.monotonic() - started < 1
+    assert "timed out" in exc_info.value.failures["ssm"]
+    assert exc_info.value.fetched == ["secrets"]
@@ -66,6 +66,18 @@ def test_fetch_params_secrets_error():
     assert "fetch_params_secrets_error" in resp["body"]["message"]
 
 
+def test_fetch_params_secrets_error_lists_failed_groups():
+    patches = {
+        "EnvValidator": MagicMock(all_env_vars_present=MagicMock(return_value=True)),
+        "fetch_required_ssm_params": MagicMock(side_effect=Exception("ssm fail")),
+        "fetch_required_secrets": MagicMock(side_effect=Exception("secret fail")),
+    }
+    resp = _call_handler_with_patches(patches)
+    assert resp["statusCode"] == 500
+    assert "ssm: ssm fail" in resp["body"]["message"]
+    assert "secrets: secret fail" in resp["body"]["message"]
+
+
 def test_request_validation_error():
     # Pass an invalid event (missing required 'environment') and expect 400
     patches = {}
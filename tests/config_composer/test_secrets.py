@@ -15,7 +15,10 @@ def test_fetch_required_secrets(secretsmanager, aws_region):
             self._real = real_client
             self.region_name = aws_region
 
-        def client(self, svc_name):
+        def get_credentials(self):
+            return None
+
+        def client(self, svc_name, **kwargs):
             if svc_name != "secretsmanager":
                 return boto3.Session(region_name=self.region_name).client(svc_name)
 
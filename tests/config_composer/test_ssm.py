@@ -1,4 +1,5 @@
 import boto3
+import pytest
 
 from src.lambdas.config_composer.services.ssm import (
     fetch_required_ssm_params,
@@ -25,7 +26,10 @@ def test_fetch_required_ssm_params(ssm_client, aws_region):
             self._real = real_client
             self.region_name = region
 
-        def client(self, svc_name):
+        def get_credentials(self):
+            return None
+
+        def client(self, svc_name, **kwargs):
             if svc_name != "ssm":
                 return boto3.Session(region_name=self.region_name).client(svc_name)
 
@@ -43,6 +47,9 @@ def test_fetch_required_ssm_params(ssm_client, aws_region):
                         )
                     return resp
 
+                def get_paginator(self, operation_name):
+                    return real.get_paginator(operation_name)
+
             return Wrapper()
 
     session = SessionWithARN(ssm_client, aws_region)
@@ -51,3 +58,23 @@ def test_fetch_required_ssm_params(ssm_client, aws_region):
     assert ssm_values.admin_username_arn.startswith("arn:aws:ssm")
     assert ssm_values.bb_env_code == "vdev"
     assert ssm_values.bb_env_name == "Dev"
+
+
+def test_fetch_required_ssm_params_missing_key(ssm_client, aws_region):
+    ssm_client.put_parameter(
+        Name="/test/service/bb_env_code", Value="vdev", Type="String"
+    )
+
+    class Session:
+        region_name = aws_region
+
+        def get_credentials(self):
+            return None
+
+        def client(self, svc_name, **kwargs):
+            return ssm_client
+
+    with pytest.raises(Exception, match="Missing SSM params") as exc_info:
+        fetch_required_ssm_params(Session(), "test-service")  # type: ignore
+    assert "/test/service/test_admin_user_name" in str(exc_info.value)
+    assert "/test/service/bb_env_code" not in str(exc_info.value)
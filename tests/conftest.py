@@ -13,7 +13,11 @@ from lambdas.approval_handler.models.message import (
     ProductDeployment,
     TechnicalContact,
 )
+from shared.boto import clients as shared_clients
+from shared.boto import config_store as shared_config_store
 from shared.domain.models.status import StatusList
+from src.shared.boto import clients as src_clients
+from src.shared.boto import config_store as src_config_store
 
 
 @pytest.fixture
@@ -183,6 +187,17 @@ def full_execution_record_payload():
     }
 
 
+@pytest.fixture(autouse=True)
+def clear_boto_clients():
+    """Cached boto3 clients and values must not leak between tests (mocks, moto)"""
+    yield
+    # the registry module is imported under both package names
+    shared_clients.get_registry().clear()
+    src_clients.get_registry().clear()
+    shared_config_store.get_config_store().clear()
+    src_config_store.get_config_store().clear()
+
+
 @pytest.fixture
 def aws_region():
     return "us-east-1"
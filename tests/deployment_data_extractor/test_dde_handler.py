@@ -61,7 +61,7 @@ def test_s3_missing_key_triggers_404():
         ),
         patch("src.lambdas.deployment_data_extractor.handler.EnvValidator") as mock_env,
         patch(
-            "boto3.client",
+            "src.lambdas.deployment_data_extractor.handler.get_client",
         ) as mock_boto_client,
     ):
         mock_env.all_env_vars_present.return_value = True
@@ -90,7 +90,7 @@ def test_zip_missing_outputs_json_triggers_404():
         ),
         patch("src.lambdas.deployment_data_extractor.handler.EnvValidator") as mock_env,
         patch(
-            "boto3.client",
+            "src.lambdas.deployment_data_extractor.handler.get_client",
         ) as mock_boto_client,
     ):
         mock_env.all_env_vars_present.return_value = True
@@ -119,7 +119,7 @@ def test_missing_output_keys_triggers_500():
         ),
         patch("src.lambdas.deployment_data_extractor.handler.EnvValidator") as mock_env,
         patch(
-            "boto3.client",
+            "src.lambdas.deployment_data_extractor.handler.get_client",
         ) as mock_boto_client,
     ):
         mock_env.all_env_vars_present.return_value = True
@@ -148,7 +148,7 @@ def test_success_returns_200_and_payload():
         ),
         patch("src.lambdas.deployment_data_extractor.handler.EnvValidator") as mock_env,
         patch(
-            "boto3.client",
+            "src.lambdas.deployment_data_extractor.handler.get_client",
         ) as mock_boto_client,
     ):
         mock_env.all_env_vars_present.return_value = True
@@ -0,0 +1,168 @@
+import io
+import os
+from datetime import date
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from src.lambdas.execution_record_archiver import handler
+from src.shared.domain.execution_archive import decode_records, read_archive
+
+BUCKET = "reports-bucket"
+TTL_IDENTITY = {"type": "Service", "principalId": "dynamodb.amazonaws.com"}
+
+
+def _stream_record(
+    sequence: str,
+    record_id: str,
+    created_at: str,
+    event_name: str = "REMOVE",
+    identity: dict | None = TTL_IDENTITY,
+) -> dict:
+    record = {
+        "eventName": event_name,
+        "dynamodb": {
+            "SequenceNumber": sequence,
+            "OldImage": {
+                "Id": {"S": record_id},
+                "Status": {"S": "success"},
+                "DeployedServices": {"M": {"service-a": {"S": "abc123"}}},
+                "CreatedAt": {"S": created_at},
+                "UpdatedAt": {"S": created_at},
+                "ExpiresAt": {"N": "1700000000"},
+            },
+        },
+    }
+    if identity is not None:
+        record["userIdentity"] = identity
+    return record
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("ARCHIVE_BUCKET_NAME", BUCKET)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        with patch.object(handler, "get_client", return_value=client):
+            yield client
+
+
+def _objects(s3_client) -> list[str]:
+    response = s3_client.list_objects_v2(Bucket=BUCKET)
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+def test_archives_ttl_removals_partitioned_by_day(s3_client):
+    event = {
+        "Records": [
+            _stream_record("100", "a", "2024-01-01T10:00:00+00:00"),
+            _stream_record("101", "c", "2024-01-01T12:00:00+00:00"),
+            _stream_record("102", "b", "2024-01-02T10:00:00+00:00"),
+        ]
+    }
+
+    response = handler.lambda_handler(event, None)
+
+    assert response == {"batchItemFailures": []}
+    assert _objects(s3_client) == [
+        "execution_records_archive/year=2024/month=01/day=01/100.jsonl.gz",
+        "execution_records_archive/year=2024/month=01/day=02/102.jsonl.gz",
+    ]
+    obj = s3_client.get_object(
+        Bucket=BUCKET,
+        Key="execution_records_archive/year=2024/month=01/day=01/100.jsonl.gz",
+    )
+    assert obj["ContentEncoding"] == "gzip"
+    assert obj["ContentType"] == "application/x-ndjson"
+    records = list(decode_records(io.BytesIO(obj["Body"].read())))
+    assert [r["Id"] for r in records] == ["a", "c"]
+    assert records[0]["DeployedServices"] == {"service-a": "abc123"}
+    assert records[0]["ExpiresAt"] == "2023-11-14T22:13:20+00:00"
+
+
+@pytest.mark.parametrize(
+    "stream_record",
+    [
+        # deleted by a user, not expired
+        _stream_record("1", "a", "2024-01-01T10:00:00+00:00", identity=None),
+        _stream_record("1", "a", "2024-01-01T10:00:00+00:00", event_name="MODIFY"),
+    ],
+)
+def test_skips_other_events(s3_client, stream_record):
+    response = handler.lambda_handler({"Records": [stream_record]}, None)
+
+    assert response == {"batchItemFailures": []}
+    assert _objects(s3_client) == []
+
+
+def test_reports_lowest_failed_sequence_number(s3_client, monkeypatch):
+    monkeypatch.setenv("ARCHIVE_BUCKET_NAME", "missing-bucket")
+    event = {
+        "Records": [
+            _stream_record("900", "a", "2024-01-01T10:00:00+00:00"),
+            _stream_record("1000", "b", "2024-01-02T10:00:00+00:00"),
+        ]
+    }
+
+    response = handler.lambda_handler(event, None)
+
+    assert response == {"batchItemFailures": [{"itemIdentifier": "900"}]}
+
+
+def test_retried_batch_writes_no_duplicates(s3_client):
+    records = [
+        _stream_record("1", "a", "2024-01-01T10:00:00+00:00"),
+        _stream_record("2", "b", "2024-01-02T10:00:00+00:00"),
+        _stream_record("3", "c", "2024-01-01T11:00:00+00:00"),
+        _stream_record("4", "d", "2024-01-02T11:00:00+00:00"),
+    ]
+    put_object = s3_client.put_object
+    calls = []
+
+    def failing_put_object(**kwargs):
+        calls.append(kwargs["Key"])
+        if len(calls) == 2:
+            raise RuntimeError("SlowDown")
+        return put_object(**kwargs)
+
+    with patch.object(s3_client, "put_object", side_effect=failing_put_object):
+        response = handler.lambda_handler({"Records": records[:3]}, None)
+    assert response == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+    assert len(calls) == 2
+
+    # the retried batch starts at the failed record and may be longer
+    response = handler.lambda_handler({"Records": records[1:]}, None)
+
+    assert response == {"batchItemFailures": []}
+    archived = read_archive(s3_client, BUCKET, date(2024, 1, 1), date(2024, 1, 2))
+    assert sorted(r["Id"] for r in archived) == ["a", "b", "c", "d"]
+
+
+def test_read_archive_returns_records_of_day_range(s3_client):
+    handler.lambda_handler(
+        {
+            "Records": [
+                _stream_record("1", "a", "2024-01-01T10:00:00+00:00"),
+                _stream_record("2", "b", "2024-01-02T10:00:00+00:00"),
+                _stream_record("3", "c", "2024-01-03T10:00:00+00:00"),
+            ]
+        },
+        None,
+    )
+
+    records = read_archive(s3_client, BUCKET, date(2024, 1, 2), date(2024, 1, 3))
+
+    assert [r["Id"] for r in records] == ["b", "c"]
+
+
+def test_missing_env_fails_invocation(monkeypatch):
+    monkeypatch.delenv("ARCHIVE_BUCKET_NAME", raising=False)
+
+    with pytest.raises(RuntimeError, match="env_validation"):
+        handler.lambda_handler({"Records": []}, None)
@@ -0,0 +1,31 @@
+import pytest
+
+from src.lambdas.execution_record_handler.const.env_variable_keys import (
+    HASH_KEY_NAME_ENV_VAR,
+)
+from src.lambdas.execution_record_handler.models.execution_record import (
+    ExecutionRecordModel,
+)
+
+
+@pytest.fixture
+def execution_record_table(dynamodb_resource, aws_region, monkeypatch):
+    dynamodb_resource.create_table(
+        TableName="execution-records",
+        KeySchema=[{"AttributeName": "Id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "Id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    monkeypatch.setenv(HASH_KEY_NAME_ENV_VAR, "Id")
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "table_name", "execution-records")
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "region", aws_region)
+    monkeypatch.setattr(ExecutionRecordModel, "_connection", None)
+    ExecutionRecordModel(
+        "exists",
+        Status="initialized",
+        WorkloadVersion="v1",
+        CreatedAt="2020-01-01T00:00:00+00:00",
+        UpdatedAt="2020-01-01T00:00:00+00:00",
+    ).save()
+    yield
+    ExecutionRecordModel._connection = None
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from pynamodb.exceptions import PutError
+
+from src.lambdas.execution_record_handler.models.execution_record import (
+    ExecutionRecordModel,
+)
+from src.lambdas.execution_record_handler.services.execution_record_batch import (
+    ExecutionRecordBatch,
+)
+
+
+def test_write_reports_result_per_item(execution_record_table):
+    results = ExecutionRecordBatch.write(
+        [
+            {"Status": "initialized", "WorkloadVersion": "v2"},
+            {"Id": "exists", "Status": "failure", "FailureReason": "boom"},
+            {"Id": "missing", "Status": "finalReport"},
+            {"Status": "not_a_status"},
+            "not a record",
+        ]
+    )
+
+    assert [r["status"] for r in results] == [
+        "saved",
+        "saved",
+        "not_found",
+        "invalid",
+        "invalid",
+    ]
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    created = ExecutionRecordModel.get(results[0]["Id"])
+    assert created.WorkloadVersion == "v2"
+    updated = ExecutionRecordModel.get("exists")
+    assert updated.FailureReason == "boom"
+    # fields of the stored record are kept
+    assert updated.WorkloadVersion == "v1"
+    assert updated.CreatedAt == "2020-01-01T00:00:00+00:00"
+
+
+def test_write_rejects_disallowed_transition_and_duplicates(execution_record_table):
+    results = ExecutionRecordBatch.write(
+        [
+            {"Id": "exists", "Status": "success"},
+            {"Id": "exists", "Status": "finalReport"},
+            {"Id": "exists", "Status": "failure", "FailureReason": "boom"},
+        ]
+    )
+
+    assert [r["status"] for r in results] == ["invalid", "saved", "invalid"]
+    assert "initialized -> success" in results[0]["error"]
+    assert results[2]["error"] == "Duplicate Id in batch"
+    assert ExecutionRecordModel.get("exists").Status == "finalReport"
+
+
+def test_write_rejects_new_records_with_non_initial_status(execution_record_table):
+    results = ExecutionRecordBatch.write([{"Status": "success", "Id": ""}])
+
+    assert results[0]["status"] == "invalid"
+    assert "New records must have status initialized" in results[0]["error"]
+    assert ExecutionRecordModel.count() == 1
+
+
+def test_write_many_records_in_pages(execution_record_table):
+    results = ExecutionRecordBatch.write(
+        [{"Status": "initialized", "WorkloadVersion": str(i)} for i in range(60)]
+    )
+
+    assert {r["status"] for r in results} == {"saved"}
+    found = ExecutionRecordBatch.get([r["Id"] for r in results])
+    assert len(found["records"]) == 60
+
+
+def test_unprocessed_items_are_reported_as_failed(execution_record_table):
+    def fail_commit(batch):
+        batch.failed_operations = [
+            {"PutRequest": {"Item": {"Id": {"S": op["item"].Id}}}}
+            for op in batch.pending_operations[:1]
+        ]
+        raise PutError("Failed to batch write items: max_retry_attempts exceeded")
+
+    with patch("pynamodb.models.BatchWrite.commit", fail_commit):
+        results = ExecutionRecordBatch.write(
+            [{"Status": "initialized"}, {"Status": "initialized"}]
+        )
+
+    assert [r["status"] for r in results] == ["failed", "saved"]
+
+
+def test_get_returns_records_and_missing_ids(execution_record_table):
+    found = ExecutionRecordBatch.get(["exists", "missing"])
+
+    assert [r["Id"] for r in found["records"]] == ["exists"]
+    assert found["missing"] == ["missing"]
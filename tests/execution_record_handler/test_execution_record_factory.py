@@ -1,8 +1,17 @@
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
 
 from src.lambdas.execution_record_handler.const.env_variable_keys import (
     HASH_KEY_NAME_ENV_VAR,
 )
+from src.lambdas.execution_record_handler.models.errors import (
+    ExecutionRecordConflict,
+)
+from src.lambdas.execution_record_handler.models.execution_record import (
+    ExecutionRecordModel,
+)
 from src.lambdas.execution_record_handler.services.execution_record_factory import (
     ExecutionRecordFactory,
 )
@@ -14,7 +23,6 @@ from src.lambdas.execution_record_handler.services.execution_record_factory impo
 )
 def test_make_test_execution_record_new(mock_model):
     payload = {"foo": "bar"}
-    mock_model.get.side_effect = Exception("DoesNotExist")
     record = ExecutionRecordFactory.make_test_execution_record(payload)
     assert "Id" in record
     assert "CreatedAt" in record
@@ -22,23 +30,104 @@ def test_make_test_execution_record_new(mock_model):
     assert record["foo"] == "bar"
     assert isinstance(record["CreatedAt"], str)
     assert isinstance(record["UpdatedAt"], str)
+    assert record["ExpiresAt"] == datetime.fromisoformat(
+        record["UpdatedAt"]
+    ) + timedelta(days=180)
 
 
 @patch.dict("os.environ", {HASH_KEY_NAME_ENV_VAR: "Id"})
 @patch(
     "src.lambdas.execution_record_handler.services.execution_record_factory.ExecutionRecordModel"
 )
-def test_make_test_execution_record_existing(mock_model):
-    payload = {"Id": "exists", "foo": "baz"}
-    dummy = MagicMock()
-    dummy.to_dict.return_value = {
-        "Id": "exists",
-        "CreatedAt": "2020-01-01T00:00:00",
-        "UpdatedAt": "2020-01-02T00:00:00",
-    }
-    mock_model.get.return_value = dummy
+def test_make_test_execution_record_does_not_read_record(mock_model):
+    payload = {"Id": "given", "foo": "baz"}
     record = ExecutionRecordFactory.make_test_execution_record(payload)
-    assert record["Id"] == "exists"
+    mock_model.get.assert_not_called()
+    assert record["Id"] == "given"
     assert record["foo"] == "baz"
-    assert isinstance(record["CreatedAt"], str)
-    assert isinstance(record["UpdatedAt"], str)
+    assert payload == {"Id": "given", "foo": "baz"}
+
+
+def test_update_writes_only_payload_fields(execution_record_table):
+    record = ExecutionRecordFactory.update_test_execution_record(
+        {
+            "Id": "exists",
+            "Status": "deployedServices",
+            "DeployedServices": {"dataops-mb-vpc": "uuid"},
+        }
+    )
+
+    # new image is returned without reading the record
+    assert record.Status == "deployedServices"
+    assert record.WorkloadVersion == "v1"
+    assert record.CreatedAt == "2020-01-01T00:00:00+00:00"
+    assert record.UpdatedAt > "2020-01-01T00:00:00+00:00"
+    assert record.to_dict()["DeployedServices"] == {"dataops-mb-vpc": "uuid"}
+    assert ExecutionRecordModel.get("exists").Status == "deployedServices"
+
+
+def test_update_restarts_retention(execution_record_table, monkeypatch):
+    monkeypatch.setenv("RECORD_RETENTION_DAYS", "30")
+
+    record = ExecutionRecordFactory.update_test_execution_record(
+        {"Id": "exists", "Status": "initialized", "ExpiresAt": "ignored"}
+    )
+
+    expected = datetime.fromisoformat(record.UpdatedAt) + timedelta(days=30)
+    assert record.ExpiresAt == expected.replace(microsecond=0)
+    assert "ExpiresAt" not in record.to_dict()
+
+
+def test_update_of_missing_record_conflicts(execution_record_table):
+    with pytest.raises(ExecutionRecordConflict):
+        ExecutionRecordFactory.update_test_execution_record(
+            {"Id": "missing", "Status": "success"}
+        )
+
+
+@pytest.mark.parametrize(
+    "tokens",
+    [
+        {"ExpectedStatus": "deployedServices"},
+        {"ExpectedUpdatedAt": "2020-01-02T00:00:00+00:00"},
+    ],
+)
+def test_update_with_stale_token_conflicts(execution_record_table, tokens):
+    with pytest.raises(ExecutionRecordConflict):
+        ExecutionRecordFactory.update_test_execution_record(
+            {"Id": "exists", "Status": "finalReport", **tokens}
+        )
+
+    assert ExecutionRecordModel.get("exists").Status == "initialized"
+
+
+def test_update_with_matching_tokens(execution_record_table):
+    record = ExecutionRecordFactory.update_test_execution_record(
+        {
+            "Id": "exists",
+            "Status": "failure",
+            "FailureReason": "boom",
+            "ExpectedStatus": "initialized",
+            "ExpectedUpdatedAt": "2020-01-01T00:00:00+00:00",
+        }
+    )
+
+    assert record.FailureReason == "boom"
+    assert "ExpectedStatus" not in record.attribute_values
+
+
+def test_update_with_disallowed_transition_conflicts(execution_record_table):
+    with pytest.raises(ExecutionRecordConflict, match="does not allow status success"):
+        ExecutionRecordFactory.update_test_execution_record(
+            {"Id": "exists", "Status": "success"}
+        )
+
+    assert ExecutionRecordModel.get("exists").Status == "initialized"
+
+
+def test_update_walks_allowed_transitions(execution_record_table):
+    for status in ["deployedServices", "operationsPortalTestsDone", "finalReport"]:
+        record = ExecutionRecordFactory.update_test_execution_record(
+            {"Id": "exists", "Status": status}
+        )
+        assert record.Status == status
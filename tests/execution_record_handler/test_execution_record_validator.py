@@ -96,3 +96,32 @@ def test_validate_invalid_status():
 
 def test_full_payload(full_execution_record_payload):
     assert ExecutionRecordValidator.validate(full_execution_record_payload) is True
+
+
+def test_validate_allowed_expected_status():
+    payload = {"Status": "finalReport", "Id": "id", "ExpectedStatus": "initialized"}
+    assert ExecutionRecordValidator.validate(payload) is True
+
+
+def test_validate_disallowed_expected_status():
+    payload = {"Status": "success", "Id": "id", "ExpectedStatus": "initialized"}
+    with pytest.raises(
+        ValueError, match="Status transition not allowed: initialized -> success"
+    ):
+        ExecutionRecordValidator.validate(payload)
+
+
+def test_validate_invalid_expected_status():
+    payload = {"Status": "success", "Id": "id", "ExpectedStatus": "nope"}
+    with pytest.raises(ValueError, match="Invalid ExpectedStatus value: nope"):
+        ExecutionRecordValidator.validate(payload)
+
+
+def test_validate_new_record_initial_status():
+    assert ExecutionRecordValidator.validate_new_record({"Status": "initialized"})
+
+
+@pytest.mark.parametrize("status", ["success", "dataPortalTeardownTestsDone"])
+def test_validate_new_record_rejects_non_initial_status(status):
+    with pytest.raises(ValueError, match="New records must have status initialized"):
+        ExecutionRecordValidator.validate_new_record({"Status": status})
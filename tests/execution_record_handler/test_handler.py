@@ -1,5 +1,8 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+from botocore.exceptions import ClientError
+
 from src.lambdas.execution_record_handler import handler
 
 
@@ -19,7 +22,8 @@ from src.lambdas.execution_record_handler import handler
     handler,
     "ExecutionRecordModel",
     side_effect=lambda **kwargs: MagicMock(
-        to_dict=lambda: {"Id": "id", "WorkloadVersion": "v1"}, save=lambda: None
+        to_dict=lambda: {"Id": "id", "WorkloadVersion": "v1"},
+        save=lambda **kwargs: None,
     ),
 )
 @patch.object(
@@ -37,6 +41,38 @@ def test_lambda_handler_success(
     assert "db_record" in result["body"]
 
 
+@patch.dict("os.environ", {"HASH_KEY_NAME": "Id"})
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler, "ExecutionRecordModel")
+def test_lambda_handler_rejects_new_record_with_non_initial_status(
+    mock_db_model, mock_env
+):
+    result = handler.lambda_handler({"Status": "finalReport", "Id": ""}, MagicMock())
+    assert result["statusCode"] == 400
+    assert "New records must have status initialized" in result["body"]["message"]
+    mock_db_model.assert_not_called()
+
+
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(
+    handler.ExecutionRecordFactory,
+    "make_test_execution_record",
+    return_value={
+        "Id": "exists",
+        "Status": "initialized",
+        "CreatedAt": "2025-01-01T00:00:00+00:00",
+        "UpdatedAt": "2025-01-01T00:00:00+00:00",
+    },
+)
+def test_lambda_handler_create_does_not_overwrite(
+    mock_factory, mock_env, execution_record_table
+):
+    result = handler.lambda_handler({"Status": "initialized"}, MagicMock())
+    assert result["statusCode"] == 409
+    assert result["body"]["error"] == "ConflictError"
+    assert handler.ExecutionRecordModel.get("exists").WorkloadVersion == "v1"
+
+
 @patch(
     "src.lambdas.execution_record_handler.handler.create_error_response",
     lambda code, msg: {"statusCode": code, "body": msg},
@@ -64,3 +100,82 @@ def test_lambda_handler_validation_error(mock_validator, mock_env):
     result = handler.lambda_handler(event, context)
     assert result["statusCode"] == 400
     assert "fail" in result["body"]
+
+
+@patch.dict("os.environ", {"HASH_KEY_NAME": "Id"})
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler.ExecutionRecordValidator, "validate", return_value=True)
+@patch.object(handler.ExecutionRecordFactory, "update_test_execution_record")
+def test_lambda_handler_updates_existing_record(mock_update, mock_validator, mock_env):
+    mock_update.return_value = MagicMock(
+        to_dict=lambda: {"Id": "id", "Status": "success"}
+    )
+    result = handler.lambda_handler({"Id": "id", "Status": "success"}, MagicMock())
+    assert result["statusCode"] == 200
+    assert result["body"]["db_record"]["Status"] == "success"
+    mock_update.assert_called_once_with({"Id": "id", "Status": "success"})
+
+
+@patch.dict("os.environ", {"HASH_KEY_NAME": "Id"})
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler.ExecutionRecordValidator, "validate", return_value=True)
+@patch.object(
+    handler.ExecutionRecordFactory,
+    "update_test_execution_record",
+    side_effect=handler.ExecutionRecordConflict("modified concurrently"),
+)
+def test_lambda_handler_conflict(mock_update, mock_validator, mock_env):
+    result = handler.lambda_handler({"Id": "id", "Status": "success"}, MagicMock())
+    assert result["statusCode"] == 409
+    assert result["body"]["error"] == "ConflictError"
+
+
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler.ExecutionRecordBatch, "write")
+def test_lambda_handler_batch_write(mock_write, mock_env):
+    mock_write.return_value = [
+        {"index": 0, "Id": "a", "status": "saved"},
+        {"index": 1, "Id": None, "status": "invalid", "error": "fail"},
+    ]
+    result = handler.lambda_handler({"Records": [{}, {}]}, MagicMock())
+    assert result["statusCode"] == 200
+    assert result["body"]["saved"] == 1
+    assert result["body"]["failed"] == 1
+
+
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler.ExecutionRecordBatch, "get")
+def test_lambda_handler_batch_get(mock_get, mock_env):
+    mock_get.return_value = {"records": [{"Id": "a"}], "missing": ["b"]}
+    result = handler.lambda_handler({"Ids": ["a", "b"]}, MagicMock())
+    assert result["statusCode"] == 200
+    assert result["body"]["missing"] == ["b"]
+
+
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+def test_lambda_handler_batch_too_large(mock_env):
+    result = handler.lambda_handler({"Ids": ["a"] * 501}, MagicMock())
+    assert result["statusCode"] == 400
+
+
+@pytest.mark.parametrize("ids", [[1], ["a", ""], ["a", None], [["a"]]])
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+@patch.object(handler.ExecutionRecordBatch, "get")
+def test_lambda_handler_batch_get_rejects_invalid_ids(mock_get, mock_env, ids):
+    result = handler.lambda_handler({"Ids": ids}, MagicMock())
+    assert result["statusCode"] == 400
+    assert result["body"]["error"] == "ValidationError"
+    mock_get.assert_not_called()
+
+
+@pytest.mark.parametrize("key, method", [("Ids", "get"), ("Records", "write")])
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=True)
+def test_lambda_handler_batch_dynamodb_error(mock_env, key, method):
+    error = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+        "BatchGetItem",
+    )
+    with patch.object(handler.ExecutionRecordBatch, method, side_effect=error):
+        result = handler.lambda_handler({key: ["a"]}, MagicMock())
+    assert result["statusCode"] == 500
+    assert result["body"]["error"] == "InternalError"
@@ -47,7 +47,7 @@ def test_error_env_vars(mock_env, mock_validate, valid_event, valid_context):
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role")
+@patch("src.lambdas.dp_password_rotator.handler.get_assumed_role_session")
 def test_error_assume_role(
     mock_assume, mock_env, mock_validate, valid_event, valid_context
 ):
@@ -65,7 +65,10 @@ def test_error_assume_role(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch("src.lambdas.dp_password_rotator.handler.get_secret")
 def test_error_get_secret(
     mock_secret, mock_assume, mock_env, mock_validate, valid_event, valid_context
@@ -84,7 +87,10 @@ def test_error_get_secret(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch("src.lambdas.dp_password_rotator.handler.get_secret", return_value=MagicMock())
 @patch("src.lambdas.dp_password_rotator.handler.get_ssm_param")
 def test_error_get_ssm_param(
@@ -110,7 +116,10 @@ def test_error_get_ssm_param(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch("src.lambdas.dp_password_rotator.handler.get_secret", return_value=MagicMock())
 @patch(
     "src.lambdas.dp_password_rotator.handler.get_ssm_param",
@@ -141,7 +150,10 @@ def test_error_cognito_user_not_found(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch("src.lambdas.dp_password_rotator.handler.get_secret", return_value=MagicMock())
 @patch(
     "src.lambdas.dp_password_rotator.handler.get_ssm_param",
@@ -172,7 +184,10 @@ def test_error_cognito_user_check(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch(
     "src.lambdas.dp_password_rotator.handler.get_secret",
     return_value=MagicMock(value="pw", arn="arn"),
@@ -208,7 +223,10 @@ def test_error_set_cognito_user_password(
     "src.lambdas.dp_password_rotator.handler.EnvValidator.all_env_vars_present",
     return_value=True,
 )
-@patch("src.lambdas.dp_password_rotator.handler.assume_role", return_value=MagicMock())
+@patch(
+    "src.lambdas.dp_password_rotator.handler.get_assumed_role_session",
+    return_value=MagicMock(),
+)
 @patch(
     "src.lambdas.dp_password_rotator.handler.get_secret",
     return_value=MagicMock(value="pw", arn="arn"),
@@ -0,0 +1,186 @@
+import hashlib
+import hmac
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+os.environ.setdefault("REGION", "us-east-1")
+os.environ.setdefault("TABLE_NAME", "test-pipeline-states")
+os.environ.setdefault("WEBHOOK_SECRET", "webhook-secret")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from src.lambdas.pipeline_event_handler import handler
+from src.lambdas.pipeline_event_handler.models.pipeline_state import (
+    PipelineStateModel,
+)
+
+PAYLOADS_DIR = Path(__file__).parent / "payloads"
+COMPLETED_UUID = "{3f6b2f0e-8c1a-4d8e-9a57-0d2f6c1b7e41}"
+FAILED_UUID = "{9a1d4c77-2b3e-4f60-8e15-6c0b8d2a4f93}"
+
+
+def _webhook_event(payload_name: str, secret: str = "webhook-secret") -> dict:
+    body = (PAYLOADS_DIR / payload_name).read_text()
+    signature = hmac.new(secret.encode(), body.encode(), hashlib.sha256).hexdigest()
+    return {
+        "headers": {
+            "content-type": "application/json",
+            "x-hub-signature": f"sha256={signature}",
+        },
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+@pytest.fixture
+def pipeline_state_table():
+    with mock_aws():
+        PipelineStateModel.create_table(billing_mode="PAY_PER_REQUEST", wait=True)
+        yield
+
+
+@pytest.fixture
+def sfn_client():
+    with patch.object(handler, "get_client") as mock_get_client:
+        client = MagicMock()
+        mock_get_client.return_value = client
+        yield client
+
+
+def test_webhook_records_terminal_state(pipeline_state_table, sfn_client):
+    response = handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["resumed"] is False
+    item = PipelineStateModel.get(COMPLETED_UUID)
+    assert item.State == "COMPLETED"
+    assert item.Result == "SUCCESSFUL"
+    assert item.RepoSlug == "dataops-deployment"
+    sfn_client.send_task_success.assert_not_called()
+
+
+def test_webhook_ignores_non_terminal_state(pipeline_state_table, sfn_client):
+    response = handler.lambda_handler(_webhook_event("pipeline_in_progress.json"), None)
+
+    assert response["statusCode"] == 202
+    assert PipelineStateModel.count() == 0
+
+
+def test_webhook_rejects_invalid_signature(pipeline_state_table, sfn_client):
+    event = _webhook_event("pipeline_completed.json", secret="other-secret")
+
+    response = handler.lambda_handler(event, None)
+
+    assert response["statusCode"] == 401
+    assert PipelineStateModel.count() == 0
+
+
+def test_webhook_rejects_invalid_payload(pipeline_state_table, sfn_client):
+    body = json.dumps({"uuid": "not-a-uuid"})
+    signature = hmac.new(b"webhook-secret", body.encode(), hashlib.sha256).hexdigest()
+    event = {"headers": {"X-Hub-Signature": f"sha256={signature}"}, "body": body}
+
+    response = handler.lambda_handler(event, None)
+
+    assert response["statusCode"] == 400
+
+
+def test_waiter_registered_before_webhook_is_resumed(pipeline_state_table, sfn_client):
+    registration = handler.lambda_handler(
+        {"pipeline_uuid": COMPLETED_UUID, "task_token": "token-1"}, None
+    )
+    assert registration["body"]["resumed"] is False
+
+    response = handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+
+    assert json.loads(response["body"])["resumed"] is True
+    sfn_client.send_task_success.assert_called_once()
+    assert sfn_client.send_task_success.call_args.kwargs["taskToken"] == "token-1"
+
+
+def test_waiter_registered_after_webhook_is_resumed(pipeline_state_table, sfn_client):
+    handler.lambda_handler(_webhook_event("pipeline_failed.json"), None)
+
+    response = handler.lambda_handler(
+        {"pipeline_uuid": FAILED_UUID, "task_token": "token-2"}, None
+    )
+
+    assert response["body"]["resumed"] is True
+    sfn_client.send_task_failure.assert_called_once()
+    assert sfn_client.send_task_failure.call_args.kwargs["taskToken"] == "token-2"
+
+
+def test_waiter_is_resumed_once(pipeline_state_table, sfn_client):
+    handler.lambda_handler(
+        {"pipeline_uuid": COMPLETED_UUID, "task_token": "token-1"}, None
+    )
+    handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+    handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+
+    sfn_client.send_task_success.assert_called_once()
+
+
+def test_failed_resume_is_retried(pipeline_state_table, sfn_client):
+    handler.lambda_handler(
+        {"pipeline_uuid": COMPLETED_UUID, "task_token": "token-1"}, None
+    )
+    sfn_client.send_task_success.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException"}}, "SendTaskSuccess"),
+        None,
+    ]
+
+    failed = handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+    retried = handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+
+    assert failed["statusCode"] == 500
+    assert json.loads(retried["body"])["resumed"] is True
+    assert sfn_client.send_task_success.call_count == 2
+    assert PipelineStateModel.get(COMPLETED_UUID).Notified is True
+
+
+def test_completed_task_is_not_resumed_again(pipeline_state_table, sfn_client):
+    sfn_client.send_task_success.side_effect = ClientError(
+        {"Error": {"Code": "TaskTimedOut"}}, "SendTaskSuccess"
+    )
+    handler.lambda_handler(
+        {"pipeline_uuid": COMPLETED_UUID, "task_token": "token-1"}, None
+    )
+
+    response = handler.lambda_handler(_webhook_event("pipeline_completed.json"), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["resumed"] is False
+    assert PipelineStateModel.get(COMPLETED_UUID).Notified is True
+
+
+def test_webhook_rejects_invalid_base64_body(pipeline_state_table, sfn_client):
+    event = {"headers": {}, "body": "not base64!", "isBase64Encoded": True}
+
+    response = handler.lambda_handler(event, None)
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["error"] == "ValidationError"
+
+
+def test_waiter_registration_validation_error(pipeline_state_table, sfn_client):
+    response = handler.lambda_handler(
+        {"pipeline_uuid": "bad", "task_token": "token"}, None
+    )
+
+    assert response["statusCode"] == 400
+    assert "Invalid request parameters" in response["body"]["message"]
+
+
+@patch.object(handler.EnvValidator, "all_env_vars_present", return_value=False)
+def test_missing_env(mock_env):
+    response = handler.lambda_handler({}, None)
+
+    assert response["statusCode"] == 500
+    assert "env_validation" in response["body"]["message"]
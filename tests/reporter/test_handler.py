@@ -7,7 +7,8 @@ from botocore.exceptions import ClientError
 os.environ.setdefault(
     "E2E_FINAL_REPORT_TOPIC_ARN", "arn:aws:sns:us-east-1:123456789:test-topic"
 )
-os.environ.setdefault("EXECUTION_RECORD_LAMBDA_NAME", "test-lambda")
+os.environ.setdefault("TABLE_NAME", "test-execution-records")
+os.environ.setdefault("REGION", "us-east-1")
 os.environ.setdefault("S3_REPORT_BUCKET", "test-bucket")
 os.environ.setdefault("AWS_REGION", "us-east-1")
 os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
@@ -18,6 +19,8 @@ from src.lambdas.reporter.models.errors import (
     EnvironmentValidationError,
     ParamsValidationError,
 )
+from src.shared.domain.execution_record_repository import ExecutionRecordConflict
+from src.shared.domain.models.status import StatusList
 
 
 def _create_mock_context():
@@ -55,17 +58,21 @@ def _create_mock_execution_record():
     }
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.collect_test_results")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_happy_path_success(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
+    mock_collect_test_results,
 ):
     """Test successful report generation when execution succeeds."""
     event = _create_valid_event()
@@ -79,17 +86,27 @@ def test_lambda_handler_happy_path_success(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = (
         "<html>success report</html>"
     )
     mock_report_creator.return_value.to_json.return_value = {"message": "success"}
-    mock_report_uploader.return_value.main.return_value = (
+    mock_report_uploader.return_value.get_presigned_url.return_value = (
         "https://s3.example.com/report.html"
     )
 
+    test_results = {
+        "suites": {"operations_portal": {"passed": 3, "failed": 0, "total": 3}},
+        "totals": {"passed": 3, "failed": 0, "total": 3},
+    }
+    mock_collect_test_results.return_value = test_results
+
     mock_sns_client = MagicMock()
-    mock_boto3.client.return_value = mock_sns_client
+    mock_get_client.return_value = mock_sns_client
 
     response = lambda_handler(event, context)
 
@@ -101,19 +118,29 @@ def test_lambda_handler_happy_path_success(
     )
     assert "message" in body
     assert event["Id"] in str(body)
+    assert body["status"] == "finalReport"
+    mock_repository.get.assert_called_once_with(event["Id"])
+    mock_collect_test_results.assert_called_once_with(
+        mock_sns_client, "test-bucket", event["Id"]
+    )
+    mock_repository.set_status.assert_called_once_with(
+        event["Id"], StatusList.finalReport, TestResults=test_results
+    )
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_happy_path_failure(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test successful report generation when execution fails."""
     event = {
@@ -132,17 +159,21 @@ def test_lambda_handler_happy_path_failure(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = (
         "<html>failure report</html>"
     )
     mock_report_creator.return_value.to_json.return_value = {"message": "failed"}
-    mock_report_uploader.return_value.main.return_value = (
+    mock_report_uploader.return_value.get_presigned_url.return_value = (
         "https://s3.example.com/report.html"
     )
 
     mock_sns_client = MagicMock()
-    mock_boto3.client.return_value = mock_sns_client
+    mock_get_client.return_value = mock_sns_client
 
     response = lambda_handler(event, context)
 
@@ -188,15 +219,17 @@ def test_lambda_handler_params_validation_error(mock_validator):
     assert "Id: field required" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch("src.lambdas.reporter.handler.get_client")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
-def test_lambda_handler_execution_record_lambda_invocation_error(
+def test_lambda_handler_execution_record_read_error(
     mock_validator,
-    mock_report_lambda_handler,
-    mock_boto3,
+    mock_repository,
+    mock_get_client,
 ):
-    """Test handler when execution record lambda invocation fails with AWS error."""
+    """Test handler when execution record read fails with AWS error."""
     event = _create_valid_event()
     context = _create_mock_context()
 
@@ -208,8 +241,8 @@ def test_lambda_handler_execution_record_lambda_invocation_error(
     )
 
     error_response = {"Error": {"Code": "ServiceException", "Message": "Service error"}}
-    boto_error = ClientError(error_response, "InvokeFunction")
-    mock_report_lambda_handler.side_effect = boto_error
+    boto_error = ClientError(error_response, "GetItem")
+    mock_repository.get.side_effect = boto_error
 
     response = lambda_handler(event, context)
 
@@ -217,15 +250,17 @@ def test_lambda_handler_execution_record_lambda_invocation_error(
     assert "Failed to retrieve execution record" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch("src.lambdas.reporter.handler.get_client")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
-def test_lambda_handler_execution_record_lambda_invocation_unexpected_error(
+def test_lambda_handler_execution_record_read_unexpected_error(
     mock_validator,
-    mock_report_lambda_handler,
-    mock_boto3,
+    mock_repository,
+    mock_get_client,
 ):
-    """Test handler when execution record lambda invocation fails with unexpected error."""
+    """Test handler when execution record read fails with unexpected error."""
     event = _create_valid_event()
     context = _create_mock_context()
 
@@ -236,9 +271,7 @@ def test_lambda_handler_execution_record_lambda_invocation_unexpected_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.side_effect = Exception(
-        "Unexpected error retrieving record"
-    )
+    mock_repository.get.side_effect = Exception("Unexpected error retrieving record")
 
     response = lambda_handler(event, context)
 
@@ -246,15 +279,52 @@ def test_lambda_handler_execution_record_lambda_invocation_unexpected_error(
     assert "Failed to retrieve execution record" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
+@patch("src.lambdas.reporter.handler.ReportCreator")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
+@patch("src.lambdas.reporter.handler.Validator")
+def test_lambda_handler_execution_record_status_conflict(
+    mock_validator,
+    mock_repository,
+    mock_report_creator,
+    mock_get_client,
+):
+    """Test handler when the record does not allow the finalReport status."""
+    event = _create_valid_event()
+    context = _create_mock_context()
+
+    mock_validator.validate_environment.return_value = None
+    mock_validator.validate_parameters.return_value = MagicMock(
+        Id=event["Id"],
+        IsSuccess=event["IsSuccess"],
+        ErrorDetails=event["ErrorDetails"],
+    )
+
+    mock_repository.get.return_value = _create_mock_execution_record()
+    mock_repository.set_status.side_effect = ExecutionRecordConflict(
+        "does not allow status finalReport"
+    )
+
+    response = lambda_handler(event, context)
+
+    assert response["statusCode"] == 500
+    assert "Failed to update execution record status" in str(response["body"])
+    mock_report_creator.assert_not_called()
+
+
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_report_creation_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when report creation fails."""
     event = _create_valid_event()
@@ -268,7 +338,11 @@ def test_lambda_handler_report_creation_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.side_effect = Exception("Failed to create report")
 
     response = lambda_handler(event, context)
@@ -277,17 +351,19 @@ def test_lambda_handler_report_creation_error(
     assert "Failed to generate report" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_report_upload_boto_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when report upload fails with AWS error."""
     event = _create_valid_event()
@@ -301,13 +377,17 @@ def test_lambda_handler_report_upload_boto_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = "<html>report</html>"
     mock_report_creator.return_value.to_json.return_value = {"message": "success"}
 
     error_response = {"Error": {"Code": "NoSuchBucket", "Message": "Bucket not found"}}
     boto_error = ClientError(error_response, "PutObject")
-    mock_report_uploader.return_value.main.side_effect = boto_error
+    mock_report_uploader.return_value.upload.side_effect = boto_error
 
     response = lambda_handler(event, context)
 
@@ -315,17 +395,19 @@ def test_lambda_handler_report_upload_boto_error(
     assert "Failed to upload report" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_report_upload_unexpected_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when report upload fails with unexpected error."""
     event = _create_valid_event()
@@ -339,10 +421,14 @@ def test_lambda_handler_report_upload_unexpected_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = "<html>report</html>"
     mock_report_creator.return_value.to_json.return_value = {"message": "success"}
-    mock_report_uploader.return_value.main.side_effect = Exception(
+    mock_report_uploader.return_value.upload.side_effect = Exception(
         "Failed to upload report"
     )
 
@@ -352,17 +438,19 @@ def test_lambda_handler_report_upload_unexpected_error(
     assert "Failed to upload report" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_sns_creation_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when SNS message creation fails."""
     event = _create_valid_event()
@@ -376,12 +464,16 @@ def test_lambda_handler_sns_creation_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = "<html>report</html>"
     mock_report_creator.return_value.to_json.side_effect = Exception(
         "Failed to create SNS message"
     )
-    mock_report_uploader.return_value.main.return_value = (
+    mock_report_uploader.return_value.get_presigned_url.return_value = (
         "https://s3.example.com/report.html"
     )
 
@@ -391,17 +483,19 @@ def test_lambda_handler_sns_creation_error(
     assert "Failed to create SNS message" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_sns_publish_boto_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when SNS publish fails with AWS error."""
     event = _create_valid_event()
@@ -415,10 +509,14 @@ def test_lambda_handler_sns_publish_boto_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = "<html>report</html>"
     mock_report_creator.return_value.to_json.return_value = {"message": "success"}
-    mock_report_uploader.return_value.main.return_value = (
+    mock_report_uploader.return_value.get_presigned_url.return_value = (
         "https://s3.example.com/report.html"
     )
 
@@ -427,7 +525,7 @@ def test_lambda_handler_sns_publish_boto_error(
 
     mock_sns_client = MagicMock()
     mock_sns_client.publish.side_effect = boto_error
-    mock_boto3.client.return_value = mock_sns_client
+    mock_get_client.return_value = mock_sns_client
 
     response = lambda_handler(event, context)
 
@@ -435,17 +533,19 @@ def test_lambda_handler_sns_publish_boto_error(
     assert "Failed to publish to SNS" in str(response["body"])
 
 
-@patch("src.lambdas.reporter.handler.boto3")
+@patch("src.lambdas.reporter.handler.get_client")
 @patch("src.lambdas.reporter.handler.ReportUploader")
 @patch("src.lambdas.reporter.handler.ReportCreator")
-@patch("src.lambdas.reporter.handler.ReportLambdaHandler")
+@patch(
+    "src.lambdas.reporter.handler.execution_record_repository.ExecutionRecordRepository"
+)
 @patch("src.lambdas.reporter.handler.Validator")
 def test_lambda_handler_sns_publish_unexpected_error(
     mock_validator,
-    mock_report_lambda_handler,
+    mock_repository,
     mock_report_creator,
     mock_report_uploader,
-    mock_boto3,
+    mock_get_client,
 ):
     """Test handler when SNS publish fails with unexpected error."""
     event = _create_valid_event()
@@ -459,16 +559,20 @@ def test_lambda_handler_sns_publish_unexpected_error(
         ErrorDetails=event["ErrorDetails"],
     )
 
-    mock_report_lambda_handler.return_value.main.return_value = mock_record
+    mock_repository.get.return_value = mock_record
+    mock_repository.set_status.return_value.to_dict.return_value = {
+        **mock_record,
+        "Status": "finalReport",
+    }
     mock_report_creator.return_value.to_html.return_value = "<html>report</html>"
     mock_report_creator.return_value.to_json.return_value = {"message": "success"}
-    mock_report_uploader.return_value.main.return_value = (
+    mock_report_uploader.return_value.get_presigned_url.return_value = (
         "https://s3.example.com/report.html"
     )
 
     mock_sns_client = MagicMock()
     mock_sns_client.publish.side_effect = Exception("Unexpected SNS error")
-    mock_boto3.client.return_value = mock_sns_client
+    mock_get_client.return_value = mock_sns_client
 
     response = lambda_handler(event, context)
 
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from src.lambdas.reporter.models.errors import ReportRenderError
+from src.lambdas.reporter.services import report_renderers, template_environment
+from src.lambdas.reporter.services.report_creator import ReportCreator
+
+
+def _record(**overrides) -> dict:
+    return {
+        "Id": "execution-1",
+        "Status": "success",
+        "failure_reason": None,
+        "FailureReason": None,
+        "CreatedAt": "2025-12-19T12:00:00+00:00",
+        "UpdatedAt": "2025-12-19T13:30:00+00:00",
+        "DeployedServices": {"dataops-mb-vpc": "hash1"},
+        **overrides,
+    }
+
+
+def test_to_html_renders_record():
+    html = ReportCreator(_record()).to_html()
+
+    assert "execution-1" in html
+    assert "dataops-mb-vpc" in html
+    assert "1Hours 30minutes" in html
+
+
+def test_to_html_escapes_values():
+    html = ReportCreator(
+        _record(failure_reason="boom", FailureReason="<script>alert(1)</script>")
+    ).to_html()
+
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+
+
+def test_to_html_reuses_compiled_template():
+    first = template_environment.get_template("template.html")
+
+    assert template_environment.get_template("template.html") is first
+
+
+def test_to_html_raises_on_template_error(monkeypatch):
+    def broken_template(_name):
+        raise template_environment.jinja2.TemplateNotFound("template.html")
+
+    monkeypatch.setattr(report_renderers, "get_template", broken_template)
+
+    with pytest.raises(ReportRenderError, match="template.html"):
+        ReportCreator(_record()).to_html()
+
+
+def test_precompiled_templates_render_same_report(tmp_path: Path):
+    source_environment = template_environment.create_environment(
+        compiled_templates_dir=None, bytecode_cache_dir=None
+    )
+    source_environment.compile_templates(str(tmp_path), zip=None)
+    precompiled_environment = template_environment.create_environment(
+        compiled_templates_dir=tmp_path, bytecode_cache_dir=None
+    )
+
+    template = precompiled_environment.get_template("template.html")
+
+    # loaded from the compiled module, not parsed from the source
+    assert Path(template.filename).parent == tmp_path
+    assert template.render(_record()) == (
+        source_environment.get_template("template.html").render(_record())
+    )
@@ -0,0 +1,137 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lambdas.reporter.models.errors import ReportStageError
+from src.lambdas.reporter.services.report_pipeline import ReportPipeline
+
+STAGE_DELAY = 0.2
+
+
+class FakeUploader:
+    def __init__(self, fail: set[str] = frozenset()):
+        self.fail = fail
+        self.uploaded: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def report_key(file_name: str, file_type: str = "html") -> str:
+        return f"final_reports/{file_name}.{file_type}"
+
+    def get_presigned_url(self, key: str) -> str:
+        return f"https://s3.example.com/{key}"
+
+    def upload(
+        self,
+        content: str,
+        file_name: str,
+        file_type: str = "html",
+        compress: bool = True,
+    ) -> str:
+        time.sleep(STAGE_DELAY)
+        # secondary formats are consumed by SDKs, never compressed
+        assert compress == (file_type == "html")
+        if file_type in self.fail:
+            raise RuntimeError(f"{file_type} upload failed")
+        key = self.report_key(file_name, file_type)
+        with self.lock:
+            self.uploaded[key] = content
+        return key
+
+
+def _creator(to_json=None) -> MagicMock:
+    creator = MagicMock()
+    creator.to_html.return_value = "<html>report</html>"
+
+    def slow_render(name):
+        time.sleep(STAGE_DELAY)
+        return f"{name} report"
+
+    creator.render.side_effect = slow_render
+
+    def slow_to_json(report_url):
+        time.sleep(STAGE_DELAY)
+        return {"report_url": report_url}
+
+    creator.to_json.side_effect = to_json or slow_to_json
+    return creator
+
+
+def test_stages_run_concurrently_and_publish_after_upload():
+    uploader = FakeUploader()
+    published = []
+
+    def publish(message):
+        # the report exists before its URL is sent
+        assert "final_reports/run-report.html" in uploader.uploaded
+        published.append(message)
+
+    pipeline = ReportPipeline(
+        _creator(), uploader, publish, formats=["json", "junit", "unknown"]
+    )
+    started = time.perf_counter()
+    result = pipeline.run("run-report")
+    elapsed = time.perf_counter() - started
+
+    # rendering and uploading a secondary format is the longest stage, the
+    # HTML upload and the SNS message overlap with it instead of adding up
+    assert elapsed < 3 * STAGE_DELAY
+    assert published == [
+        {
+            "report_url": "https://s3.example.com/final_reports/run-report.html",
+            "report_copies": {
+                "json": "https://s3.example.com/final_reports/run-report.json",
+                "junit": "https://s3.example.com/final_reports/run-report.xml",
+            },
+        }
+    ]
+    assert result.copies == {
+        "json": "final_reports/run-report.json",
+        "junit": "final_reports/run-report.xml",
+    }
+    assert uploader.uploaded["final_reports/run-report.xml"] == "junit report"
+    assert set(result.timings.as_dict()) >= {
+        "render",
+        "upload",
+        "upload_json",
+        "upload_junit",
+        "sns_message",
+        "publish",
+        "total",
+    }
+
+
+def test_failed_format_does_not_fail_report():
+    publish = MagicMock()
+    pipeline = ReportPipeline(
+        _creator(), FakeUploader(fail={"json"}), publish, formats=["json"]
+    )
+
+    result = pipeline.run("run-report")
+
+    assert result.copies == {}
+    publish.assert_called_once()
+    assert "report_copies" not in publish.call_args.args[0]
+
+
+def test_upload_failure_is_not_published():
+    publish = MagicMock()
+    pipeline = ReportPipeline(_creator(), FakeUploader(fail={"html"}), publish)
+
+    with pytest.raises(ReportStageError, match="Failed to upload report: html upload"):
+        pipeline.run("run-report")
+    publish.assert_not_called()
+
+
+def test_sns_message_failure():
+    def broken_to_json(report_url):
+        raise ValueError("bad record")
+
+    publish = MagicMock()
+    pipeline = ReportPipeline(_creator(broken_to_json), FakeUploader(), publish)
+
+    with pytest.raises(ReportStageError, match="Failed to create SNS message: bad"):
+        pipeline.run("run-report")
+    publish.assert_not_called()
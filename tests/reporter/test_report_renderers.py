@@ -0,0 +1,123 @@
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+from src.lambdas.reporter.services import report_renderers
+from src.lambdas.reporter.services.report_creator import ReportCreator
+from src.lambdas.reporter.services.report_renderers import (
+    build_view,
+    get_renderer,
+    register_renderer,
+    renderer_names,
+)
+
+
+def _record(**overrides) -> dict:
+    return {
+        "Id": "execution-1",
+        "Status": "success",
+        "failure_reason": None,
+        "FailureReason": None,
+        "WorkloadVersion": "5.0.1",
+        "DeploymentId": "deployment-1",
+        "DataPortalUrl": "https://data-portal.example.com",
+        "SubscriptionTestReportUrl": "https://reports.example.com/subscription",
+        "VerificationTestReportUrl": None,
+        "TeardownTestReportUrl": None,
+        "CreatedAt": "2025-12-19T12:00:00+00:00",
+        "UpdatedAt": "2025-12-19T13:30:00+00:00",
+        "DeployedServices": {"dataops-mb-vpc": "hash1", "a|b": "hash2"},
+        **overrides,
+    }
+
+
+def test_registry_has_all_formats():
+    assert renderer_names() == ["html", "json", "junit", "markdown"]
+    assert get_renderer("junit").file_type == "xml"
+    with pytest.raises(ValueError, match="Unknown report format: pdf"):
+        get_renderer("pdf")
+
+
+def test_view_is_shared_by_formats():
+    view = build_view(_record(), {"operations_portal": 1})
+
+    assert view.duration == "1Hours 30minutes"
+    assert view.duration_seconds == 5400
+    assert [phase.url for phase in view.phases] == [
+        "https://reports.example.com/subscription",
+        None,
+        None,
+    ]
+
+
+def test_render_all_formats():
+    reports = ReportCreator(_record()).render_all(renderer_names())
+
+    assert "execution-1" in reports["html"]
+    data = json.loads(reports["json"])
+    assert data["deployed_services"]["dataops-mb-vpc"] == "hash1"
+    assert data["phases"][0]["name"] == "operations_portal"
+    assert "record" not in data
+    assert "| a\\|b | hash2 |" in reports["markdown"]
+    assert (
+        "[View Report](https://reports.example.com/subscription)"
+        in (reports["markdown"])
+    )
+    ElementTree.fromstring(reports["junit"])
+
+
+@pytest.mark.parametrize(
+    "status, failures, skipped",
+    [("success", 0, 2), ("failed", 2, 0)],
+)
+def test_junit_marks_phases_without_report(status, failures, skipped):
+    report = ReportCreator(
+        _record(Status=status, failure_reason="boom" if failures else None)
+    ).render("junit")
+
+    suites = ElementTree.fromstring(report)
+    assert suites.get("tests") == "3"
+    assert suites.get("failures") == str(failures)
+    assert suites.get("skipped") == str(skipped)
+    assert suites.get("time") == "5400"
+    assert len(suites.findall("testsuite/testcase/failure")) == failures
+
+
+def test_test_results_are_rendered():
+    suite = {
+        "passed": 4,
+        "failed": 1,
+        "skipped": 0,
+        "errors": 0,
+        "total": 5,
+        "duration": 12.5,
+    }
+    record = _record(
+        TestResults={"suites": {"operations_portal": suite}, "totals": suite}
+    )
+    reports = ReportCreator(record).render_all(["json", "markdown", "junit"])
+
+    assert json.loads(reports["json"])["test_results"]["totals"]["failed"] == 1
+    assert "| operations_portal | 4 | 1 | 0 | 0 | 5 | 12.5 |" in reports["markdown"]
+    assert "| total | 4 | 1 | 0 | 0 | 5 | 12.5 |" in reports["markdown"]
+    suites = ElementTree.fromstring(reports["junit"])
+    operations_portal = suites.find("testsuite[@name='operations_portal']")
+    assert operations_portal.get("failures") == "1"
+    assert operations_portal.get("time") == "12.5"
+    assert (
+        operations_portal.find("properties/property[@name='passed']").get("value")
+        == "4"
+    )
+    assert operations_portal.find("testcase/failure").get("message") == (
+        "1 failed, 0 errors of 5 tests"
+    )
+
+
+def test_registered_renderer_is_available(monkeypatch):
+    monkeypatch.setattr(
+        report_renderers, "_RENDERERS", dict(report_renderers._RENDERERS)
+    )
+    register_renderer("text", "txt")(lambda view: f"{view.id}: {view.status}")
+
+    assert ReportCreator(_record()).render("text") == "execution-1: success"
@@ -0,0 +1,51 @@
+import gzip
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.lambdas.reporter.services.report_uploader import ReportUploader
+
+BUCKET = "test-reports"
+
+
+@pytest.fixture
+def s3_client(aws_region):
+    with mock_aws():
+        client = boto3.client("s3", region_name=aws_region)
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def test_main_uploads_compressed_report(s3_client, tmp_path, monkeypatch):
+    # nothing may be written to the temporary directory
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    html = "<html>" + "<p>result</p>" * 500 + "</html>"
+
+    url = ReportUploader(s3_client, BUCKET).main(html, "execution-1-report")
+
+    obj = s3_client.get_object(
+        Bucket=BUCKET, Key="final_reports/execution-1-report.html"
+    )
+    assert obj["ContentType"] == "text/html; charset=utf-8"
+    assert obj["ContentEncoding"] == "gzip"
+    assert obj["CacheControl"] == "private, no-cache"
+    assert gzip.decompress(obj["Body"].read()).decode() == html
+    assert "final_reports/execution-1-report.html" in url
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "content, compress",
+    [("<html>small</html>", True), ("<html>" + "x" * 5000 + "</html>", False)],
+)
+def test_upload_stores_plain_body(s3_client, content, compress):
+    key = ReportUploader(s3_client, BUCKET).upload(
+        content, "report", file_type="json", compress=compress
+    )
+
+    obj = s3_client.get_object(Bucket=BUCKET, Key=key)
+    assert key == "final_reports/report.json"
+    assert obj["ContentType"] == "application/json"
+    assert "ContentEncoding" not in obj
+    assert obj["Body"].read().decode() == content
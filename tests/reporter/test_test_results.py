@@ -0,0 +1,120 @@
+import io
+import json
+import zipfile
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.lambdas.reporter.services.test_results import (
+    collect_test_results,
+    summarize_report,
+)
+
+BUCKET = "test-reports"
+EXECUTION_ID = "execution-1"
+
+
+def _report(**summary) -> dict:
+    return {"duration": 12.3456, "summary": summary}
+
+
+def _archive(report: dict | None, padding: int = 0) -> bytes:
+    """Zipped reports directory as uploaded by the e2e runs"""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        if padding:
+            zip_file.writestr(
+                "reports/trace.zip", b"\0" * padding, compress_type=zipfile.ZIP_STORED
+            )
+        if report is not None:
+            zip_file.writestr("reports/report.json", json.dumps(report))
+        zip_file.writestr("reports/report.html", "<html></html>")
+    return archive.getvalue()
+
+
+@pytest.fixture
+def s3_client(aws_region):
+    with mock_aws():
+        client = boto3.client("s3", region_name=aws_region)
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def test_summarize_report_counts_expected_outcomes():
+    results = summarize_report(
+        _report(passed=3, xpassed=1, failed=2, skipped=1, xfailed=1, error=1, total=9)
+    )
+
+    assert results.as_dict() == {
+        "passed": 4,
+        "failed": 2,
+        "skipped": 2,
+        "errors": 1,
+        "total": 9,
+        "duration": 12.346,
+    }
+
+
+def test_collect_test_results(s3_client):
+    s3_client.put_object(
+        Bucket=BUCKET,
+        Key=f"operation_portal_subscription_test_reports/{EXECUTION_ID}.zip",
+        Body=_archive(_report(passed=5, failed=1, total=6), padding=4 * 1024 * 1024),
+    )
+    s3_client.put_object(
+        Bucket=BUCKET,
+        Key=f"data_portal_verification_test_reports/{EXECUTION_ID}.zip",
+        Body=_archive(_report(passed=2, skipped=1, total=3)),
+    )
+    # teardown did not run
+
+    results = collect_test_results(s3_client, BUCKET, EXECUTION_ID)
+
+    assert set(results["suites"]) == {"operations_portal", "data_portal_verification"}
+    assert results["suites"]["operations_portal"]["failed"] == 1
+    assert results["totals"] == {
+        "passed": 7,
+        "failed": 1,
+        "skipped": 1,
+        "errors": 0,
+        "total": 9,
+        "duration": 24.692,
+    }
+
+
+@pytest.mark.parametrize("body", [b"not a zip", _archive(None)])
+def test_collect_test_results_skips_unreadable_archives(s3_client, body):
+    s3_client.put_object(
+        Bucket=BUCKET,
+        Key=f"data_portal_teardown_test_reports/{EXECUTION_ID}.zip",
+        Body=body,
+    )
+
+    results = collect_test_results(s3_client, BUCKET, EXECUTION_ID)
+
+    assert results["suites"] == {}
+    assert results["totals"]["total"] == 0
+
+
+def test_only_report_is_downloaded(s3_client, monkeypatch):
+    body = _archive(_report(passed=1, total=1), padding=8 * 1024 * 1024)
+    s3_client.put_object(
+        Bucket=BUCKET,
+        Key=f"operation_portal_subscription_test_reports/{EXECUTION_ID}.zip",
+        Body=body,
+    )
+    fetched = []
+    get_object = s3_client.get_object
+
+    def counting_get_object(**kwargs):
+        response = get_object(**kwargs)
+        fetched.append(response["ContentLength"])
+        return response
+
+    monkeypatch.setattr(s3_client, "get_object", counting_get_object)
+
+    results = collect_test_results(s3_client, BUCKET, EXECUTION_ID)
+
+    assert results["totals"]["passed"] == 1
+    assert sum(fetched) < len(body) / 10
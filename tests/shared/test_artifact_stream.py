@@ -0,0 +1,196 @@
+import json
+
+import boto3
+import httpx
+import pytest
+from moto import mock_aws
+
+from src.shared.bitbucket.artifact_stream import (
+    FileSink,
+    IncrementalJsonDecoder,
+    S3MultipartSink,
+)
+from src.shared.bitbucket.bitbucket_client import (
+    BitbucketClient,
+    BitbucketClientConfig,
+)
+from src.shared.bitbucket.errors import (
+    ArtifactFileError,
+    ArtifactTooLargeError,
+    InvalidResponseError,
+)
+
+COMMITS = {f"service-{i}": f"{i:040x}" for i in range(200)}
+
+
+def _decode(document: bytes, chunk_size: int):
+    decoder = IncrementalJsonDecoder()
+    for start in range(0, len(document), chunk_size):
+        decoder.feed(document[start : start + chunk_size])
+    return decoder.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100_000])
+@pytest.mark.parametrize(
+    "document",
+    [
+        COMMITS,
+        {"nested": {"a": [1, 2.5, None]}, "flag": True, "name": "zażółć"},
+        [1, -12345, {"a": "b"}, [], "x"],
+        {},
+        [],
+        12345,
+        "text",
+    ],
+)
+def test_incremental_decoder_matches_json_loads(document, chunk_size):
+    raw = json.dumps(document, indent=1, ensure_ascii=False).encode()
+    assert _decode(raw, chunk_size) == document
+
+
+@pytest.mark.parametrize(
+    "chunks, document",
+    [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b'{"a": 2e', b"3}"], {"a": 2e3}),
+        ([b'{"a": 2e+', b'3, "b": 1}'], {"a": 2e3, "b": 1}),
+        ([b"[-", b"7, 1.25E-", b"2]"], [-7, 1.25e-2]),
+        ([b"[10", b"0]"], [100]),
+    ],
+)
+def test_incremental_decoder_number_split_across_chunks(chunks, document):
+    decoder = IncrementalJsonDecoder()
+    for chunk in chunks:
+        decoder.feed(chunk)
+    assert decoder.close() == document
+
+
+def test_incremental_decoder_buffers_single_member():
+    raw = json.dumps(COMMITS).encode()
+    decoder = IncrementalJsonDecoder()
+    peak = 0
+    for start in range(0, len(raw), 16):
+        decoder.feed(raw[start : start + 16])
+        peak = max(peak, decoder.buffered)
+
+    assert decoder.close() == COMMITS
+    assert peak < 100
+
+
+def test_incremental_decoder_decodes_large_member_once(monkeypatch):
+    document = {
+        "log": 'x\\"y' * 100_000,
+        "nested": {"items": [{"a": "]}"}] * 10_000},
+        "n": 12345,
+    }
+    raw = json.dumps(document).encode()
+    decoder = IncrementalJsonDecoder()
+    raw_decode = decoder._json_decoder.raw_decode
+    calls = []
+
+    def counting_raw_decode(text, *args):
+        calls.append(len(text))
+        return raw_decode(text, *args)
+
+    monkeypatch.setattr(decoder._json_decoder, "raw_decode", counting_raw_decode)
+    for start in range(0, len(raw), 1024):
+        decoder.feed(raw[start : start + 1024])
+
+    assert decoder.close() == document
+    # at most two calls per key and value, not one per received chunk
+    assert len(calls) <= 2 * 6
+
+
+@pytest.mark.parametrize(
+    "raw", [b'{"a": 1', b'{"a" 1}', b'{"a": 1]', b"[1, 2] 3", b"", b'{"a": 1,}']
+)
+def test_incremental_decoder_rejects_malformed(raw):
+    with pytest.raises(json.JSONDecodeError):
+        _decode(raw, 2)
+
+
+def _make_client(handler) -> BitbucketClient:
+    transport = httpx.MockTransport(handler)
+    return BitbucketClient(
+        client=httpx.AsyncClient(transport=transport),
+        config=BitbucketClientConfig("token"),
+    )
+
+
+def _artifact_handler(body: bytes, status_code: int = 200):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "downloads" in request.url.path:
+            return httpx.Response(302, headers={"location": "https://cdn.test/file"})
+        return httpx.Response(status_code, content=body)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_returns_json():
+    client = _make_client(_artifact_handler(json.dumps(COMMITS).encode()))
+
+    result = await client.stream_file_from_artifacts("repo", "commits.json")
+
+    assert result == COMMITS
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_enforces_max_bytes():
+    client = _make_client(_artifact_handler(json.dumps(COMMITS).encode()))
+
+    with pytest.raises(ArtifactTooLargeError):
+        await client.stream_file_from_artifacts("repo", "commits.json", max_bytes=100)
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_http_error():
+    client = _make_client(_artifact_handler(b"missing", status_code=404))
+
+    with pytest.raises(ArtifactFileError, match="HTTP 404"):
+        await client.stream_file_from_artifacts("repo", "commits.json")
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_invalid_json_removes_file(tmp_path):
+    client = _make_client(_artifact_handler(b'{"a": '))
+    path = tmp_path / "commits.json"
+
+    with pytest.raises(InvalidResponseError):
+        await client.stream_file_from_artifacts(
+            "repo", "commits.json", sink=FileSink(path)
+        )
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_to_file(tmp_path):
+    body = json.dumps(COMMITS).encode()
+    client = _make_client(_artifact_handler(body))
+    path = tmp_path / "commits.json"
+
+    result = await client.stream_file_from_artifacts(
+        "repo", "commits.json", sink=FileSink(path), parse_json=False
+    )
+
+    assert result is None
+    assert path.read_bytes() == body
+
+
+@pytest.mark.asyncio
+async def test_stream_file_from_artifacts_to_s3(aws_region):
+    body = json.dumps(COMMITS).encode()
+    client = _make_client(_artifact_handler(body))
+
+    with mock_aws():
+        s3 = boto3.client("s3", region_name=aws_region)
+        s3.create_bucket(Bucket="artifacts")
+        sink = S3MultipartSink(s3, "artifacts", "commits.json")
+
+        result = await client.stream_file_from_artifacts(
+            "repo", "commits.json", sink=sink
+        )
+
+        stored = s3.get_object(Bucket="artifacts", Key="commits.json")["Body"].read()
+    assert result == COMMITS
+    assert stored == body
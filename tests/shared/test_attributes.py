@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from pynamodb.attributes import NumberAttribute
+
+from src.shared.domain.models.attributes import LazyMap, LazyMapAttribute
+from src.shared.domain.models.execution_record import (
+    DeployedServices,
+    DeployedServicesAttribute,
+    ExecutionRecordModel,
+)
+
+RAW = {
+    "dataops-mb-vpc": {"S": "abc"},
+    "brand-new-service": {"S": "def"},
+    "removed-service": {"NULL": True},
+}
+
+
+def test_values_are_decoded_on_first_access():
+    attribute = DeployedServicesAttribute()
+    services = attribute.deserialize(RAW)
+
+    with patch.object(
+        attribute.value_attribute, "deserialize", wraps=str
+    ) as deserialize:
+        assert services["dataops-mb-vpc"] == "abc"
+        assert services["dataops-mb-vpc"] == "abc"
+        assert deserialize.call_count == 1
+
+    assert isinstance(services, DeployedServices)
+    assert not hasattr(services, "__dict__")
+
+
+def test_wire_names_and_arbitrary_keys_are_kept():
+    services = DeployedServicesAttribute().deserialize(RAW)
+
+    assert list(services) == list(RAW)
+    assert services.as_dict() == {
+        "dataops-mb-vpc": "abc",
+        "brand-new-service": "def",
+        "removed-service": None,
+    }
+
+
+def test_serialize_plain_mapping_and_loaded_map():
+    attribute = DeployedServicesAttribute()
+
+    assert attribute.serialize({"svc": "abc", "gone": None}) == {
+        "svc": {"S": "abc"},
+        "gone": {"NULL": True},
+    }
+    # loaded maps are written back without decoding
+    assert attribute.serialize(attribute.deserialize(RAW)) is RAW
+
+
+def test_value_schema():
+    attribute = LazyMapAttribute(value_attribute=NumberAttribute())
+    values = attribute.deserialize(attribute.serialize({"a": 1, "b": 2.5}))
+
+    assert isinstance(values, LazyMap)
+    assert values.as_dict() == {"a": 1, "b": 2.5}
+
+
+def test_model_round_trip_keeps_service_names():
+    record = ExecutionRecordModel(
+        "id",
+        Status="deployedServices",
+        DeployedServices={"osdu-new-service": "abc"},
+        CreatedAt="now",
+        UpdatedAt="now",
+    )
+
+    loaded = ExecutionRecordModel.from_raw_data(record.serialize())
+
+    assert loaded.to_dict()["DeployedServices"] == {"osdu-new-service": "abc"}
@@ -0,0 +1,50 @@
+import asyncio
+
+from src.shared.bitbucket.client_pool import BitbucketClientPool
+
+
+def test_client_is_reused_across_runs():
+    pool = BitbucketClientPool(http2=False)
+
+    async def _get_client():
+        return pool.get_client()
+
+    first = pool.run(_get_client())
+    second = pool.run(_get_client())
+
+    assert first is second
+    assert pool.stats.misses == 1
+    assert pool.stats.hits == 1
+    pool.close()
+
+
+def test_event_loop_persists_between_runs():
+    pool = BitbucketClientPool(http2=False)
+
+    async def _current_loop():
+        return asyncio.get_running_loop()
+
+    assert pool.run(_current_loop()) is pool.run(_current_loop())
+    pool.close()
+
+
+def test_closed_client_is_recreated():
+    pool = BitbucketClientPool(http2=False)
+    first = pool.get_client()
+    pool.run(first.aclose())
+
+    second = pool.get_client()
+
+    assert second is not first
+    assert pool.stats.misses == 2
+    pool.close()
+
+
+def test_close_resets_pool():
+    pool = BitbucketClientPool(http2=False)
+    client = pool.get_client()
+    pool.close()
+
+    assert client.is_closed
+    assert pool.get_client() is not client
+    pool.close()
@@ -0,0 +1,132 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import boto3
+import botocore.session
+from botocore.credentials import (
+    CredentialProvider,
+    CredentialResolver,
+    RefreshableCredentials,
+)
+
+from src.shared.boto.clients import ClientRegistry
+
+
+def _session(access_key: str, region: str = "us-east-1") -> boto3.Session:
+    return boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key="sk",
+        region_name=region,
+    )
+
+
+def test_client_is_reused_for_same_credentials():
+    registry = ClientRegistry()
+
+    session = _session("ak")
+    first = registry.get_client("s3", session=session)
+    second = registry.get_client("s3", session=session)
+
+    assert first is second
+    assert registry.stats.hits == 1
+    assert registry.stats.misses == 1
+
+
+def test_client_is_created_per_service_region_and_credentials():
+    registry = ClientRegistry()
+    session = _session("ak")
+
+    clients = {
+        id(registry.get_client("s3", session=session)),
+        id(registry.get_client("sns", session=session)),
+        id(registry.get_client("s3", session=session, region_name="eu-west-1")),
+        id(registry.get_client("s3", session=_session("other"))),
+    }
+
+    assert len(clients) == 4
+
+
+class _Provider(CredentialProvider):
+    METHOD = "test"
+
+    def __init__(self, credentials):
+        super().__init__()
+        self._credentials = credentials
+
+    def load(self):
+        return self._credentials
+
+
+def test_client_lookup_does_not_refresh_credentials():
+    refresh = MagicMock()
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata={
+            "access_key": "ak",
+            "secret_key": "sk",
+            "token": "token",
+            # inside the botocore advisory refresh window
+            "expiry_time": (
+                datetime.now(timezone.utc) + timedelta(minutes=12)
+            ).isoformat(),
+        },
+        refresh_using=refresh,
+        method="sts-assume-role",
+    )
+    botocore_session = botocore.session.Session()
+    botocore_session.register_component(
+        "credential_provider", CredentialResolver([_Provider(credentials)])
+    )
+    session = boto3.Session(botocore_session=botocore_session, region_name="us-east-1")
+    registry = ClientRegistry()
+
+    registry.get_client("s3", session=session)
+    registry.get_client("s3", session=session)
+
+    refresh.assert_not_called()
+    assert registry.stats.hits == 1
+
+
+def test_client_config_is_tuned():
+    registry = ClientRegistry()
+
+    client = registry.get_client("s3", session=_session("ak"))
+
+    assert client.meta.config.max_pool_connections == 20
+    assert client.meta.config.tcp_keepalive is True
+
+
+def test_default_session_is_reused(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    registry = ClientRegistry()
+
+    assert registry.get_session() is registry.get_session()
+    assert registry.get_client("sqs") is registry.get_client("sqs")
+
+
+def test_oldest_clients_are_evicted():
+    registry = ClientRegistry(max_clients=2)
+    for access_key in ("a", "b", "c"):
+        registry.get_client("s3", session=_session(access_key))
+
+    registry.get_client("s3", session=_session("a"))
+
+    assert registry.stats.misses == 4
+
+
+def test_concurrent_calls_create_one_client():
+    registry = ClientRegistry()
+    session = _session("ak")
+    clients = []
+
+    def _get():
+        clients.append(registry.get_client("dynamodb", session=session))
+
+    threads = [threading.Thread(target=_get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(c) for c in clients}) == 1
+    assert registry.stats.misses == 1
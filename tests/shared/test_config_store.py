@@ -0,0 +1,209 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.shared.boto.config_store import ConfigStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _parameter(name: str, version: int = 1, selector: str | None = None) -> dict:
+    param = {
+        "Name": name,
+        "Value": f"{name}-v{version}",
+        "ARN": f"arn:aws:ssm:us-east-1:000000000000:parameter{name}",
+        "Version": version,
+    }
+    if selector:
+        param["Selector"] = selector
+    return param
+
+
+@pytest.fixture
+def ssm():
+    client = MagicMock()
+    client.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [_parameter(name) for name in Names if "missing" not in name],
+        "InvalidParameters": [name for name in Names if "missing" in name],
+    }
+    with patch("src.shared.boto.config_store.get_client", return_value=client):
+        yield client
+
+
+def test_warm_reads_are_served_from_memory(ssm):
+    store = ConfigStore()
+    names = ["/svc/a", "/svc/b"]
+
+    first = store.get_parameters(names)
+    second = store.get_parameters(names)
+
+    assert first == second
+    assert second["/svc/a"].value == "/svc/a-v1"
+    ssm.get_parameters.assert_called_once_with(Names=names, WithDecryption=False)
+    assert store.stats.as_dict() == {
+        "hits": 2,
+        "misses": 2,
+        "api_calls": 1,
+        "version_changes": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_missing_names_are_fetched_in_batches_of_ten(ssm):
+    store = ConfigStore()
+    names = [f"/svc/p{i}" for i in range(23)]
+    store.get_parameters(names[:5])
+
+    result = store.get_parameters(names)
+
+    assert set(result) == set(names)
+    batches = [c.kwargs["Names"] for c in ssm.get_parameters.call_args_list[1:]]
+    assert [len(b) for b in batches] == [10, 8]
+    assert not set(names[:5]) & {n for b in batches for n in b}
+
+
+def test_unknown_parameters_are_not_cached(ssm):
+    store = ConfigStore()
+
+    assert store.get_parameters(["/svc/missing"]) == {}
+    store.get_parameters(["/svc/missing"])
+
+    assert ssm.get_parameters.call_count == 2
+
+
+def test_expired_entry_is_refetched_and_version_change_counted(ssm):
+    clock = FakeClock()
+    store = ConfigStore(ttl=60, clock=clock)
+    store.get_parameters(["/svc/a"])
+    ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [_parameter("/svc/a", version=2)]
+    }
+
+    clock.now = 30
+    assert store.get_parameters(["/svc/a"])["/svc/a"].version == "1"
+    clock.now = 61
+    assert store.get_parameters(["/svc/a"])["/svc/a"].version == "2"
+    assert store.stats.version_changes == 1
+
+
+def test_per_key_ttl(ssm):
+    clock = FakeClock()
+    store = ConfigStore(ttl=60, clock=clock)
+    store.get_parameters(["/svc/short"], ttl=5)
+    store.get_parameters(["/svc/long"])
+
+    clock.now = 10
+    store.get_parameters(["/svc/short", "/svc/long"])
+
+    assert ssm.get_parameters.call_args.kwargs["Names"] == ["/svc/short"]
+
+
+def test_older_version_does_not_replace_cached_one(ssm):
+    clock = FakeClock()
+    store = ConfigStore(ttl=60, clock=clock)
+    ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [_parameter("/svc/a", version=3)]
+    }
+    store.get_parameters(["/svc/a"])
+    ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [_parameter("/svc/a", version=2)]
+    }
+
+    clock.now = 61
+    assert store.get_parameters(["/svc/a"])["/svc/a"].version == "3"
+    clock.now = 90
+    store.get_parameters(["/svc/a"])
+    assert ssm.get_parameters.call_count == 2
+
+
+def test_pinned_versions_never_expire(ssm):
+    clock = FakeClock()
+    store = ConfigStore(ttl=60, clock=clock)
+    ssm.get_parameters.side_effect = lambda Names, WithDecryption: {
+        "Parameters": [_parameter("/svc/a", version=4, selector=":4")]
+    }
+    store.get_parameters(["/svc/a:4"])
+
+    clock.now = 10_000
+    assert store.get_parameters(["/svc/a:4"])["/svc/a:4"].version == "4"
+    assert ssm.get_parameters.call_count == 1
+
+
+def test_secret_is_cached_and_invalidated():
+    sm = MagicMock()
+    sm.get_secret_value.return_value = {
+        "SecretString": "p@ss",
+        "ARN": "arn:aws:secretsmanager:us-east-1:000000000000:secret:/svc/pw",
+        "VersionId": "v1",
+    }
+    store = ConfigStore()
+
+    with patch("src.shared.boto.config_store.get_client", return_value=sm):
+        assert store.get_secret("/svc/pw").value == "p@ss"
+        store.get_secret("/svc/pw")
+        store.invalidate("/svc/pw")
+        store.get_secret("/svc/pw")
+
+    assert sm.get_secret_value.call_count == 2
+    sm.get_secret_value.assert_called_with(SecretId="/svc/pw")
+
+
+def test_secret_without_string_raises():
+    sm = MagicMock()
+    sm.get_secret_value.return_value = {"SecretBinary": b"x", "ARN": "arn"}
+    store = ConfigStore()
+
+    with patch("src.shared.boto.config_store.get_client", return_value=sm):
+        with pytest.raises(ValueError):
+            store.get_secret("/svc/pw")
+
+
+def _paginator(pages):
+    paginator = MagicMock()
+    paginator.paginate.return_value = pages
+    return paginator
+
+
+def test_path_is_loaded_with_paginated_calls_and_cached():
+    ssm = MagicMock()
+    paginator = _paginator(
+        [
+            {"Parameters": [_parameter("/svc/a"), _parameter("/svc/nested/b")]},
+            {"Parameters": [_parameter("/svc/c")]},
+        ]
+    )
+    ssm.get_paginator.return_value = paginator
+    store = ConfigStore()
+
+    with patch("src.shared.boto.config_store.get_client", return_value=ssm):
+        first = store.get_parameters_by_path("/svc/")
+        second = store.get_parameters_by_path("/svc/")
+        single = store.get_parameters(["/svc/c"])
+
+    assert set(first) == {"/svc/a", "/svc/nested/b", "/svc/c"}
+    assert first == second
+    assert single["/svc/c"] is first["/svc/c"]
+    paginator.paginate.assert_called_once()
+    assert paginator.paginate.call_args.kwargs["Recursive"] is True
+    assert store.stats.api_calls == 2
+
+
+def test_invalidated_parameter_reloads_path():
+    ssm = MagicMock()
+    ssm.get_paginator.return_value = _paginator(
+        [{"Parameters": [_parameter("/svc/a")]}]
+    )
+    store = ConfigStore()
+
+    with patch("src.shared.boto.config_store.get_client", return_value=ssm):
+        store.get_parameters_by_path("/svc/")
+        store.invalidate("/svc/a")
+        store.get_parameters_by_path("/svc/")
+
+    assert ssm.get_paginator.return_value.paginate.call_count == 2
@@ -0,0 +1,38 @@
+import io
+from datetime import date
+
+import pytest
+
+from src.shared.domain.execution_archive import (
+    archive_key,
+    decode_records,
+    encode_records,
+    partition_prefix,
+)
+
+
+def test_partition_prefix():
+    assert (
+        partition_prefix(date(2024, 3, 7), "archive")
+        == "archive/year=2024/month=03/day=07/"
+    )
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    ["2024-03-07T00:00:00+00:00", "2024-03-07T23:59:59.999999+00:00"],
+)
+def test_archive_key_uses_created_at_day(created_at):
+    assert archive_key(created_at, "1-2") == (
+        "execution_records_archive/year=2024/month=03/day=07/1-2.jsonl.gz"
+    )
+
+
+def test_encode_decode_roundtrip():
+    records = [{"Id": "a", "DeployedServices": {"x": "1"}}, {"Id": "b", "Status": None}]
+
+    encoded = encode_records(records)
+
+    # stable output, retried uploads write identical objects
+    assert encoded == encode_records(records)
+    assert list(decode_records(io.BytesIO(encoded))) == records
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.shared.domain import execution_history
+from src.shared.domain.models.status import StatusList
+
+# the module imports the model as `shared.domain...`, patch that one
+ExecutionRecordModel = execution_history.ExecutionRecordModel
+
+BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _created_at(minutes: int) -> str:
+    return (BASE + timedelta(minutes=minutes)).isoformat()
+
+
+@pytest.fixture
+def history_table(dynamodb_resource, aws_region, monkeypatch):
+    dynamodb_resource.create_table(
+        TableName="execution-records",
+        KeySchema=[{"AttributeName": "Id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "Id", "AttributeType": "S"},
+            {"AttributeName": "Status", "AttributeType": "S"},
+            {"AttributeName": "CreatedAt", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "status-created-at",
+                "KeySchema": [
+                    {"AttributeName": "Status", "KeyType": "HASH"},
+                    {"AttributeName": "CreatedAt", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "table_name", "execution-records")
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "region", aws_region)
+    monkeypatch.setattr(ExecutionRecordModel, "_connection", None)
+    index = ExecutionRecordModel.status_created_at_index
+    # index name is read from the environment when the model is imported
+    monkeypatch.setattr(index.Meta, "index_name", "status-created-at")
+    monkeypatch.setitem(ExecutionRecordModel._indexes, "status-created-at", index)
+
+    # failures every 10 minutes, successes every 10 minutes shifted by 5
+    for i in range(6):
+        for status, offset in ((StatusList.failure, 0), (StatusList.success, 5)):
+            ExecutionRecordModel(
+                f"{status.value}-{i}",
+                Status=status.value,
+                WorkloadVersion=f"v{i}",
+                FailureReason="boom" if status == StatusList.failure else None,
+                CreatedAt=_created_at(i * 10 + offset),
+                UpdatedAt=_created_at(i * 10 + offset),
+            ).save()
+    yield
+    ExecutionRecordModel._connection = None
+
+
+def _ids(items):
+    return [item["Id"] for item in items]
+
+
+def test_query_by_status_pages_with_cursor(history_table):
+    first = execution_history.query_by_status(StatusList.failure, limit=4)
+    second = execution_history.query_by_status(
+        StatusList.failure, limit=4, cursor=first.cursor
+    )
+
+    assert _ids(first.items) == [f"failure-{i}" for i in (5, 4, 3, 2)]
+    assert _ids(second.items) == ["failure-1", "failure-0"]
+    assert second.cursor is None
+
+
+def test_query_by_status_range_and_order(history_table):
+    page = execution_history.query_by_status(
+        StatusList.success,
+        created_from=_created_at(10),
+        created_to=_created_at(40),
+        newest_first=False,
+    )
+
+    assert _ids(page.items) == ["success-1", "success-2", "success-3"]
+
+
+def test_query_by_status_projection(history_table):
+    page = execution_history.query_by_status(
+        StatusList.failure, limit=1, attributes=["FailureReason"]
+    )
+
+    assert page.items == [
+        {
+            "Id": "failure-5",
+            "Status": "failure",
+            "CreatedAt": _created_at(50),
+            "FailureReason": "boom",
+        }
+    ]
+
+
+def test_query_by_statuses_merges_by_time_across_pages(history_table):
+    statuses = [StatusList.failure, StatusList.success, StatusList.initialized]
+    pages = [execution_history.query_by_statuses(statuses, limit=5)]
+    while pages[-1].cursor:
+        pages.append(
+            execution_history.query_by_statuses(
+                statuses, limit=5, cursor=pages[-1].cursor
+            )
+        )
+
+    items = [item for page in pages for item in page.items]
+    created = [item["CreatedAt"] for item in items]
+    assert created == sorted(created, reverse=True)
+    assert len(items) == len(set(_ids(items))) == 12
+    assert len(pages[0].items) == 5
+
+
+def test_recent_failures(history_table):
+    assert _ids(execution_history.recent_failures(2)) == ["failure-5", "failure-4"]
+
+
+def test_invalid_cursor_and_limit():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        execution_history.decode_cursor("not-a-cursor")
+    with pytest.raises(ValueError, match="limit"):
+        execution_history.query_by_status(StatusList.failure, limit=0)
@@ -0,0 +1,59 @@
+import pytest
+
+from src.shared.domain import execution_record_repository
+from src.shared.domain.models.status import StatusList
+
+# the module imports the model as `shared.domain...`, patch that one
+ExecutionRecordModel = execution_record_repository.ExecutionRecordModel
+ExecutionRecordRepository = execution_record_repository.ExecutionRecordRepository
+
+
+@pytest.fixture
+def record_table(dynamodb_resource, aws_region, monkeypatch):
+    dynamodb_resource.create_table(
+        TableName="execution-records",
+        KeySchema=[{"AttributeName": "Id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "Id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "table_name", "execution-records")
+    monkeypatch.setattr(ExecutionRecordModel.Meta, "region", aws_region)
+    monkeypatch.setattr(ExecutionRecordModel, "_connection", None)
+    for record_id, status in (("running", "deployedServices"), ("done", "success")):
+        ExecutionRecordModel(
+            record_id,
+            Status=status,
+            DeployedServices={"dataops-mb-vpc": "abc"},
+            CreatedAt="2020-01-01T00:00:00+00:00",
+            UpdatedAt="2020-01-01T00:00:00+00:00",
+        ).save()
+    yield
+    ExecutionRecordModel._connection = None
+
+
+def test_get_returns_record_dict(record_table):
+    record = ExecutionRecordRepository.get("running")
+
+    assert record["Status"] == "deployedServices"
+    assert record["DeployedServices"] == {"dataops-mb-vpc": "abc"}
+
+
+def test_get_missing_record(record_table):
+    with pytest.raises(execution_record_repository.ExecutionRecordNotFound):
+        ExecutionRecordRepository.get("missing")
+
+
+def test_set_status_returns_new_image(record_table):
+    record = ExecutionRecordRepository.set_status("running", StatusList.finalReport)
+
+    assert record.Status == "finalReport"
+    assert record.DeployedServices == {"dataops-mb-vpc": "abc"}
+    assert record.UpdatedAt > "2020-01-01T00:00:00+00:00"
+    # retried writes of the same status succeed
+    ExecutionRecordRepository.set_status("running", StatusList.finalReport)
+    assert ExecutionRecordRepository.get("running")["Status"] == "finalReport"
+
+
+def test_set_status_after_terminal_status_conflicts(record_table):
+    with pytest.raises(execution_record_repository.ExecutionRecordConflict):
+        ExecutionRecordRepository.set_status("done", StatusList.finalReport)
@@ -0,0 +1,135 @@
+import boto3
+import httpx
+import pytest
+from moto import mock_aws
+
+from src.shared.http_cache import (
+    CacheEntry,
+    DynamoDBCacheBackend,
+    HttpCache,
+    InMemoryCacheBackend,
+    TieredCacheBackend,
+)
+from src.shared.rest_client import RestClient
+
+BODY = b'{"state": {"name": "IN_PROGRESS"}}'
+
+
+class _Server:
+    """Answers with 304 when the request carries the current ETag"""
+
+    def __init__(self, etag: str = '"v1"') -> None:
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        return httpx.Response(
+            200,
+            content=BODY,
+            headers={"etag": self.etag, "content-type": "application/json"},
+        )
+
+
+def _make_client(server: _Server, cache: HttpCache) -> RestClient:
+    return RestClient(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(server)), cache=cache
+    )
+
+
+@pytest.mark.asyncio
+async def test_unchanged_resource_is_served_from_cache():
+    server = _Server()
+    cache = HttpCache()
+    client = _make_client(server, cache)
+
+    first = await client._get("https://api.test/pipelines/1")
+    second = await client._get("https://api.test/pipelines/1")
+
+    assert first.json() == second.json() == {"state": {"name": "IN_PROGRESS"}}
+    assert second.status_code == 200
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_changed_resource_replaces_entry():
+    server = _Server()
+    cache = HttpCache()
+    client = _make_client(server, cache)
+
+    await client._get("https://api.test/pipelines/1")
+    server.etag = '"v2"'
+    await client._get("https://api.test/pipelines/1")
+    await client._get("https://api.test/pipelines/1")
+
+    assert cache.stats.as_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "stale": 1,
+        "stores": 2,
+        "hit_rate": 0.333,
+    }
+
+
+@pytest.mark.asyncio
+async def test_responses_without_validators_are_not_cached():
+    cache = HttpCache()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=BODY))
+    client = RestClient(client=httpx.AsyncClient(transport=transport), cache=cache)
+
+    await client._get("https://api.test/pipelines/1")
+    await client._get("https://api.test/pipelines/1")
+
+    assert cache.stats.misses == 2
+    assert cache.stats.stores == 0
+
+
+def _entry(stored_at: float) -> CacheEntry:
+    return CacheEntry(
+        status_code=200, content=BODY, headers={"etag": '"v1"'}, stored_at=stored_at
+    )
+
+
+def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2, clock=lambda: 0)
+    backend.set("a", _entry(0))
+    backend.set("b", _entry(0))
+    backend.get("a")
+    backend.set("c", _entry(0))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert len(backend) == 2
+
+
+def test_in_memory_backend_expires_entries():
+    now = [0.0]
+    backend = InMemoryCacheBackend(ttl=10, clock=lambda: now[0])
+    backend.set("a", _entry(0))
+
+    now[0] = 11
+    assert backend.get("a") is None
+
+
+def test_tiered_backend_reads_shared_entries(aws_region):
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+        table = dynamodb.create_table(
+            TableName="http-cache",
+            KeySchema=[{"AttributeName": "CacheKey", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "CacheKey", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        shared = DynamoDBCacheBackend(table, clock=lambda: 100)
+        TieredCacheBackend(InMemoryCacheBackend(), shared).set("a", _entry(100))
+
+        other_lambda = TieredCacheBackend(InMemoryCacheBackend(), shared)
+        entry = other_lambda.get("a")
+
+    assert entry.content == BODY
+    assert entry.etag == '"v1"'
@@ -0,0 +1,32 @@
+import builtins
+import sys
+
+import pytest
+
+from src.shared.lazy_import import lazy_import
+
+
+def test_lazy_import_defers_execution(tmp_path, monkeypatch):
+    (tmp_path / "heavy_module.py").write_text(
+        "import builtins\nbuiltins.heavy_module_loaded = True\nVALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr("builtins.heavy_module_loaded", False, raising=False)
+
+    module = lazy_import("heavy_module")
+
+    assert builtins.heavy_module_loaded is False
+    assert module.VALUE == 42
+    assert builtins.heavy_module_loaded is True
+    monkeypatch.delitem(sys.modules, "heavy_module")
+
+
+def test_lazy_import_returns_loaded_module():
+    import json
+
+    assert lazy_import("json") is json
+
+
+def test_lazy_import_missing_module():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("not_existing_module")
@@ -0,0 +1,38 @@
+import pytest
+
+from src.shared.boto.config_store import CachedValue
+from src.shared.boto.parameter_schema import ParameterField, ParameterSchema
+
+SCHEMA = ParameterSchema(
+    {
+        "url": ParameterField("portal/url"),
+        "code": ParameterField("code", required=False, default="dev"),
+    }
+)
+
+
+def _value(value: str) -> CachedValue:
+    return CachedValue(value=value, arn=f"arn:{value}", version="1", expires_at=0)
+
+
+def test_load_maps_values_and_arns():
+    params = {"/svc/portal/url": _value("https://ops"), "/svc/code": _value("prd")}
+
+    assert SCHEMA.load("svc", params) == {
+        "url": "https://ops",
+        "url_arn": "arn:https://ops",
+        "code": "prd",
+        "code_arn": "arn:prd",
+    }
+
+
+def test_optional_field_uses_default():
+    values = SCHEMA.load("/svc/", {"/svc/portal/url": _value("https://ops")})
+
+    assert values["code"] == "dev"
+    assert values["code_arn"] is None
+
+
+def test_missing_required_keys_are_listed():
+    with pytest.raises(ValueError, match=r"\['/svc/portal/url'\]"):
+        SCHEMA.load("/svc", {"/svc/code": _value("prd")})
@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.shared.bitbucket.poller import BackoffPolicy, Deadline, PipelinePoller
+from src.shared.bitbucket.type import BitbucketPipelineStatus
+
+
+def _status_response(name: str) -> dict:
+    return {"uuid": "{uuid}", "state": {"name": name}}
+
+
+def _make_poller(statuses: list[str], sleeps: list[float]) -> PipelinePoller:
+    client = MagicMock()
+    client.check_pipeline_status = AsyncMock(
+        side_effect=[_status_response(s) for s in statuses]
+    )
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    return PipelinePoller(
+        bitbucket_client=client,
+        repo_slug="repo",
+        backoff=BackoffPolicy(
+            initial_interval=1, multiplier=2, max_interval=3, jitter=0
+        ),
+        sleep=_sleep,
+    )
+
+
+def test_backoff_interval_is_capped():
+    policy = BackoffPolicy(initial_interval=1, multiplier=2, max_interval=5, jitter=0)
+    assert [policy.interval(a) for a in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_jitter_stays_in_range():
+    policy = BackoffPolicy(initial_interval=10, multiplier=1, jitter=0.5)
+    assert all(5 <= policy.interval(0) <= 15 for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_wait_stops_on_terminal_status():
+    sleeps: list[float] = []
+    poller = _make_poller(
+        ["PENDING", "IN_PROGRESS", "IN_PROGRESS", "COMPLETED"], sleeps
+    )
+
+    result = await poller.wait("{uuid}", deadline=Deadline(60))
+
+    assert result.status == BitbucketPipelineStatus.COMPLETED
+    assert result.polls == 4
+    assert sleeps == [1, 2, 3]
+    assert result.waited == 6
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_failed_status():
+    sleeps: list[float] = []
+    poller = _make_poller(["IN_PROGRESS", "FAILED"], sleeps)
+
+    result = await poller.wait("{uuid}", deadline=Deadline(60))
+
+    assert result.status == BitbucketPipelineStatus.FAILED
+    assert result.is_terminal
+
+
+@pytest.mark.asyncio
+async def test_wait_respects_deadline():
+    now = [0.0]
+    sleeps: list[float] = []
+    poller = _make_poller(["IN_PROGRESS"] * 10, sleeps)
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        now[0] += delay
+
+    poller._sleep = _sleep
+    result = await poller.wait("{uuid}", deadline=Deadline(4, clock=lambda: now[0]))
+
+    assert result.status == BitbucketPipelineStatus.IN_PROGRESS
+    assert result.waited == 4
+    assert sleeps == [1, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_wait_respects_max_polls():
+    sleeps: list[float] = []
+    poller = _make_poller(["IN_PROGRESS"] * 5, sleeps)
+
+    result = await poller.wait("{uuid}", max_polls=1)
+
+    assert result.polls == 1
+    assert sleeps == []
+
+
+def test_deadline_from_context():
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 60_000
+
+    assert 49 < Deadline.from_context(context, safety_margin=10).remaining() <= 50
+    assert Deadline.from_context(context, max_duration=5).remaining() <= 5
@@ -0,0 +1,202 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.shared.bitbucket.bitbucket_client import (
+    BitbucketClient,
+    BitbucketClientConfig,
+)
+from src.shared.bitbucket.errors import PipelineTriggerError
+from src.shared.bitbucket.poller import BackoffPolicy, Deadline
+from src.shared.bitbucket.rate_limiter import RequestScheduler, TokenBucket
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _scheduler(fake_time: _FakeTime, rate: float = 1.0, capacity: int = 2):
+    bucket = TokenBucket(
+        rate=rate, capacity=capacity, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+    return RequestScheduler(
+        bucket=bucket,
+        max_retries=2,
+        backoff=BackoffPolicy(initial_interval=1, multiplier=2, jitter=0),
+        sleep=fake_time.sleep,
+    )
+
+
+def _client(responses: list[httpx.Response], scheduler: RequestScheduler):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = BitbucketClient(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        config=BitbucketClientConfig("token"),
+        scheduler=scheduler,
+    )
+    return client, requests
+
+
+def _status(name: str = "COMPLETED") -> httpx.Response:
+    return httpx.Response(200, json={"state": {"name": name}})
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_requests_after_burst():
+    fake_time = _FakeTime()
+    bucket = TokenBucket(
+        rate=2, capacity=2, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits == [0, 0, 0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_queued():
+    fake_time = _FakeTime()
+    bucket = TokenBucket(
+        rate=1, capacity=1, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+
+    waits = await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    assert sorted(waits) == [0, 1, 1]
+    assert fake_time.now == 2
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_honours_retry_after():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time)
+    client, requests = _client(
+        [httpx.Response(429, headers={"Retry-After": "7"}), _status()], scheduler
+    )
+
+    response = await client.check_pipeline_status("repo", "{uuid}")
+
+    assert response["state"]["name"] == "COMPLETED"
+    assert len(requests) == 2
+    assert scheduler.stats.throttled == 1
+    assert scheduler.stats.retries == 1
+    assert scheduler.stats.queued_time == 7
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_with_backoff():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time, capacity=10)
+    client, requests = _client(
+        [httpx.Response(502), httpx.Response(503), _status()], scheduler
+    )
+
+    await client.check_pipeline_status("repo", "{uuid}")
+
+    assert fake_time.sleeps == [1, 2]
+    assert scheduler.stats.server_errors == 2
+    assert scheduler.stats.retry_wait_time == 3
+
+
+@pytest.mark.asyncio
+async def test_trigger_is_not_retried_on_server_error():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time)
+    client, requests = _client([httpx.Response(500), _status()], scheduler)
+
+    with pytest.raises(PipelineTriggerError):
+        await client.trigger_pipeline("repo", {})
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time, capacity=10)
+    client, requests = _client([httpx.Response(429) for _ in range(5)], scheduler)
+
+    response = await client._get("https://api.test/resource")
+
+    assert response.status_code == 429
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_are_limited_by_deadline():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time, capacity=10)
+    scheduler.set_deadline(Deadline(10, clock=fake_time.clock))
+    client, requests = _client(
+        [
+            httpx.Response(502),
+            httpx.Response(429, headers={"Retry-After": "30"}),
+            _status(),
+        ],
+        scheduler,
+    )
+
+    response = await client._get("https://api.test/resource")
+
+    # the backoff fits in the deadline, the Retry-After wait does not
+    assert response.status_code == 429
+    assert len(requests) == 2
+    assert fake_time.sleeps == [1]
+    assert fake_time.now == 1
+
+
+@pytest.mark.asyncio
+async def test_near_limit_header_slows_down_bucket():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time, rate=1.0)
+    client, _ = _client(
+        [
+            httpx.Response(200, headers={"X-RateLimit-NearLimit": "true"}),
+            httpx.Response(200),
+        ],
+        scheduler,
+    )
+
+    await client._get("https://api.test/resource")
+    assert scheduler._bucket.rate == 0.25
+    await client._get("https://api.test/resource")
+    assert scheduler._bucket.rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_throttled_stream_is_retried():
+    fake_time = _FakeTime()
+    scheduler = _scheduler(fake_time)
+    client, requests = _client(
+        [
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(502),
+            httpx.Response(
+                200, content=b'{"a": 1}', headers={"X-RateLimit-NearLimit": "true"}
+            ),
+        ],
+        scheduler,
+    )
+
+    data = await client.stream_file_from_artifacts("repo", "file.json")
+
+    assert data == {"a": 1}
+    assert len(requests) == 3
+    assert scheduler.stats.throttled == 1
+    assert scheduler.stats.server_errors == 1
+    assert scheduler.stats.queued_time == 5
+    assert scheduler._bucket.rate == 0.25
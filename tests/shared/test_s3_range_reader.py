@@ -0,0 +1,71 @@
+import io
+import zipfile
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from src.shared.boto.s3_range_reader import S3RangeReader
+
+BUCKET = "test-reports"
+KEY = "reports.zip"
+
+
+@pytest.fixture
+def s3_client(aws_region):
+    with mock_aws():
+        client = boto3.client("s3", region_name=aws_region)
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def test_reads_ranges(s3_client):
+    data = bytes(range(256)) * 64
+    s3_client.put_object(Bucket=BUCKET, Key=KEY, Body=data)
+
+    with S3RangeReader(s3_client, BUCKET, KEY, block_size=1024) as reader:
+        assert reader.size == len(data)
+        assert reader.read(10) == data[:10]
+        # served from the fetched block
+        assert reader.read(10) == data[10:20]
+        assert reader.stats.requests == 1
+
+        assert reader.seek(-100, io.SEEK_END) == len(data) - 100
+        assert reader.read() == data[-100:]
+        assert reader.read(10) == b""
+        assert reader.seek(5000) == 5000
+        assert reader.read(3) == data[5000:5003]
+        assert reader.stats.requests == 3
+        assert reader.stats.bytes_fetched == 1024 + 100 + 1024
+
+
+def test_rejects_negative_seek(s3_client):
+    s3_client.put_object(Bucket=BUCKET, Key=KEY, Body=b"data")
+
+    with S3RangeReader(s3_client, BUCKET, KEY) as reader:
+        with pytest.raises(ValueError, match="Negative seek position"):
+            reader.seek(-1)
+
+
+def test_opens_zip_member_without_downloading_archive(s3_client):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        # stored, large members in front of the one that is read
+        zip_file.writestr("trace.bin", b"\0" * 2 * 1024 * 1024)
+        zip_file.writestr("report.json", b'{"summary": {}}')
+    s3_client.put_object(Bucket=BUCKET, Key=KEY, Body=archive.getvalue())
+
+    with S3RangeReader(s3_client, BUCKET, KEY, block_size=4096) as reader:
+        with zipfile.ZipFile(reader) as zip_file:
+            assert zip_file.read("report.json") == b'{"summary": {}}'
+        assert reader.stats.bytes_fetched < 3 * 4096
+
+
+def test_fails_when_object_changes(s3_client):
+    s3_client.put_object(Bucket=BUCKET, Key=KEY, Body=b"first")
+
+    with S3RangeReader(s3_client, BUCKET, KEY) as reader:
+        s3_client.put_object(Bucket=BUCKET, Key=KEY, Body=b"second")
+        with pytest.raises(ClientError):
+            reader.read()
@@ -0,0 +1,86 @@
+import itertools
+import random
+
+import pytest
+
+from src.shared.domain.models.status import StatusList
+from src.shared.domain.status_transitions import (
+    ALLOWED_PREDECESSORS,
+    ALLOWED_TRANSITIONS,
+    INITIAL_STATUSES,
+    REQUIRED_FIELDS_BY_STATUS,
+    TERMINAL_STATUSES,
+    allowed_predecessors,
+    is_allowed_transition,
+)
+
+STATUS_PAIRS = list(itertools.product(StatusList, repeat=2))
+
+
+def _reachable(start: StatusList) -> set[StatusList]:
+    seen, stack = {start}, [start]
+    while stack:
+        for status in ALLOWED_TRANSITIONS[stack.pop()] - seen:
+            seen.add(status)
+            stack.append(status)
+    return seen
+
+
+def test_every_status_is_described():
+    assert set(ALLOWED_TRANSITIONS) == set(StatusList)
+    assert set(REQUIRED_FIELDS_BY_STATUS) == set(StatusList)
+
+
+@pytest.mark.parametrize("previous,status", STATUS_PAIRS)
+def test_predecessors_are_inverse_of_transitions(previous, status):
+    assert is_allowed_transition(previous, status) == (
+        previous in ALLOWED_PREDECESSORS[status]
+    )
+    assert is_allowed_transition(previous, status) == (
+        previous.value in allowed_predecessors(status)
+    )
+
+
+@pytest.mark.parametrize("previous,status", STATUS_PAIRS)
+def test_terminal_statuses_are_final(previous, status):
+    if previous in TERMINAL_STATUSES and status != previous:
+        assert not is_allowed_transition(previous, status)
+
+
+@pytest.mark.parametrize("status", list(StatusList))
+def test_retried_write_is_allowed(status):
+    assert is_allowed_transition(status, status)
+
+
+@pytest.mark.parametrize("status", list(StatusList))
+def test_every_status_is_reachable_and_can_terminate(status):
+    assert any(status in _reachable(initial) for initial in INITIAL_STATUSES)
+    assert _reachable(status) & TERMINAL_STATUSES
+
+
+@pytest.mark.parametrize("status", sorted(set(StatusList) - TERMINAL_STATUSES))
+def test_failure_can_follow_any_running_status(status):
+    assert is_allowed_transition(status, StatusList.failure)
+
+
+def test_success_requires_final_report():
+    assert ALLOWED_PREDECESSORS[StatusList.success] == {
+        StatusList.finalReport,
+        StatusList.success,
+    }
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_walks_end_in_terminal_status(seed):
+    rng = random.Random(seed)
+    status = rng.choice(sorted(INITIAL_STATUSES))
+    visited = [status]
+    while status not in TERMINAL_STATUSES:
+        # retried writes are skipped so that every walk makes progress
+        candidates = sorted(ALLOWED_TRANSITIONS[status] - {status})
+        status = rng.choice(candidates)
+        visited.append(status)
+        assert len(visited) <= len(StatusList)
+
+    # the walk never revisits a status, so the graph has no cycles
+    assert len(visited) == len(set(visited))
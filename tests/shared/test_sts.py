@@ -1,3 +1,4 @@
+import datetime
 from unittest.mock import MagicMock, patch
 
 import boto3
@@ -21,3 +22,83 @@ def test_assume_role_success():
         assert isinstance(session, boto3.Session)
         # Check that credentials are set
         assert session.get_credentials() is not None
+
+
+def _fake_sts(expires_in: list[datetime.timedelta]) -> MagicMock:
+    client = MagicMock()
+    client.assume_role.side_effect = [
+        {
+            "Credentials": {
+                "AccessKeyId": f"AKIA{i}",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.datetime.now(datetime.timezone.utc) + delta,
+            }
+        }
+        for i, delta in enumerate(expires_in)
+    ]
+    return client
+
+
+def test_session_provider_reuses_credentials():
+    client = _fake_sts([datetime.timedelta(hours=1)])
+    provider = sts.AssumedRoleSessionProvider(sts_client=client)
+
+    first = provider.get_session("arn:aws:iam::123456789012:role/test", "rotation")
+    second = provider.get_session("arn:aws:iam::123456789012:role/test", "rotation")
+
+    assert first is second
+    assert first.get_credentials().get_frozen_credentials().access_key == "AKIA0"
+    client.assume_role.assert_called_once_with(
+        RoleArn="arn:aws:iam::123456789012:role/test",
+        RoleSessionName="rotation",
+        DurationSeconds=3600,
+    )
+
+
+def test_session_provider_keys_by_role_and_session_name():
+    client = _fake_sts([datetime.timedelta(hours=1)] * 2)
+    provider = sts.AssumedRoleSessionProvider(sts_client=client)
+
+    provider.get_session("arn:aws:iam::123456789012:role/test", "a")
+    provider.get_session("arn:aws:iam::123456789012:role/test", "b")
+
+    assert client.assume_role.call_count == 2
+
+
+def test_session_provider_refreshes_before_expiry_in_background():
+    client = _fake_sts([datetime.timedelta(minutes=12), datetime.timedelta(hours=1)])
+    provider = sts.AssumedRoleSessionProvider(sts_client=client)
+    role_arn = "arn:aws:iam::123456789012:role/test"
+
+    provider.get_session(role_arn, "rotation")
+    session = provider.get_session(role_arn, "rotation")
+    provider._executor.shutdown(wait=True)
+
+    assert client.assume_role.call_count == 2
+    assert session.get_credentials().get_frozen_credentials().access_key == "AKIA1"
+
+
+def test_session_provider_refreshes_ahead_of_botocore_window():
+    # outside the botocore advisory window, inside the refresh margin
+    client = _fake_sts([datetime.timedelta(minutes=18), datetime.timedelta(hours=1)])
+    provider = sts.AssumedRoleSessionProvider(sts_client=client)
+    role_arn = "arn:aws:iam::123456789012:role/test"
+
+    provider.get_session(role_arn, "rotation")
+    session = provider.get_session(role_arn, "rotation")
+    provider._executor.shutdown(wait=True)
+
+    assert client.assume_role.call_count == 2
+    assert session.get_credentials().get_frozen_credentials().access_key == "AKIA1"
+
+
+def test_session_provider_session_uses_assumed_role_credentials():
+    client = _fake_sts([datetime.timedelta(hours=1)])
+    provider = sts.AssumedRoleSessionProvider(sts_client=client)
+
+    session = provider.get_session("arn:aws:iam::123456789012:role/test", "a")
+
+    credentials = session.get_credentials()
+    assert isinstance(credentials, sts.AssumedRoleCredentials)
+    assert credentials.method == "sts-assume-role"